@@ -19,6 +19,7 @@ if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
 from taskmaster.db.base import Base
+import taskmaster.db.models.job  # noqa: F401  # ensure models are imported
 import taskmaster.db.models.task  # noqa: F401  # ensure models are imported
 
 # add your model's MetaData object here for 'autogenerate' support
@@ -0,0 +1,152 @@
+"""maintain a transitive closure of task prerequisites
+
+Revision ID: 20261018_000002
+Revises: 20240905_000001
+Create Date: 2026-10-18 00:00:02
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision = "20261018_000002"
+down_revision = "20240905_000001"
+branch_labels = None
+depends_on = None
+
+
+# Both trigger functions combine every ancestor of the prerequisite (plus the
+# prerequisite itself) with every descendant of the dependent task (plus the
+# task itself); each pair gains or loses a.paths * d.paths paths of length
+# a.depth + d.depth + 1 through the changed edge.
+_AFFECTED_PATHS = """
+    WITH a AS (
+        SELECT ancestor_id, depth, paths FROM task_closure
+        WHERE descendant_id = {edge}.prerequisite_task_id
+        UNION ALL
+        SELECT {edge}.prerequisite_task_id, 0, 1
+    ), d AS (
+        SELECT descendant_id, depth, paths FROM task_closure
+        WHERE ancestor_id = {edge}.task_id
+        UNION ALL
+        SELECT {edge}.task_id, 0, 1
+    )
+    SELECT a.ancestor_id, d.descendant_id, a.depth + d.depth + 1 AS depth,
+           sum(a.paths * d.paths)::bigint AS paths
+    FROM a CROSS JOIN d
+    GROUP BY 1, 2, 3
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "task_closure",
+        sa.Column(
+            "ancestor_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("tasks.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False,
+        ),
+        sa.Column(
+            "descendant_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("tasks.id", ondelete="CASCADE"),
+            primary_key=True,
+            nullable=False,
+        ),
+        sa.Column("depth", sa.Integer(), primary_key=True, nullable=False),
+        sa.Column("paths", sa.BigInteger(), nullable=False),
+    )
+    # The primary key serves descendant lookups; this one serves ancestors
+    op.create_index(
+        "ix_task_closure_descendant",
+        "task_closure",
+        ["descendant_id", "depth", "ancestor_id"],
+        unique=False,
+    )
+
+    op.execute(
+        f"""
+        CREATE FUNCTION task_closure_add_edge() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO task_closure (ancestor_id, descendant_id, depth, paths)
+            {_AFFECTED_PATHS.format(edge="NEW")}
+            ON CONFLICT (ancestor_id, descendant_id, depth)
+            DO UPDATE SET paths = task_closure.paths + EXCLUDED.paths;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        f"""
+        CREATE FUNCTION task_closure_remove_edge() RETURNS trigger AS $$
+        BEGIN
+            -- The affected pairs are unchanged by either statement: in a DAG
+            -- the prerequisite is never a descendant of the dependent task.
+            DELETE FROM task_closure c
+            USING ({_AFFECTED_PATHS.format(edge="OLD")}) r
+            WHERE c.ancestor_id = r.ancestor_id
+              AND c.descendant_id = r.descendant_id
+              AND c.depth = r.depth
+              AND c.paths <= r.paths;
+            UPDATE task_closure c SET paths = c.paths - r.paths
+            FROM ({_AFFECTED_PATHS.format(edge="OLD")}) r
+            WHERE c.ancestor_id = r.ancestor_id
+              AND c.descendant_id = r.descendant_id
+              AND c.depth = r.depth;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER task_prerequisites_closure_insert
+        AFTER INSERT ON task_prerequisites
+        FOR EACH ROW EXECUTE FUNCTION task_closure_add_edge();
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER task_prerequisites_closure_delete
+        AFTER DELETE ON task_prerequisites
+        FOR EACH ROW EXECUTE FUNCTION task_closure_remove_edge();
+        """
+    )
+
+    # Backfill by replaying the existing edges through the insert trigger
+    op.execute(
+        "CREATE TEMPORARY TABLE existing_prerequisites ON COMMIT DROP AS "
+        "SELECT task_id, prerequisite_task_id FROM task_prerequisites"
+    )
+    op.execute(
+        "ALTER TABLE task_prerequisites DISABLE TRIGGER task_prerequisites_closure_delete"
+    )
+    op.execute("DELETE FROM task_prerequisites")
+    op.execute(
+        "ALTER TABLE task_prerequisites ENABLE TRIGGER task_prerequisites_closure_delete"
+    )
+    op.execute(
+        "INSERT INTO task_prerequisites (task_id, prerequisite_task_id) "
+        "SELECT task_id, prerequisite_task_id FROM existing_prerequisites"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP TRIGGER IF EXISTS task_prerequisites_closure_delete ON task_prerequisites"
+    )
+    op.execute(
+        "DROP TRIGGER IF EXISTS task_prerequisites_closure_insert ON task_prerequisites"
+    )
+    op.execute("DROP FUNCTION IF EXISTS task_closure_remove_edge()")
+    op.execute("DROP FUNCTION IF EXISTS task_closure_add_edge()")
+    op.drop_index("ix_task_closure_descendant", table_name="task_closure")
+    op.drop_table("task_closure")
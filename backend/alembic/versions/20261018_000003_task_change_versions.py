@@ -0,0 +1,60 @@
+"""track a change version per task write and keep tombstones for deletes
+
+Revision ID: 20261018_000003
+Revises: 20261018_000002
+Create Date: 2026-10-18 00:00:03
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision = "20261018_000003"
+down_revision = "20261018_000002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE SEQUENCE task_change_version_seq")
+    next_version = sa.text("nextval('task_change_version_seq')")
+
+    # Existing rows each get their own version from the column default
+    op.add_column(
+        "tasks",
+        sa.Column(
+            "version", sa.BigInteger(), server_default=next_version, nullable=False
+        ),
+    )
+    op.create_index("ix_tasks_version", "tasks", ["version"], unique=False)
+
+    op.create_table(
+        "task_tombstones",
+        sa.Column("id", UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column("title", sa.Text(), nullable=False),
+        sa.Column(
+            "version", sa.BigInteger(), server_default=next_version, nullable=False
+        ),
+        sa.Column(
+            "deleted_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_task_tombstones_version", "task_tombstones", ["version"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_tombstones_version", table_name="task_tombstones")
+    op.drop_table("task_tombstones")
+    op.drop_index("ix_tasks_version", table_name="tasks")
+    op.drop_column("tasks", "version")
+    op.execute("DROP SEQUENCE IF EXISTS task_change_version_seq")
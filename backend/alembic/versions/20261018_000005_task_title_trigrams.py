@@ -0,0 +1,79 @@
+"""normalized task titles with a trigram index for near-duplicate lookups
+
+Revision ID: 20261018_000005
+Revises: 20261018_000004
+Create Date: 2026-10-18 00:00:05
+
+"""
+
+from __future__ import annotations
+
+import logging
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261018_000005"
+down_revision = "20261018_000004"
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+def upgrade() -> None:
+    # Lowercase, drop filler words and collapse punctuation, so "Ship the Q3
+    # report!" and "ship Q3 report" normalize to the same text. Queries call
+    # the same function on their input.
+    op.execute(
+        r"""
+        CREATE FUNCTION task_title_normalize(title text) RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE RETURN
+            btrim(regexp_replace(
+                regexp_replace(
+                    lower(title),
+                    '\m(a|an|the|of|for|to|and|on|in|with)\M', ' ', 'g'
+                ),
+                '[^[:alnum:]]+', ' ', 'g'
+            ));
+        """
+    )
+    op.add_column(
+        "tasks",
+        sa.Column(
+            "title_normalized",
+            sa.Text(),
+            sa.Computed("task_title_normalize(title)", persisted=True),
+            nullable=False,
+        ),
+    )
+
+    # Being listed in pg_available_extensions does not mean this role may
+    # create it, so try, in a savepoint to keep the migration going
+    bind = op.get_bind()
+    try:
+        with bind.begin_nested():
+            bind.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    except sa.exc.DBAPIError as exc:
+        # Similarity lookups fall back to scanning normalized titles
+        logger.warning(
+            "Cannot create pg_trgm (%s); skipping ix_tasks_title_trgm",
+            str(exc.orig).splitlines()[0],
+        )
+        return
+    op.create_index(
+        "ix_tasks_title_trgm",
+        "tasks",
+        ["title_normalized"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"title_normalized": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_tasks_title_trgm")
+    op.drop_column("tasks", "title_normalized")
+    op.execute("DROP FUNCTION IF EXISTS task_title_normalize(text)")
@@ -0,0 +1,90 @@
+"""durable job queue for generation and transcription
+
+Revision ID: 20261018_000006
+Revises: 20261018_000005
+Create Date: 2026-10-18 00:00:06
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import ENUM, JSONB, UUID
+
+
+# revision identifiers, used by Alembic.
+revision = "20261018_000006"
+down_revision = "20261018_000005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE TYPE job_kind AS ENUM ('GENERATE_TASKS','TRANSCRIPTION')")
+    op.execute(
+        "CREATE TYPE job_status AS ENUM ('QUEUED','RUNNING','SUCCEEDED','FAILED')"
+    )
+
+    op.create_table(
+        "jobs",
+        sa.Column("id", UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column("kind", ENUM(name="job_kind", create_type=False), nullable=False),
+        sa.Column(
+            "status",
+            ENUM(name="job_status", create_type=False),
+            server_default="QUEUED",
+            nullable=False,
+        ),
+        sa.Column(
+            "payload",
+            JSONB(),
+            server_default=sa.text("'{}'::jsonb"),
+            nullable=False,
+        ),
+        sa.Column("input", sa.LargeBinary(), nullable=True),
+        sa.Column("result", JSONB(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("progress", sa.Text(), nullable=True),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("max_attempts", sa.Integer(), nullable=False),
+        sa.Column(
+            "run_after",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("locked_by", sa.Text(), nullable=True),
+        sa.Column("traceparent", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.CheckConstraint("max_attempts >= 1", name="ck_jobs_max_attempts_positive"),
+    )
+    # Workers claim the earliest due unfinished job; finished jobs stay out of
+    # the index so it stays small however long the history grows
+    op.create_index(
+        "ix_jobs_claimable",
+        "jobs",
+        ["run_after"],
+        unique=False,
+        postgresql_where=sa.text("status IN ('QUEUED', 'RUNNING')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_claimable", table_name="jobs")
+    op.drop_table("jobs")
+    op.execute("DROP TYPE IF EXISTS job_status")
+    op.execute("DROP TYPE IF EXISTS job_kind")
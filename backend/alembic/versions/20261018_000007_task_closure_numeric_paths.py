@@ -0,0 +1,103 @@
+"""count task closure paths with numeric instead of bigint
+
+Revision ID: 20261018_000007
+Revises: 20261018_000006
+Create Date: 2026-10-18 00:00:07
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261018_000007"
+down_revision = "20261018_000006"
+branch_labels = None
+depends_on = None
+
+
+# Path counts multiply along chains of diamonds (w parallel tasks between two
+# hubs, k times over, is w**k paths), so bigint overflows on deep, wide graphs
+# and every later prerequisite insert fails. Saturating the count would make
+# edge removal unable to tell when the last path is gone; numeric keeps the
+# counts exact at any size.
+_AFFECTED_PATHS = """
+    WITH a AS (
+        SELECT ancestor_id, depth, paths FROM task_closure
+        WHERE descendant_id = {edge}.prerequisite_task_id
+        UNION ALL
+        SELECT {edge}.prerequisite_task_id, 0, 1
+    ), d AS (
+        SELECT descendant_id, depth, paths FROM task_closure
+        WHERE ancestor_id = {edge}.task_id
+        UNION ALL
+        SELECT {edge}.task_id, 0, 1
+    )
+    SELECT a.ancestor_id, d.descendant_id, a.depth + d.depth + 1 AS depth,
+           sum(a.paths * d.paths){cast} AS paths
+    FROM a CROSS JOIN d
+    GROUP BY 1, 2, 3
+"""
+
+
+def _replace_functions(cast: str) -> None:
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION task_closure_add_edge() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO task_closure (ancestor_id, descendant_id, depth, paths)
+            {_AFFECTED_PATHS.format(edge="NEW", cast=cast)}
+            ON CONFLICT (ancestor_id, descendant_id, depth)
+            DO UPDATE SET paths = task_closure.paths + EXCLUDED.paths;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION task_closure_remove_edge() RETURNS trigger AS $$
+        BEGIN
+            -- The affected pairs are unchanged by either statement: in a DAG
+            -- the prerequisite is never a descendant of the dependent task.
+            DELETE FROM task_closure c
+            USING ({_AFFECTED_PATHS.format(edge="OLD", cast=cast)}) r
+            WHERE c.ancestor_id = r.ancestor_id
+              AND c.descendant_id = r.descendant_id
+              AND c.depth = r.depth
+              AND c.paths <= r.paths;
+            UPDATE task_closure c SET paths = c.paths - r.paths
+            FROM ({_AFFECTED_PATHS.format(edge="OLD", cast=cast)}) r
+            WHERE c.ancestor_id = r.ancestor_id
+              AND c.descendant_id = r.descendant_id
+              AND c.depth = r.depth;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql;
+        """
+    )
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "task_closure",
+        "paths",
+        type_=sa.Numeric(),
+        existing_type=sa.BigInteger(),
+        existing_nullable=False,
+    )
+    _replace_functions(cast="")
+
+
+def downgrade() -> None:
+    _replace_functions(cast="::bigint")
+    op.alter_column(
+        "task_closure",
+        "paths",
+        type_=sa.BigInteger(),
+        existing_type=sa.Numeric(),
+        existing_nullable=False,
+    )
@@ -0,0 +1,46 @@
+"""prune old task tombstones and remember the newest pruned version
+
+Revision ID: 20261018_000008
+Revises: 20261018_000007
+Create Date: 2026-10-18 00:00:08
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261018_000008"
+down_revision = "20261018_000007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_task_tombstones_deleted_at",
+        "task_tombstones",
+        ["deleted_at"],
+        unique=False,
+    )
+    # One row: change feeds from before pruned_version may have lost deletes
+    op.create_table(
+        "task_change_feed",
+        sa.Column("id", sa.SmallInteger(), primary_key=True, nullable=False),
+        sa.Column(
+            "pruned_version",
+            sa.BigInteger(),
+            server_default=sa.text("0"),
+            nullable=False,
+        ),
+        sa.CheckConstraint("id = 1", name="ck_task_change_feed_single_row"),
+    )
+    op.execute("INSERT INTO task_change_feed (id) VALUES (1)")
+
+
+def downgrade() -> None:
+    op.drop_table("task_change_feed")
+    op.drop_index("ix_task_tombstones_deleted_at", table_name="task_tombstones")
@@ -0,0 +1,92 @@
+"""serialize prerequisite graph writes in the closure triggers
+
+Revision ID: 20261018_000009
+Revises: 20261018_000008
+Create Date: 2026-10-18 00:00:09
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "20261018_000009"
+down_revision = "20261018_000008"
+branch_labels = None
+depends_on = None
+
+
+# Each trigger reads the closure rows of both edge ends before writing its own.
+# Two transactions adding X -> Y and Y -> Z at the same time would each miss
+# the other's uncommitted rows and neither would add X -> Z, so every edge
+# change first takes this transaction-level lock on the whole graph. Under
+# READ COMMITTED the statements after it see everything committed before.
+_GRAPH_LOCK_KEY = 0x7461736C
+
+_AFFECTED_PATHS = """
+    WITH a AS (
+        SELECT ancestor_id, depth, paths FROM task_closure
+        WHERE descendant_id = {edge}.prerequisite_task_id
+        UNION ALL
+        SELECT {edge}.prerequisite_task_id, 0, 1
+    ), d AS (
+        SELECT descendant_id, depth, paths FROM task_closure
+        WHERE ancestor_id = {edge}.task_id
+        UNION ALL
+        SELECT {edge}.task_id, 0, 1
+    )
+    SELECT a.ancestor_id, d.descendant_id, a.depth + d.depth + 1 AS depth,
+           sum(a.paths * d.paths) AS paths
+    FROM a CROSS JOIN d
+    GROUP BY 1, 2, 3
+"""
+
+
+def _replace_functions(lock: str) -> None:
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION task_closure_add_edge() RETURNS trigger AS $$
+        BEGIN
+            {lock}
+            INSERT INTO task_closure (ancestor_id, descendant_id, depth, paths)
+            {_AFFECTED_PATHS.format(edge="NEW")}
+            ON CONFLICT (ancestor_id, descendant_id, depth)
+            DO UPDATE SET paths = task_closure.paths + EXCLUDED.paths;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION task_closure_remove_edge() RETURNS trigger AS $$
+        BEGIN
+            {lock}
+            -- The affected pairs are unchanged by either statement: in a DAG
+            -- the prerequisite is never a descendant of the dependent task.
+            DELETE FROM task_closure c
+            USING ({_AFFECTED_PATHS.format(edge="OLD")}) r
+            WHERE c.ancestor_id = r.ancestor_id
+              AND c.descendant_id = r.descendant_id
+              AND c.depth = r.depth
+              AND c.paths <= r.paths;
+            UPDATE task_closure c SET paths = c.paths - r.paths
+            FROM ({_AFFECTED_PATHS.format(edge="OLD")}) r
+            WHERE c.ancestor_id = r.ancestor_id
+              AND c.descendant_id = r.descendant_id
+              AND c.depth = r.depth;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql;
+        """
+    )
+
+
+def upgrade() -> None:
+    _replace_functions(lock=f"PERFORM pg_advisory_xact_lock({_GRAPH_LOCK_KEY});")
+
+
+def downgrade() -> None:
+    _replace_functions(lock="")
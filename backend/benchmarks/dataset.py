@@ -0,0 +1,518 @@
+"""Generate and bulk-load a synthetic task dataset with a prerequisite DAG.
+
+Tasks are spread over ``--depth`` layers in generation order. Every task
+outside the first layer gets prerequisites from earlier layers with
+probability ``--dependent-fraction``:
+
+* ``--mean-fan-in`` / ``--max-fan-in`` set how many prerequisites it gets
+* ``--locality`` is the chance that a prerequisite comes from the layer just
+  before, rather than from any earlier one. At 1.0 chains run through every
+  layer (deep graphs). Lower values give shorter, wider graphs.
+* ``--hub-skew`` above 0 concentrates prerequisites on a few tasks per layer
+  (large fan-out). At 0 they are picked uniformly.
+
+Because of the layers the graph is acyclic by construction. Status,
+priority, deadline and duration follow the configurable distributions in
+:class:`DatasetSpec`. The same spec and seed always produce the same rows,
+including ids. Dates are relative to a fixed anchor, not to today.
+
+Rows are written with ``COPY``. By default the task_closure triggers are
+disabled while links load, and the closure is then rebuilt level by level
+with one ``INSERT ... SELECT`` per depth (``--closure rebuild``).
+``--closure trigger`` keeps the per-row triggers instead. Either way the
+dataset is loaded in one transaction, next to any existing tasks.
+``--truncate`` empties the task tables first.
+
+    cd backend
+    uv run python -m benchmarks.dataset --tasks 100000 --depth 12 --seed 7
+    uv run python -m benchmarks.dataset --tasks 1000000 --truncate \\
+        --locality 0.3 --hub-skew 2
+    # records for POST /api/import-tasks instead of loading them
+    uv run python -m benchmarks.dataset --tasks 5000 --jsonl tasks.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+import random
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Mapping, NamedTuple, Optional, Tuple
+
+from sqlalchemy import Connection, create_engine, text
+
+from taskmaster.config import get_settings
+from taskmaster.db.models.task import TaskStatusEnum
+
+ANCHOR = dt.datetime(2026, 1, 1, tzinfo=dt.timezone.utc)
+
+_VERBS = (
+    "Review",
+    "Draft",
+    "Fix",
+    "Plan",
+    "Update",
+    "Migrate",
+    "Test",
+    "Document",
+    "Refactor",
+    "Schedule",
+    "Prepare",
+    "Deploy",
+    "Research",
+    "Design",
+    "Audit",
+    "Call",
+)
+_NOUNS = (
+    "invoice",
+    "release notes",
+    "database backup",
+    "onboarding guide",
+    "quarterly report",
+    "login flow",
+    "search index",
+    "budget",
+    "API client",
+    "dashboard",
+    "vendor contract",
+    "design review",
+    "test plan",
+    "roadmap",
+    "support ticket",
+    "newsletter",
+    "payment webhook",
+    "team offsite",
+    "security patch",
+    "data export",
+)
+_WORDS = (
+    "customer",
+    "deadline",
+    "meeting",
+    "feedback",
+    "follow",
+    "up",
+    "with",
+    "the",
+    "team",
+    "before",
+    "after",
+    "launch",
+    "metrics",
+    "draft",
+    "final",
+    "version",
+    "check",
+    "numbers",
+    "legal",
+    "approval",
+    "staging",
+    "production",
+    "rollback",
+    "notes",
+    "owner",
+    "blocked",
+    "on",
+    "pending",
+    "review",
+    "priority",
+    "urgent",
+    "weekly",
+    "sync",
+    "estimate",
+    "scope",
+    "risk",
+    "update",
+    "share",
+    "summary",
+    "stakeholders",
+)
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    tasks: int = 10_000
+    seed: int = 0
+    # Titles are "<prefix>-<index> ..." and unique within a dataset
+    prefix: str = "synthetic"
+    status_weights: Mapping[str, float] = field(
+        default_factory=lambda: {
+            "TODO": 0.45,
+            "IN_PROGRESS": 0.2,
+            "COMPLETED": 0.3,
+            "CANCELLED": 0.05,
+        }
+    )
+    # Weight of each priority value (index = priority)
+    priority_weights: Tuple[float, ...] = (8, 12, 16, 16, 14, 12, 9, 6, 4, 3)
+    deadline_fraction: float = 0.4
+    # Deadlines fall uniformly in [ANCHOR + min, ANCHOR + max] days
+    deadline_days: Tuple[int, int] = (-30, 180)
+    # Durations are log-normal around the median, clipped to max
+    median_duration_minutes: float = 60.0
+    duration_sigma: float = 1.0
+    max_duration_minutes: int = 7 * 24 * 60
+    depth: int = 8
+    dependent_fraction: float = 0.7
+    mean_fan_in: float = 2.0
+    max_fan_in: int = 8
+    locality: float = 0.7
+    hub_skew: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.tasks < 0:
+            raise ValueError("tasks must be non-negative")
+        if self.depth < 1:
+            raise ValueError("depth must be at least 1")
+        if self.mean_fan_in < 1 or self.max_fan_in < 1:
+            raise ValueError("fan-in must be at least 1")
+        unknown = set(self.status_weights) - {s.value for s in TaskStatusEnum}
+        if unknown:
+            raise ValueError(f"Unknown statuses: {sorted(unknown)}")
+
+
+class SyntheticTask(NamedTuple):
+    id: uuid.UUID
+    title: str
+    description: str
+    status: str
+    priority: int
+    duration_seconds: int
+    deadline: Optional[dt.datetime]
+    prerequisites: Tuple[uuid.UUID, ...]
+
+
+def _uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def _layer_bounds(spec: DatasetSpec) -> List[Tuple[int, int]]:
+    """``[start, end)`` task indexes of each layer."""
+    n, depth = spec.tasks, min(spec.depth, max(spec.tasks, 1))
+    return [(n * k // depth, n * (k + 1) // depth) for k in range(depth)]
+
+
+def generate(spec: DatasetSpec) -> Iterator[SyntheticTask]:
+    """Yield the dataset's tasks, every prerequisite before its dependents."""
+    # The prefix is part of the seed, so datasets can coexist
+    rng = random.Random(f"{spec.prefix}:{spec.seed}")
+    statuses = list(spec.status_weights)
+    status_weights = [spec.status_weights[s] for s in statuses]
+    priorities = range(len(spec.priority_weights))
+    mu = max(spec.median_duration_minutes, 1.0)
+    lo_days, hi_days = spec.deadline_days
+
+    ids: List[uuid.UUID] = []
+    layers = _layer_bounds(spec)
+    for layer, (start, end) in enumerate(layers):
+        for index in range(start, end):
+            task_id = _uuid(rng)
+            ids.append(task_id)
+
+            prerequisites: Dict[uuid.UUID, None] = {}
+            if layer > 0 and rng.random() < spec.dependent_fraction:
+                fan_in = min(
+                    spec.max_fan_in,
+                    max(1, round(rng.expovariate(1 / spec.mean_fan_in))),
+                )
+                for _ in range(fan_in):
+                    if rng.random() < spec.locality:
+                        lo, hi = layers[layer - 1]
+                    else:
+                        lo, hi = layers[rng.randrange(layer)]
+                    # u ** (1 + skew) piles picks onto the start of the layer
+                    offset = int((hi - lo) * rng.random() ** (1 + spec.hub_skew))
+                    prerequisites[ids[lo + offset]] = None
+
+            minutes = min(
+                spec.max_duration_minutes,
+                max(5, round(rng.lognormvariate(0, spec.duration_sigma) * mu / 5) * 5),
+            )
+            deadline = None
+            if rng.random() < spec.deadline_fraction:
+                deadline = ANCHOR + dt.timedelta(
+                    minutes=round(rng.uniform(lo_days, hi_days) * 24 * 60)
+                )
+            words = " ".join(rng.choices(_WORDS, k=rng.randint(6, 24)))
+            yield SyntheticTask(
+                id=task_id,
+                title=(
+                    f"{spec.prefix}-{index:07d} "
+                    f"{rng.choice(_VERBS)} {rng.choice(_NOUNS)}"
+                ),
+                description=words.capitalize() + ".",
+                status=rng.choices(statuses, status_weights)[0],
+                priority=rng.choices(priorities, spec.priority_weights)[0],
+                duration_seconds=minutes * 60,
+                deadline=deadline,
+                prerequisites=tuple(prerequisites),
+            )
+
+
+@dataclass
+class LoadStats:
+    tasks: int = 0
+    links: int = 0
+    closure_rows: int = 0
+    timings: Dict[str, float] = field(default_factory=dict)
+
+
+_CLOSURE_TRIGGER = "task_prerequisites_closure_insert"
+
+
+def _rebuild_closure(connection: Connection) -> int:
+    """Add the task_closure rows for the links in ``synthetic_links``.
+
+    New tasks only depend on new tasks, so every closure row through a new
+    link is a new row. Level ``d + 1`` is level ``d`` extended by one link.
+    The levels are built in an unindexed temporary table and inserted in one
+    statement, so no level rescans task_closure.
+    """
+    # Each level is one large join and aggregate; keep them in memory
+    connection.execute(text("SET LOCAL work_mem = '256MB'"))
+    connection.execute(
+        text(
+            "CREATE TEMPORARY TABLE synthetic_closure ON COMMIT DROP AS "
+            "SELECT prerequisite_task_id AS ancestor_id, task_id AS descendant_id,"
+            " 1 AS depth, 1::bigint AS paths FROM synthetic_links"
+        )
+    )
+    depth, inserted = 1, 1
+    while inserted:
+        inserted = connection.execute(
+            text(
+                "INSERT INTO synthetic_closure "
+                "SELECT c.ancestor_id, l.task_id, c.depth + 1, sum(c.paths) "
+                "FROM synthetic_closure c "
+                "JOIN synthetic_links l ON l.prerequisite_task_id = c.descendant_id "
+                "WHERE c.depth = :depth "
+                "GROUP BY c.ancestor_id, l.task_id, c.depth"
+            ),
+            {"depth": depth},
+        ).rowcount
+        depth += 1
+    total = connection.execute(
+        text(
+            "INSERT INTO task_closure (ancestor_id, descendant_id, depth, paths) "
+            "SELECT * FROM synthetic_closure"
+        )
+    ).rowcount
+    connection.execute(text("DROP TABLE synthetic_closure"))
+    return total
+
+
+def load(
+    connection: Connection, spec: DatasetSpec, *, closure: str = "rebuild"
+) -> LoadStats:
+    """Load the dataset for ``spec`` on ``connection``.
+
+    Runs in the connection's current transaction; the caller commits.
+    """
+    if closure not in ("rebuild", "trigger"):
+        raise ValueError("closure must be 'rebuild' or 'trigger'")
+    stats = LoadStats()
+    links: List[Tuple[uuid.UUID, uuid.UUID]] = []
+    driver_conn = connection.connection.driver_connection
+
+    start = time.perf_counter()
+    with driver_conn.cursor() as cur:  # type: ignore[union-attr]
+        with cur.copy(
+            "COPY tasks (id, title, description, status, priority,"
+            " duration_seconds, deadline) FROM STDIN"
+        ) as copy:
+            for task in generate(spec):
+                copy.write_row(task[:7])
+                links.extend((task.id, p) for p in task.prerequisites)
+                stats.tasks += 1
+    stats.timings["tasks"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    connection.execute(
+        text(
+            "CREATE TEMPORARY TABLE synthetic_links "
+            "(task_id uuid NOT NULL, prerequisite_task_id uuid NOT NULL) "
+            "ON COMMIT DROP"
+        )
+    )
+    with driver_conn.cursor() as cur:  # type: ignore[union-attr]
+        with cur.copy(
+            "COPY synthetic_links (task_id, prerequisite_task_id) FROM STDIN"
+        ) as copy:
+            for link in links:
+                copy.write_row(link)
+    connection.execute(text("ANALYZE synthetic_links"))
+    stats.links = len(links)
+    del links
+    if closure == "rebuild":
+        connection.execute(
+            text(f"ALTER TABLE task_prerequisites DISABLE TRIGGER {_CLOSURE_TRIGGER}")
+        )
+    connection.execute(
+        text(
+            "INSERT INTO task_prerequisites (task_id, prerequisite_task_id) "
+            "SELECT task_id, prerequisite_task_id FROM synthetic_links"
+        )
+    )
+    stats.timings["links"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if closure == "rebuild":
+        connection.execute(
+            text(f"ALTER TABLE task_prerequisites ENABLE TRIGGER {_CLOSURE_TRIGGER}")
+        )
+        # Trigger-maintained rows through the new links otherwise
+        stats.closure_rows = _rebuild_closure(connection)
+        stats.timings["closure"] = time.perf_counter() - start
+    else:
+        stats.closure_rows = connection.execute(
+            text(
+                "SELECT count(*) FROM task_closure WHERE descendant_id IN "
+                "(SELECT task_id FROM synthetic_links)"
+            )
+        ).scalar_one()
+    connection.execute(text("DROP TABLE synthetic_links"))
+    return stats
+
+
+def write_jsonl(spec: DatasetSpec, path: Path) -> int:
+    """Write the dataset as import records (prerequisites by title)."""
+    titles: Dict[uuid.UUID, str] = {}
+    count = 0
+    with path.open("w", encoding="utf-8") as fh:
+        for task in generate(spec):
+            titles[task.id] = task.title
+            record = {
+                "title": task.title,
+                "description": task.description,
+                "status": task.status,
+                "priority": task.priority,
+                "duration_seconds": task.duration_seconds,
+                "deadline": task.deadline.isoformat() if task.deadline else None,
+                "prerequisites": [titles[p] for p in task.prerequisites],
+            }
+            fh.write(json.dumps(record) + "\n")
+            count += 1
+    return count
+
+
+def _weights(value: str) -> Dict[str, float]:
+    """Parse ``KEY=WEIGHT,KEY=WEIGHT``."""
+    pairs = (item.split("=", 1) for item in value.split(",") if item)
+    return {key.strip(): float(weight) for key, weight in pairs}
+
+
+def main() -> int:
+    defaults = DatasetSpec()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=defaults.tasks)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--prefix", default=defaults.prefix)
+    parser.add_argument(
+        "--status-weights",
+        type=_weights,
+        default=defaults.status_weights,
+        help="e.g. TODO=0.5,IN_PROGRESS=0.2,COMPLETED=0.25,CANCELLED=0.05",
+    )
+    parser.add_argument(
+        "--priority-weights",
+        type=lambda v: tuple(float(w) for w in v.split(",")),
+        default=defaults.priority_weights,
+        help="Comma-separated weight per priority, starting at 0.",
+    )
+    parser.add_argument(
+        "--deadline-fraction", type=float, default=defaults.deadline_fraction
+    )
+    parser.add_argument(
+        "--deadline-days",
+        type=lambda v: tuple(int(d) for d in v.split(",")),
+        default=defaults.deadline_days,
+        help="MIN,MAX days relative to 2026-01-01.",
+    )
+    parser.add_argument(
+        "--median-duration-minutes",
+        type=float,
+        default=defaults.median_duration_minutes,
+    )
+    parser.add_argument("--duration-sigma", type=float, default=defaults.duration_sigma)
+    parser.add_argument("--depth", type=int, default=defaults.depth)
+    parser.add_argument(
+        "--dependent-fraction", type=float, default=defaults.dependent_fraction
+    )
+    parser.add_argument("--mean-fan-in", type=float, default=defaults.mean_fan_in)
+    parser.add_argument("--max-fan-in", type=int, default=defaults.max_fan_in)
+    parser.add_argument("--locality", type=float, default=defaults.locality)
+    parser.add_argument("--hub-skew", type=float, default=defaults.hub_skew)
+    parser.add_argument("--closure", choices=("rebuild", "trigger"), default="rebuild")
+    parser.add_argument(
+        "--truncate",
+        action="store_true",
+        help="Delete ALL tasks, links and tombstones before loading.",
+    )
+    parser.add_argument(
+        "--jsonl", type=Path, help="Write import records here instead of loading."
+    )
+    args = parser.parse_args()
+
+    try:
+        spec = DatasetSpec(
+            tasks=args.tasks,
+            seed=args.seed,
+            prefix=args.prefix,
+            status_weights=args.status_weights,
+            priority_weights=args.priority_weights,
+            deadline_fraction=args.deadline_fraction,
+            deadline_days=args.deadline_days,
+            median_duration_minutes=args.median_duration_minutes,
+            duration_sigma=args.duration_sigma,
+            depth=args.depth,
+            dependent_fraction=args.dependent_fraction,
+            mean_fan_in=args.mean_fan_in,
+            max_fan_in=args.max_fan_in,
+            locality=args.locality,
+            hub_skew=args.hub_skew,
+        )
+    except ValueError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+
+    if args.jsonl is not None:
+        count = write_jsonl(spec, args.jsonl)
+        print(f"wrote {count} records to {args.jsonl}")
+        return 0
+
+    engine = create_engine(get_settings().get_database_url())
+    try:
+        start = time.perf_counter()
+        with engine.begin() as connection:
+            if args.truncate:
+                connection.execute(
+                    text(
+                        "TRUNCATE task_closure, task_prerequisites, tasks,"
+                        " task_tombstones"
+                    )
+                )
+            stats = load(connection, spec, closure=args.closure)
+        with engine.connect() as connection:
+            # Fresh statistics so plans reflect the new table sizes
+            connection.execute(text("ANALYZE tasks, task_prerequisites, task_closure"))
+            connection.commit()
+        elapsed = time.perf_counter() - start
+    finally:
+        engine.dispose()
+
+    phases = ", ".join(f"{k} {v:.1f}s" for k, v in stats.timings.items())
+    print(
+        f"loaded {stats.tasks} tasks, {stats.links} links and "
+        f"{stats.closure_rows} closure rows in {elapsed:.1f}s ({phases})"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,172 @@
+"""Measure the effect of each database performance setting on repo hot paths.
+
+Runs create/get/list/update through ``repo`` against the configured database
+once per profile variant and prints per-operation latency, the time spent
+checking a connection out of the pool, and how many connections the pool
+opened. Every call uses a fresh session, i.e. one pool checkout, like a request
+would, and ``--workers`` threads make calls at once, so that a pool smaller
+than the worker count has to wait for connections or open overflow ones.
+Benchmark rows are deleted again when a variant finishes.
+
+    cd backend
+    uv run python -m benchmarks.db_profile --iterations 200 --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+
+from sqlalchemy import create_engine, delete, event
+from sqlalchemy.orm import Session, sessionmaker
+
+from taskmaster.api.resources.tasks.types.create_task_request import CreateTaskRequest
+from taskmaster.api.resources.tasks.types.task_status import TaskStatus
+from taskmaster.api.resources.tasks.types.update_task_request import UpdateTaskRequest
+from taskmaster.config import Settings, get_settings
+from taskmaster.db.models.task import TaskRow
+from taskmaster.db.session import engine_options
+from taskmaster.services.task_management import repo
+
+# Each variant changes one setting relative to the configured profile
+VARIANTS: Dict[str, Dict[str, object]] = {
+    "configured": {},
+    "no_pre_ping": {"db_pool_pre_ping": False},
+    "pre_ping": {"db_pool_pre_ping": True},
+    "prepare_immediately": {"db_prepare_threshold": 0},
+    "no_prepare": {"db_prepare_threshold": None},
+    "no_compiled_cache": {"db_compiled_cache_size": 0},
+    "statement_timeout_5s": {"db_statement_timeout_ms": 5000},
+    # Against the default 8 workers: one kept connection, the others overflow
+    # ones that are closed on return whenever the pool is already full
+    "pool_size_1": {"db_pool_size": 1},
+    # Every worker keeps a connection of its own
+    "pool_size_16": {"db_pool_size": 16},
+    # No connections beyond pool_size: workers wait for a free one instead
+    "no_overflow": {"db_max_overflow": 0},
+    # Connections older than a second are replaced on checkout
+    "recycle_1s": {"db_pool_recycle_seconds": 1},
+}
+
+
+def run_variant(settings: Settings, *, iterations: int, workers: int) -> Dict[str, Any]:
+    engine = create_engine(settings.get_database_url(), **engine_options(settings))
+    # One entry per connection opened; list.append is safe across threads
+    opened: List[None] = []
+
+    @event.listens_for(engine, "connect")
+    def count_connection(dbapi_connection: Any, connection_record: Any) -> None:
+        opened.append(None)
+
+    timings: Dict[str, List[float]] = {
+        "checkout": [],
+        "create_task": [],
+        "get_task_by_title": [],
+        "list_tasks_page": [],
+        "update_task": [],
+    }
+    prefix = f"bench-{uuid.uuid4().hex[:8]}"
+    SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, autoflush=False)
+
+    def timed(op: str, fn: Callable[[Session], object]) -> None:
+        # A fresh session per call checks a connection out of the pool each
+        # time, so checkout costs such as pre-ping, waiting for a free
+        # connection or opening a new one show up as they would per request.
+        start = time.perf_counter()
+        with SessionLocal() as session:
+            session.connection()
+            timings["checkout"].append((time.perf_counter() - start) * 1000.0)
+            fn(session)
+        timings[op].append((time.perf_counter() - start) * 1000.0)
+
+    def run(i: int) -> None:
+        title = f"{prefix}-{i}"
+        body = CreateTaskRequest(
+            title=title,
+            description="benchmark task",
+            status=TaskStatus.TODO,
+            priority=i % 10,
+            duration_seconds=60,
+        )
+        update = UpdateTaskRequest(title=title, priority=(i + 1) % 10)
+        timed("create_task", lambda s: repo.create_task(s, body=body))
+        timed("get_task_by_title", lambda s: repo.get_task_by_title(s, title=title))
+        timed("list_tasks_page", lambda s: repo.list_tasks(s, limit=50))
+        timed(
+            "update_task",
+            lambda s: repo.update_task_by_title(s, title=title, body=update),
+        )
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # list() re-raises the first failure
+            list(executor.map(run, range(iterations)))
+    finally:
+        with engine.begin() as connection:
+            connection.execute(delete(TaskRow).where(TaskRow.title.like(f"{prefix}-%")))
+        engine.dispose()
+
+    return {
+        "connections": len(opened),
+        "ops": {
+            op: {
+                "mean_ms": statistics.fmean(values),
+                "p50_ms": statistics.median(values),
+                "p95_ms": statistics.quantiles(values, n=20)[-1],
+            }
+            for op, values in timings.items()
+        },
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Threads making calls at once (1 runs them one after another).",
+    )
+    parser.add_argument(
+        "--variant",
+        action="append",
+        choices=sorted(VARIANTS),
+        help="Only run the given variant(s); defaults to all.",
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON results.")
+    args = parser.parse_args()
+
+    base = get_settings()
+    results: Dict[str, Dict[str, Any]] = {}
+    for name in args.variant or VARIANTS:
+        settings = base.model_copy(update=VARIANTS[name])
+        results[name] = run_variant(
+            settings, iterations=args.iterations, workers=args.workers
+        )
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    ops = list(next(iter(results.values()))["ops"])
+    print(
+        f"{'variant':<22}{'conns':>6}" + "".join(f"{op + ' p50/p95':>32}" for op in ops)
+    )
+    for name, result in results.items():
+        per_op = result["ops"]
+        cells = "".join(
+            f"{per_op[op]['p50_ms']:>22.3f} / {per_op[op]['p95_ms']:<7.3f}"
+            for op in ops
+        )
+        print(f"{name:<22}{result['connections']:>6}{cells}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
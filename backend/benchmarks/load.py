@@ -0,0 +1,272 @@
+"""HTTP load benchmark for the task API with baseline regression checks.
+
+Each worker loops create-task -> get-tasks -> update-task -> delete-task on
+its own tasks, so ``--concurrency`` workers keep that many requests in
+flight. Before the run ``--seed-tasks`` tasks are created so get-tasks
+serializes a realistic page. Per operation it records p50/p95/p99 latency and
+requests per second, writes them to ``--output`` as JSON and, with
+``--baseline``, fails (exit code 1) when an operation's p95 rose or its
+throughput fell by more than ``--tolerance`` relative to the baseline.
+
+By default the app from ``server.py`` is driven in process through
+``httpx.ASGITransport`` against the configured Postgres, so no server is
+needed and results do not include socket overhead; ``--base-url`` targets a
+running server instead. Benchmark rows are deleted again afterwards.
+
+    cd backend
+    uv run python -m benchmarks.load --concurrency 8 --iterations 50 \\
+        --baseline benchmarks/baseline.json
+    # after an intended performance change
+    uv run python -m benchmarks.load --output benchmarks/baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+from sqlalchemy import create_engine, delete
+
+from taskmaster.config import get_settings
+from taskmaster.db.models.task import TaskRow, TaskTombstoneRow
+
+OPERATIONS = ("create_task", "get_tasks", "update_task", "delete_task")
+
+
+def _task_body(title: str, priority: int) -> Dict[str, Any]:
+    return {
+        "title": title,
+        "description": "load benchmark task",
+        "status": "TODO",
+        "priority": priority,
+        "duration_seconds": 600,
+    }
+
+
+class LoadRun:
+    def __init__(self, client: httpx.AsyncClient, *, prefix: str, page_size: int):
+        self.client = client
+        self.prefix = prefix
+        self.page_size = page_size
+        self.latencies: Dict[str, List[float]] = {op: [] for op in OPERATIONS}
+        self.errors: Dict[str, int] = {op: 0 for op in OPERATIONS}
+
+    async def _timed(self, op: str, method: str, url: str, **kwargs: Any) -> None:
+        start = time.perf_counter()
+        resp = await self.client.request(method, url, **kwargs)
+        elapsed = time.perf_counter() - start
+        if resp.status_code >= 400:
+            self.errors[op] += 1
+        self.latencies[op].append(elapsed * 1000.0)
+
+    async def seed(self, count: int) -> None:
+        for i in range(count):
+            resp = await self.client.post(
+                "/api/create-task",
+                json=_task_body(f"{self.prefix}-seed-{i}", i % 10),
+            )
+            resp.raise_for_status()
+
+    async def worker(self, worker_id: int, iterations: int) -> None:
+        for i in range(iterations):
+            title = f"{self.prefix}-w{worker_id}-{i}"
+            await self._timed(
+                "create_task",
+                "POST",
+                "/api/create-task",
+                json=_task_body(title, i % 10),
+            )
+            await self._timed(
+                "get_tasks", "GET", "/api/get-tasks", params={"limit": self.page_size}
+            )
+            await self._timed(
+                "update_task",
+                "POST",
+                "/api/update-task",
+                json={"title": title, "priority": (i + 1) % 10},
+            )
+            await self._timed(
+                "delete_task", "POST", "/api/delete-task", json={"title": title}
+            )
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    # Nearest-rank percentile; stable for the small samples of a quick run
+    index = max(
+        0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1)
+    )
+    return sorted_values[index]
+
+
+def summarize(run: LoadRun, wall_seconds: float) -> Dict[str, Dict[str, float]]:
+    summary: Dict[str, Dict[str, float]] = {}
+    for op, values in run.latencies.items():
+        ordered = sorted(values)
+        summary[op] = {
+            "requests": len(ordered),
+            "errors": run.errors[op],
+            "rps": len(ordered) / wall_seconds,
+            "mean_ms": statistics.fmean(ordered),
+            "p50_ms": _percentile(ordered, 50),
+            "p95_ms": _percentile(ordered, 95),
+            "p99_ms": _percentile(ordered, 99),
+        }
+    return summary
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    *,
+    tolerance: float,
+) -> List[str]:
+    """Human-readable regressions of ``results`` against ``baseline``."""
+    regressions: List[str] = []
+    for op, current in results.items():
+        base = baseline.get(op)
+        if base is None:
+            continue
+        if current["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{op}: p95 {current['p95_ms']:.2f} ms vs baseline {base['p95_ms']:.2f} ms"
+            )
+        if current["rps"] < base["rps"] * (1 - tolerance):
+            regressions.append(
+                f"{op}: {current['rps']:.1f} req/s vs baseline {base['rps']:.1f} req/s"
+            )
+    return regressions
+
+
+def _cleanup(prefix: str) -> None:
+    engine = create_engine(get_settings().get_database_url())
+    try:
+        with engine.begin() as connection:
+            connection.execute(delete(TaskRow).where(TaskRow.title.like(f"{prefix}-%")))
+            connection.execute(
+                delete(TaskTombstoneRow).where(
+                    TaskTombstoneRow.title.like(f"{prefix}-%")
+                )
+            )
+    finally:
+        engine.dispose()
+
+
+async def run_load(
+    *,
+    base_url: Optional[str],
+    concurrency: int,
+    iterations: int,
+    seed_tasks: int,
+    page_size: int,
+) -> Dict[str, Any]:
+    if base_url is None:
+        from server import app
+
+        transport: Optional[httpx.AsyncBaseTransport] = httpx.ASGITransport(app=app)
+        base_url = "http://load.test"
+    else:
+        transport = None
+
+    prefix = f"load-{uuid.uuid4().hex[:8]}"
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, transport=transport, limits=limits, timeout=60.0
+    ) as client:
+        run = LoadRun(client, prefix=prefix, page_size=page_size)
+        try:
+            await run.seed(seed_tasks)
+            start = time.perf_counter()
+            await asyncio.gather(
+                *(run.worker(w, iterations) for w in range(concurrency))
+            )
+            wall_seconds = time.perf_counter() - start
+        finally:
+            _cleanup(prefix)
+
+    return {
+        "config": {
+            "target": "in-process" if transport is not None else base_url,
+            "concurrency": concurrency,
+            "iterations": iterations,
+            "seed_tasks": seed_tasks,
+            "page_size": page_size,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+        },
+        "wall_seconds": wall_seconds,
+        "operations": summarize(run, wall_seconds),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", help="Target a running server instead.")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument(
+        "--iterations", type=int, default=50, help="Task lifecycles per worker."
+    )
+    parser.add_argument("--seed-tasks", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument(
+        "--output", type=Path, default=Path("benchmarks/results/load.json")
+    )
+    parser.add_argument("--baseline", type=Path, help="Compare against this file.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed relative p95 increase / throughput drop (default 0.25).",
+    )
+    args = parser.parse_args()
+
+    results = asyncio.run(
+        run_load(
+            base_url=args.base_url,
+            concurrency=args.concurrency,
+            iterations=args.iterations,
+            seed_tasks=args.seed_tasks,
+            page_size=args.page_size,
+        )
+    )
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(results, indent=2) + "\n")
+
+    ops = results["operations"]
+    print(f"{'operation':<14}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for op, stats in ops.items():
+        print(
+            f"{op:<14}{stats['rps']:>10.1f}{stats['p50_ms']:>10.2f}"
+            f"{stats['p95_ms']:>10.2f}{stats['p99_ms']:>10.2f}"
+        )
+    print(f"results written to {args.output}")
+
+    if any(stats["errors"] for stats in ops.values()):
+        print(
+            "requests failed: " + json.dumps({o: s["errors"] for o, s in ops.items()})
+        )
+        return 1
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text())["operations"]
+        regressions = compare(ops, baseline, tolerance=args.tolerance)
+        if regressions:
+            print("regressions against " + str(args.baseline) + ":", file=sys.stderr)
+            for line in regressions:
+                print("  " + line, file=sys.stderr)
+            return 1
+        print(
+            f"no regressions against {args.baseline} (tolerance {args.tolerance:.0%})"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
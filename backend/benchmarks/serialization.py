@@ -0,0 +1,118 @@
+"""Compare Task response serialization paths, in rows per second.
+
+Builds in-memory ``TaskRow`` objects (no database needed) and times turning them
+into a JSON response body the way each path does. All of them go through
+FastAPI's default ``dump_json`` path except the last:
+
+- ``validated+dump_json``: validated ``Task`` per row, ``response_model``
+  re-validation and pydantic ``dump_json`` (the list endpoints before
+  ``model_construct``). The speedups are relative to this one.
+- ``construct+dump_json``: ``repo._to_api_task`` (``model_construct``), the
+  ``response_model`` check (it only confirms each instance's type) and
+  ``dump_json``, as the list endpoints now do.
+- ``construct+orjson``: ``model_construct`` rows rendered with
+  ``responses.dumps``, as a pre-rendered ``Response`` would. This is what the
+  NDJSON and SSE streams use per item; for whole lists it is slower than
+  ``dump_json``, so the JSON endpoints do not use it.
+
+    cd backend
+    uv run python -m benchmarks.serialization --rows 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import time
+import uuid
+from typing import Callable, Dict, List
+
+import pydantic
+
+from taskmaster.api.resources.tasks.types.task import Task
+from taskmaster.api.resources.tasks.types.task_status import TaskStatus
+from taskmaster.db.models.task import TaskRow, TaskStatusEnum
+from taskmaster.responses import dumps
+from taskmaster.services.task_management.repo import _to_api_task
+
+_TASK_LIST = pydantic.TypeAdapter(List[Task])
+
+
+def make_rows(count: int) -> List[TaskRow]:
+    now = dt.datetime.now(dt.timezone.utc)
+    rows: List[TaskRow] = []
+    for i in range(count):
+        row = TaskRow(
+            id=uuid.uuid4(),
+            title=f"task-{i}",
+            description="benchmark task " * 4,
+            status=TaskStatusEnum.TODO,
+            priority=i % 10,
+            duration_seconds=600,
+            deadline=now + dt.timedelta(hours=i % 48) if i % 2 else None,
+        )
+        row.prerequisites = rows[-2:] if i % 3 == 0 else []
+        rows.append(row)
+    return rows
+
+
+def _validated_task(row: TaskRow) -> Task:
+    return Task(
+        id=row.id,
+        title=row.title,
+        description=row.description,
+        status=TaskStatus(row.status.value),
+        priority=row.priority,
+        duration_seconds=row.duration_seconds,
+        prerequisite_tasks=[t.id for t in row.prerequisites],
+        deadline=row.deadline,
+    )
+
+
+def validated_dump_json(rows: List[TaskRow]) -> bytes:
+    tasks = _TASK_LIST.validate_python([_validated_task(r) for r in rows])
+    return _TASK_LIST.dump_json(tasks)
+
+
+def construct_dump_json(rows: List[TaskRow]) -> bytes:
+    tasks = _TASK_LIST.validate_python([_to_api_task(r) for r in rows])
+    return _TASK_LIST.dump_json(tasks)
+
+
+def construct_orjson(rows: List[TaskRow]) -> bytes:
+    return dumps([_to_api_task(r) for r in rows])
+
+
+PATHS: Dict[str, Callable[[List[TaskRow]], bytes]] = {
+    "validated+dump_json": validated_dump_json,
+    "construct+dump_json": construct_dump_json,
+    "construct+orjson": construct_orjson,
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    baseline = None
+    print(f"{'path':<22}{'rows/s':>14}{'speedup':>10}")
+    for name, fn in PATHS.items():
+        fn(rows[:100])  # warm up
+        best = min(_timed(fn, rows) for _ in range(args.repeat))
+        rate = args.rows / best
+        baseline = baseline or rate
+        print(f"{name:<22}{rate:>14,.0f}{rate / baseline:>9.1f}x")
+    return 0
+
+
+def _timed(fn: Callable[[List[TaskRow]], bytes], rows: List[TaskRow]) -> float:
+    start = time.perf_counter()
+    fn(rows)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
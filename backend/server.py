@@ -5,10 +5,14 @@ import traceback
 import asyncio
 from fastapi.responses import JSONResponse
 from taskmaster.api.register import register as register_fern
+from taskmaster.services.jobs.core import JobsService
 from taskmaster.services.system.core import SystemService
 from taskmaster.services.task_management.core import TasksService
 from taskmaster.services.transcription.core import TranscriptionService
 from taskmaster.config import get_settings
+from taskmaster.db.query_stats import QueryStatsMiddleware
+from taskmaster.metrics import MetricsMiddleware
+from taskmaster.tracing import TracingMiddleware
 
 settings = get_settings()
 
@@ -41,10 +45,19 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(
+    QueryStatsMiddleware,
+    expose_headers=settings.db_query_headers,
+    n_plus_one_threshold=settings.db_n_plus_one_threshold,
+)
+app.add_middleware(TracingMiddleware)
+# Outermost, so recorded latency covers the whole middleware stack
+app.add_middleware(MetricsMiddleware)
 
 # Register Fern-generated API routes
 register_fern(
     app,
+    jobs=JobsService(),
     system=SystemService(),
     tasks=TasksService(),
     transcription=TranscriptionService(),
@@ -3,30 +3,66 @@
 # isort: skip_file
 
 from .resources import (
+    BatchTaskOperation,
+    BatchTaskOperationType,
+    BatchTaskResult,
+    BatchTasksRequest,
+    BatchTasksResponse,
     CreateTaskRequest,
     DeleteTaskRequest,
+    GenerateTasksEvent,
+    GenerateTasksEventType,
     GenerateTasksRequest,
     GenerateTasksResponse,
     HealthResponse,
+    ImportTasksResponse,
+    Job,
+    JobKind,
+    JobStatus,
+    RankedTask,
+    SimilarTask,
     Task,
+    TaskChangesResponse,
+    TaskOrder,
+    TaskSearchResult,
     TaskStatus,
+    TaskTombstone,
     TranscriptionResponse,
     UpdateTaskRequest,
+    jobs,
     system,
     tasks,
     transcription,
 )
 
 __all__ = [
+    "BatchTaskOperation",
+    "BatchTaskOperationType",
+    "BatchTaskResult",
+    "BatchTasksRequest",
+    "BatchTasksResponse",
     "CreateTaskRequest",
     "DeleteTaskRequest",
+    "GenerateTasksEvent",
+    "GenerateTasksEventType",
     "GenerateTasksRequest",
     "GenerateTasksResponse",
     "HealthResponse",
+    "ImportTasksResponse",
+    "Job",
+    "JobKind",
+    "JobStatus",
+    "RankedTask",
+    "SimilarTask",
     "Task",
+    "TaskChangesResponse",
+    "TaskOrder",
+    "TaskSearchResult",
     "TaskStatus",
+    "TaskTombstone",
     "TranscriptionResponse",
     "UpdateTaskRequest",
+    "jobs",
     "system",
     "tasks",
     "transcription",
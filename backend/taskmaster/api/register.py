@@ -11,6 +11,7 @@ import starlette.exceptions
 from .core.abstract_fern_service import AbstractFernService
 from .core.exceptions import default_exception_handler, fern_http_exception_handler, http_exception_handler
 from .core.exceptions.fern_http_exception import FernHTTPException
+from .resources.jobs.service.service import AbstractJobsService
 from .resources.system.service.service import AbstractSystemService
 from .resources.tasks.service.service import AbstractTasksService
 from .resources.transcription.service.service import AbstractTranscriptionService
@@ -20,11 +21,13 @@ from fastapi import params
 def register(
     _app: fastapi.FastAPI,
     *,
+    jobs: AbstractJobsService,
     system: AbstractSystemService,
     tasks: AbstractTasksService,
     transcription: AbstractTranscriptionService,
     dependencies: typing.Optional[typing.Sequence[params.Depends]] = None,
 ) -> None:
+    _app.include_router(__register_service(jobs), dependencies=dependencies)
     _app.include_router(__register_service(system), dependencies=dependencies)
     _app.include_router(__register_service(tasks), dependencies=dependencies)
     _app.include_router(__register_service(transcription), dependencies=dependencies)
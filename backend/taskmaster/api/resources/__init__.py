@@ -2,29 +2,62 @@
 
 # isort: skip_file
 
-from . import system, tasks, transcription
+from . import jobs, system, tasks, transcription
+from .jobs import Job, JobKind, JobStatus
 from .system import HealthResponse
 from .tasks import (
+    BatchTaskOperation,
+    BatchTaskOperationType,
+    BatchTaskResult,
+    BatchTasksRequest,
+    BatchTasksResponse,
     CreateTaskRequest,
     DeleteTaskRequest,
+    GenerateTasksEvent,
+    GenerateTasksEventType,
     GenerateTasksRequest,
     GenerateTasksResponse,
+    ImportTasksResponse,
+    RankedTask,
+    SimilarTask,
     Task,
+    TaskChangesResponse,
+    TaskOrder,
+    TaskSearchResult,
     TaskStatus,
+    TaskTombstone,
     UpdateTaskRequest,
 )
 from .transcription import TranscriptionResponse
 
 __all__ = [
+    "BatchTaskOperation",
+    "BatchTaskOperationType",
+    "BatchTaskResult",
+    "BatchTasksRequest",
+    "BatchTasksResponse",
     "CreateTaskRequest",
     "DeleteTaskRequest",
+    "GenerateTasksEvent",
+    "GenerateTasksEventType",
     "GenerateTasksRequest",
     "GenerateTasksResponse",
     "HealthResponse",
+    "ImportTasksResponse",
+    "Job",
+    "JobKind",
+    "JobStatus",
+    "RankedTask",
+    "SimilarTask",
     "Task",
+    "TaskChangesResponse",
+    "TaskOrder",
+    "TaskSearchResult",
     "TaskStatus",
+    "TaskTombstone",
     "TranscriptionResponse",
     "UpdateTaskRequest",
+    "jobs",
     "system",
     "tasks",
     "transcription",
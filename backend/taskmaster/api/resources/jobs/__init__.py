@@ -0,0 +1,7 @@
+# This file was auto-generated by Fern from our API Definition.
+
+# isort: skip_file
+
+from .types import Job, JobKind, JobStatus
+
+__all__ = ["Job", "JobKind", "JobStatus"]
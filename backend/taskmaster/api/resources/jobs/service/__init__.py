@@ -0,0 +1,7 @@
+# This file was auto-generated by Fern from our API Definition.
+
+# isort: skip_file
+
+from .service import AbstractJobsService
+
+__all__ = ["AbstractJobsService"]
@@ -0,0 +1,341 @@
+# This file was auto-generated by Fern from our API Definition.
+
+import abc
+import functools
+import inspect
+import logging
+import typing
+import uuid
+
+import fastapi
+from ....core.abstract_fern_service import AbstractFernService
+from ....core.exceptions.fern_http_exception import FernHTTPException
+from ....core.route_args import get_route_args
+from ...tasks.types.generate_tasks_request import GenerateTasksRequest
+from ...tasks.types.generate_tasks_response import GenerateTasksResponse
+from ...transcription.types.transcription_response import TranscriptionResponse
+from ..types.job import Job
+
+
+class AbstractJobsService(AbstractFernService):
+    """
+    AbstractJobsService is an abstract class containing the methods that you should implement.
+
+    Each method is associated with an API route, which will be registered
+    with FastAPI when you register your implementation using Fern's register()
+    function.
+    """
+
+    @abc.abstractmethod
+    def submit_generate_tasks(self, *, body: GenerateTasksRequest) -> Job:
+        """
+        Queue a task generation run and return its job immediately. A worker
+        process runs the agent; poll getJob and fetch the outcome from
+        getGenerateTasksResult once the job has SUCCEEDED.
+        """
+        ...
+
+    @abc.abstractmethod
+    def submit_transcription(self, *, file: fastapi.UploadFile) -> Job:
+        """
+        Queue transcription of an uploaded audio file and return its job
+        immediately. Fetch the text from getTranscriptionResult once the job
+        has SUCCEEDED.
+        """
+        ...
+
+    @abc.abstractmethod
+    def get_job(self, *, id: uuid.UUID) -> Job:
+        """
+        Status and progress of a queued job
+        """
+        ...
+
+    @abc.abstractmethod
+    def get_generate_tasks_result(self, *, id: uuid.UUID) -> GenerateTasksResponse:
+        """
+        Result of a finished generate-tasks job. 404 for unknown ids, 409 with
+        the job while it has not SUCCEEDED.
+        """
+        ...
+
+    @abc.abstractmethod
+    def get_transcription_result(self, *, id: uuid.UUID) -> TranscriptionResponse:
+        """
+        Result of a finished transcription job. 404 for unknown ids, 409 with
+        the job while it has not SUCCEEDED.
+        """
+        ...
+
+    """
+    Below are internal methods used by Fern to register your implementation.
+    You can ignore them.
+    """
+
+    @classmethod
+    def _init_fern(cls, router: fastapi.APIRouter) -> None:
+        cls.__init_submit_generate_tasks(router=router)
+        cls.__init_submit_transcription(router=router)
+        cls.__init_get_job(router=router)
+        cls.__init_get_generate_tasks_result(router=router)
+        cls.__init_get_transcription_result(router=router)
+
+    @classmethod
+    def __init_submit_generate_tasks(cls, router: fastapi.APIRouter) -> None:
+        endpoint_function = inspect.signature(cls.submit_generate_tasks)
+        new_parameters: typing.List[inspect.Parameter] = []
+        for index, (parameter_name, parameter) in enumerate(endpoint_function.parameters.items()):
+            if index == 0:
+                new_parameters.append(parameter.replace(default=fastapi.Depends(cls)))
+            elif parameter_name == "body":
+                new_parameters.append(parameter.replace(default=fastapi.Body(...)))
+            else:
+                new_parameters.append(parameter)
+        setattr(cls.submit_generate_tasks, "__signature__", endpoint_function.replace(parameters=new_parameters))
+
+        if inspect.iscoroutinefunction(cls.submit_generate_tasks):
+
+            @functools.wraps(cls.submit_generate_tasks)
+            async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> Job:
+                try:
+                    return await cls.submit_generate_tasks(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'submit_generate_tasks' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        else:
+
+            @functools.wraps(cls.submit_generate_tasks)
+            def wrapper(*args: typing.Any, **kwargs: typing.Any) -> Job:
+                try:
+                    return cls.submit_generate_tasks(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'submit_generate_tasks' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        # this is necessary for FastAPI to find forward-ref'ed type hints.
+        # https://github.com/tiangolo/fastapi/pull/5077
+        wrapper.__globals__.update(cls.submit_generate_tasks.__globals__)
+
+        router.post(
+            path="/api/submit-generate-tasks",
+            response_model=Job,
+            description=AbstractJobsService.submit_generate_tasks.__doc__,
+            **get_route_args(cls.submit_generate_tasks, default_tag="jobs"),
+        )(wrapper)
+
+    @classmethod
+    def __init_submit_transcription(cls, router: fastapi.APIRouter) -> None:
+        endpoint_function = inspect.signature(cls.submit_transcription)
+        new_parameters: typing.List[inspect.Parameter] = []
+        for index, (parameter_name, parameter) in enumerate(endpoint_function.parameters.items()):
+            if index == 0:
+                new_parameters.append(parameter.replace(default=fastapi.Depends(cls)))
+            elif parameter_name == "file":
+                new_parameters.append(parameter.replace(default=fastapi.UploadFile))
+            else:
+                new_parameters.append(parameter)
+        setattr(cls.submit_transcription, "__signature__", endpoint_function.replace(parameters=new_parameters))
+
+        if inspect.iscoroutinefunction(cls.submit_transcription):
+
+            @functools.wraps(cls.submit_transcription)
+            async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> Job:
+                try:
+                    return await cls.submit_transcription(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'submit_transcription' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        else:
+
+            @functools.wraps(cls.submit_transcription)
+            def wrapper(*args: typing.Any, **kwargs: typing.Any) -> Job:
+                try:
+                    return cls.submit_transcription(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'submit_transcription' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        # this is necessary for FastAPI to find forward-ref'ed type hints.
+        # https://github.com/tiangolo/fastapi/pull/5077
+        wrapper.__globals__.update(cls.submit_transcription.__globals__)
+
+        router.post(
+            path="/api/submit-transcription",
+            response_model=Job,
+            description=AbstractJobsService.submit_transcription.__doc__,
+            **get_route_args(cls.submit_transcription, default_tag="jobs"),
+        )(wrapper)
+
+    @classmethod
+    def __init_get_job(cls, router: fastapi.APIRouter) -> None:
+        endpoint_function = inspect.signature(cls.get_job)
+        new_parameters: typing.List[inspect.Parameter] = []
+        for index, (parameter_name, parameter) in enumerate(endpoint_function.parameters.items()):
+            if index == 0:
+                new_parameters.append(parameter.replace(default=fastapi.Depends(cls)))
+            elif parameter_name == "id":
+                new_parameters.append(parameter.replace(default=fastapi.Query(...)))
+            else:
+                new_parameters.append(parameter)
+        setattr(cls.get_job, "__signature__", endpoint_function.replace(parameters=new_parameters))
+
+        if inspect.iscoroutinefunction(cls.get_job):
+
+            @functools.wraps(cls.get_job)
+            async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> Job:
+                try:
+                    return await cls.get_job(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'get_job' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        else:
+
+            @functools.wraps(cls.get_job)
+            def wrapper(*args: typing.Any, **kwargs: typing.Any) -> Job:
+                try:
+                    return cls.get_job(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'get_job' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        # this is necessary for FastAPI to find forward-ref'ed type hints.
+        # https://github.com/tiangolo/fastapi/pull/5077
+        wrapper.__globals__.update(cls.get_job.__globals__)
+
+        router.get(
+            path="/api/get-job",
+            response_model=Job,
+            description=AbstractJobsService.get_job.__doc__,
+            **get_route_args(cls.get_job, default_tag="jobs"),
+        )(wrapper)
+
+    @classmethod
+    def __init_get_generate_tasks_result(cls, router: fastapi.APIRouter) -> None:
+        endpoint_function = inspect.signature(cls.get_generate_tasks_result)
+        new_parameters: typing.List[inspect.Parameter] = []
+        for index, (parameter_name, parameter) in enumerate(endpoint_function.parameters.items()):
+            if index == 0:
+                new_parameters.append(parameter.replace(default=fastapi.Depends(cls)))
+            elif parameter_name == "id":
+                new_parameters.append(parameter.replace(default=fastapi.Query(...)))
+            else:
+                new_parameters.append(parameter)
+        setattr(cls.get_generate_tasks_result, "__signature__", endpoint_function.replace(parameters=new_parameters))
+
+        if inspect.iscoroutinefunction(cls.get_generate_tasks_result):
+
+            @functools.wraps(cls.get_generate_tasks_result)
+            async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> GenerateTasksResponse:
+                try:
+                    return await cls.get_generate_tasks_result(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'get_generate_tasks_result' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        else:
+
+            @functools.wraps(cls.get_generate_tasks_result)
+            def wrapper(*args: typing.Any, **kwargs: typing.Any) -> GenerateTasksResponse:
+                try:
+                    return cls.get_generate_tasks_result(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'get_generate_tasks_result' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        # this is necessary for FastAPI to find forward-ref'ed type hints.
+        # https://github.com/tiangolo/fastapi/pull/5077
+        wrapper.__globals__.update(cls.get_generate_tasks_result.__globals__)
+
+        router.get(
+            path="/api/get-generate-tasks-result",
+            response_model=GenerateTasksResponse,
+            description=AbstractJobsService.get_generate_tasks_result.__doc__,
+            **get_route_args(cls.get_generate_tasks_result, default_tag="jobs"),
+        )(wrapper)
+
+    @classmethod
+    def __init_get_transcription_result(cls, router: fastapi.APIRouter) -> None:
+        endpoint_function = inspect.signature(cls.get_transcription_result)
+        new_parameters: typing.List[inspect.Parameter] = []
+        for index, (parameter_name, parameter) in enumerate(endpoint_function.parameters.items()):
+            if index == 0:
+                new_parameters.append(parameter.replace(default=fastapi.Depends(cls)))
+            elif parameter_name == "id":
+                new_parameters.append(parameter.replace(default=fastapi.Query(...)))
+            else:
+                new_parameters.append(parameter)
+        setattr(cls.get_transcription_result, "__signature__", endpoint_function.replace(parameters=new_parameters))
+
+        if inspect.iscoroutinefunction(cls.get_transcription_result):
+
+            @functools.wraps(cls.get_transcription_result)
+            async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> TranscriptionResponse:
+                try:
+                    return await cls.get_transcription_result(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'get_transcription_result' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        else:
+
+            @functools.wraps(cls.get_transcription_result)
+            def wrapper(*args: typing.Any, **kwargs: typing.Any) -> TranscriptionResponse:
+                try:
+                    return cls.get_transcription_result(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'get_transcription_result' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        # this is necessary for FastAPI to find forward-ref'ed type hints.
+        # https://github.com/tiangolo/fastapi/pull/5077
+        wrapper.__globals__.update(cls.get_transcription_result.__globals__)
+
+        router.get(
+            path="/api/get-transcription-result",
+            response_model=TranscriptionResponse,
+            description=AbstractJobsService.get_transcription_result.__doc__,
+            **get_route_args(cls.get_transcription_result, default_tag="jobs"),
+        )(wrapper)
@@ -0,0 +1,9 @@
+# This file was auto-generated by Fern from our API Definition.
+
+# isort: skip_file
+
+from .job import Job
+from .job_kind import JobKind
+from .job_status import JobStatus
+
+__all__ = ["Job", "JobKind", "JobStatus"]
@@ -0,0 +1,41 @@
+# This file was auto-generated by Fern from our API Definition.
+
+import datetime as dt
+import typing
+import uuid
+
+import pydantic
+from ....core.pydantic_utilities import IS_PYDANTIC_V2, UniversalBaseModel
+from .job_kind import JobKind
+from .job_status import JobStatus
+
+
+class Job(UniversalBaseModel):
+    id: uuid.UUID
+    kind: JobKind
+    status: JobStatus
+    progress: typing.Optional[str] = pydantic.Field(default=None)
+    """
+    Current stage reported by the worker, e.g. "running agent"
+    """
+
+    attempts: int = pydantic.Field()
+    """
+    Attempts started so far, including the running one
+    """
+
+    error: typing.Optional[str] = pydantic.Field(default=None)
+    """
+    Error of the last failed attempt
+    """
+
+    created_at: dt.datetime
+    started_at: typing.Optional[dt.datetime] = None
+    finished_at: typing.Optional[dt.datetime] = None
+
+    if IS_PYDANTIC_V2:
+        model_config: typing.ClassVar[pydantic.ConfigDict] = pydantic.ConfigDict(extra="forbid")  # type: ignore # Pydantic v2
+    else:
+
+        class Config:
+            extra = pydantic.Extra.forbid
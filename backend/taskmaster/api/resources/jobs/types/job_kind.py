@@ -0,0 +1,21 @@
+# This file was auto-generated by Fern from our API Definition.
+
+import enum
+import typing
+
+T_Result = typing.TypeVar("T_Result")
+
+
+class JobKind(str, enum.Enum):
+    GENERATE_TASKS = "GENERATE_TASKS"
+    TRANSCRIPTION = "TRANSCRIPTION"
+
+    def visit(
+        self,
+        generate_tasks: typing.Callable[[], T_Result],
+        transcription: typing.Callable[[], T_Result],
+    ) -> T_Result:
+        if self is JobKind.GENERATE_TASKS:
+            return generate_tasks()
+        if self is JobKind.TRANSCRIPTION:
+            return transcription()
@@ -0,0 +1,34 @@
+# This file was auto-generated by Fern from our API Definition.
+
+import enum
+import typing
+
+T_Result = typing.TypeVar("T_Result")
+
+
+class JobStatus(str, enum.Enum):
+    """
+    QUEUED jobs wait for a worker (again after a failed attempt that will be
+    retried); SUCCEEDED and FAILED are final.
+    """
+
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+
+    def visit(
+        self,
+        queued: typing.Callable[[], T_Result],
+        running: typing.Callable[[], T_Result],
+        succeeded: typing.Callable[[], T_Result],
+        failed: typing.Callable[[], T_Result],
+    ) -> T_Result:
+        if self is JobStatus.QUEUED:
+            return queued()
+        if self is JobStatus.RUNNING:
+            return running()
+        if self is JobStatus.SUCCEEDED:
+            return succeeded()
+        if self is JobStatus.FAILED:
+            return failed()
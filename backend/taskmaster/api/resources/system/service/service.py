@@ -25,6 +25,13 @@ class AbstractSystemService(AbstractFernService):
     @abc.abstractmethod
     def get_health(self) -> HealthResponse: ...
 
+    @abc.abstractmethod
+    def get_metrics(self) -> fastapi.Response:
+        """
+        Server metrics in the Prometheus text exposition format
+        """
+        ...
+
     """
     Below are internal methods used by Fern to register your implementation.
     You can ignore them.
@@ -33,6 +40,7 @@ class AbstractSystemService(AbstractFernService):
     @classmethod
     def _init_fern(cls, router: fastapi.APIRouter) -> None:
         cls.__init_get_health(router=router)
+        cls.__init_get_metrics(router=router)
 
     @classmethod
     def __init_get_health(cls, router: fastapi.APIRouter) -> None:
@@ -45,17 +53,33 @@ class AbstractSystemService(AbstractFernService):
                 new_parameters.append(parameter)
         setattr(cls.get_health, "__signature__", endpoint_function.replace(parameters=new_parameters))
 
-        @functools.wraps(cls.get_health)
-        def wrapper(*args: typing.Any, **kwargs: typing.Any) -> HealthResponse:
-            try:
-                return cls.get_health(*args, **kwargs)
-            except FernHTTPException as e:
-                logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
-                    f"Endpoint 'get_health' unexpectedly threw {e.__class__.__name__}. "
-                    + f"If this was intentional, please add {e.__class__.__name__} to "
-                    + "the endpoint's errors list in your Fern Definition."
-                )
-                raise e
+        if inspect.iscoroutinefunction(cls.get_health):
+
+            @functools.wraps(cls.get_health)
+            async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> HealthResponse:
+                try:
+                    return await cls.get_health(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'get_health' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        else:
+
+            @functools.wraps(cls.get_health)
+            def wrapper(*args: typing.Any, **kwargs: typing.Any) -> HealthResponse:
+                try:
+                    return cls.get_health(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'get_health' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
 
         # this is necessary for FastAPI to find forward-ref'ed type hints.
         # https://github.com/tiangolo/fastapi/pull/5077
@@ -67,3 +91,53 @@ class AbstractSystemService(AbstractFernService):
             description=AbstractSystemService.get_health.__doc__,
             **get_route_args(cls.get_health, default_tag="system"),
         )(wrapper)
+
+    @classmethod
+    def __init_get_metrics(cls, router: fastapi.APIRouter) -> None:
+        endpoint_function = inspect.signature(cls.get_metrics)
+        new_parameters: typing.List[inspect.Parameter] = []
+        for index, (parameter_name, parameter) in enumerate(endpoint_function.parameters.items()):
+            if index == 0:
+                new_parameters.append(parameter.replace(default=fastapi.Depends(cls)))
+            else:
+                new_parameters.append(parameter)
+        setattr(cls.get_metrics, "__signature__", endpoint_function.replace(parameters=new_parameters))
+
+        if inspect.iscoroutinefunction(cls.get_metrics):
+
+            @functools.wraps(cls.get_metrics)
+            async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> fastapi.Response:
+                try:
+                    return await cls.get_metrics(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'get_metrics' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        else:
+
+            @functools.wraps(cls.get_metrics)
+            def wrapper(*args: typing.Any, **kwargs: typing.Any) -> fastapi.Response:
+                try:
+                    return cls.get_metrics(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'get_metrics' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        # this is necessary for FastAPI to find forward-ref'ed type hints.
+        # https://github.com/tiangolo/fastapi/pull/5077
+        wrapper.__globals__.update(cls.get_metrics.__globals__)
+
+        router.get(
+            path="/api/metrics",
+            response_model=None,
+            description=AbstractSystemService.get_metrics.__doc__,
+            **get_route_args(cls.get_metrics, default_tag="system"),
+        )(wrapper)
@@ -3,21 +3,49 @@
 # isort: skip_file
 
 from .types import (
+    BatchTaskOperation,
+    BatchTaskOperationType,
+    BatchTaskResult,
+    BatchTasksRequest,
+    BatchTasksResponse,
     CreateTaskRequest,
     DeleteTaskRequest,
+    GenerateTasksEvent,
+    GenerateTasksEventType,
     GenerateTasksRequest,
     GenerateTasksResponse,
+    ImportTasksResponse,
+    RankedTask,
+    SimilarTask,
     Task,
+    TaskChangesResponse,
+    TaskOrder,
+    TaskSearchResult,
     TaskStatus,
+    TaskTombstone,
     UpdateTaskRequest,
 )
 
 __all__ = [
+    "BatchTaskOperation",
+    "BatchTaskOperationType",
+    "BatchTaskResult",
+    "BatchTasksRequest",
+    "BatchTasksResponse",
     "CreateTaskRequest",
     "DeleteTaskRequest",
+    "GenerateTasksEvent",
+    "GenerateTasksEventType",
     "GenerateTasksRequest",
     "GenerateTasksResponse",
+    "ImportTasksResponse",
+    "RankedTask",
+    "SimilarTask",
     "Task",
+    "TaskChangesResponse",
+    "TaskOrder",
+    "TaskSearchResult",
     "TaskStatus",
+    "TaskTombstone",
     "UpdateTaskRequest",
 ]
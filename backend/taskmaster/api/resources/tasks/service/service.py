@@ -1,19 +1,30 @@
 # This file was auto-generated by Fern from our API Definition.
 
 import abc
+import datetime as dt
 import functools
 import inspect
 import logging
 import typing
+import uuid
 
 import fastapi
 from ....core.abstract_fern_service import AbstractFernService
 from ....core.exceptions.fern_http_exception import FernHTTPException
 from ....core.route_args import get_route_args
+from ..types.batch_tasks_request import BatchTasksRequest
+from ..types.batch_tasks_response import BatchTasksResponse
 from ..types.create_task_request import CreateTaskRequest
 from ..types.generate_tasks_request import GenerateTasksRequest
 from ..types.generate_tasks_response import GenerateTasksResponse
+from ..types.import_tasks_response import ImportTasksResponse
+from ..types.ranked_task import RankedTask
+from ..types.similar_task import SimilarTask
 from ..types.task import Task
+from ..types.task_changes_response import TaskChangesResponse
+from ..types.task_order import TaskOrder
+from ..types.task_search_result import TaskSearchResult
+from ..types.task_status import TaskStatus
 from ..types.update_task_request import UpdateTaskRequest
 
 
@@ -27,7 +38,13 @@ class AbstractTasksService(AbstractFernService):
     """
 
     @abc.abstractmethod
-    def create_task(self, *, body: CreateTaskRequest) -> Task: ...
+    def create_task(self, *, body: CreateTaskRequest) -> Task:
+        """
+        Create a task. With `duplicate_threshold` set, nothing is created when
+        existing tasks have a title at least that similar; the 409 response
+        lists them under `similar_tasks`.
+        """
+        ...
 
     @abc.abstractmethod
     def update_task(self, *, body: UpdateTaskRequest) -> Task: ...
@@ -36,11 +53,146 @@ class AbstractTasksService(AbstractFernService):
     def delete_task(self) -> Task: ...
 
     @abc.abstractmethod
-    def get_tasks(self) -> typing.Sequence[Task]: ...
+    def get_tasks(
+        self,
+        *,
+        limit: typing.Optional[int] = None,
+        cursor: typing.Optional[uuid.UUID] = None,
+        status: typing.Optional[typing.List[TaskStatus]] = None,
+        deadline_after: typing.Optional[dt.datetime] = None,
+        deadline_before: typing.Optional[dt.datetime] = None,
+        priority_min: typing.Optional[int] = None,
+        priority_max: typing.Optional[int] = None,
+        order: typing.Optional[TaskOrder] = None,
+        accept: typing.Optional[str] = None,
+        if_none_match: typing.Optional[str] = None,
+    ) -> typing.Sequence[Task]:
+        """
+        List tasks. Results are ordered by id; pass the id of the last task of
+        a page as `cursor` to fetch the next page. Send
+        `Accept: application/x-ndjson` to stream every matching task as
+        newline-delimited JSON instead (`limit` and `cursor` are ignored).
+        With `order=TOPOLOGICAL` tasks come after all of their prerequisites
+        and carry their dependency `depth`; `cursor` is not supported then.
+        Responses carry an `ETag`; send it back as `If-None-Match` to get an
+        empty 304 while no task has changed. Responses served while a write is
+        still in flight carry no `ETag`.
+        """
+        ...
 
     @abc.abstractmethod
     def generate_tasks(self, *, body: GenerateTasksRequest) -> GenerateTasksResponse: ...
 
+    @abc.abstractmethod
+    def import_tasks(self, *, file: fastapi.UploadFile) -> ImportTasksResponse:
+        """
+        Bulk import tasks from a JSONL or CSV file in a single transaction.
+        Prerequisites are referenced by title and may point at other tasks in
+        the same file or at existing tasks.
+        """
+        ...
+
+    @abc.abstractmethod
+    def batch_tasks(self, *, body: BatchTasksRequest) -> BatchTasksResponse:
+        """
+        Apply an ordered list of create/update/delete operations, keyed by
+        title, in one transaction. Each operation reports its own result; with
+        `atomic` set, the first failure aborts the whole batch.
+        """
+        ...
+
+    @abc.abstractmethod
+    def get_task_ancestors(self, *, title: str, max_depth: typing.Optional[int] = None) -> typing.Sequence[Task]:
+        """
+        Every task that `title` transitively depends on, nearest first. Each
+        task's `depth` is its shortest distance in prerequisite links; pass
+        `max_depth` to stop after that many links.
+        """
+        ...
+
+    @abc.abstractmethod
+    def get_task_descendants(self, *, title: str, max_depth: typing.Optional[int] = None) -> typing.Sequence[Task]:
+        """
+        Every task that transitively depends on `title`, nearest first. Each
+        task's `depth` is its shortest distance in prerequisite links; pass
+        `max_depth` to stop after that many links.
+        """
+        ...
+
+    @abc.abstractmethod
+    def rank_tasks(self, *, limit: typing.Optional[int] = None) -> typing.Sequence[RankedTask]:
+        """
+        Score every open task on priority, deadline slack, duration and how
+        many tasks it blocks, and return them most urgent first.
+        """
+        ...
+
+    @abc.abstractmethod
+    def get_task_changes(self, *, since: typing.Optional[int] = None) -> TaskChangesResponse:
+        """
+        Tasks created, updated or deleted after change version `since` (omit
+        it for a full snapshot). Every response carries the version to pass
+        as `since` next time, so clients can sync incrementally. Deletions are
+        kept for a limited time: a `since` older than that answers 410, and the
+        client must resync from a full snapshot.
+        """
+        ...
+
+    @abc.abstractmethod
+    def stream_task_changes(
+        self, *, since: typing.Optional[int] = None, last_event_id: typing.Optional[str] = None
+    ) -> fastapi.responses.StreamingResponse:
+        """
+        Server-Sent Events stream of task changes. Every `changes` event holds
+        the same payload as get-task-changes and uses its `version` as the
+        event id, so a reconnecting EventSource resumes via `Last-Event-ID`.
+        Without `since` the stream starts from the current version. A `since`
+        whose deletions were already pruned answers 410 (or a `resync` event
+        once streaming).
+        """
+        ...
+
+    @abc.abstractmethod
+    def search_tasks(
+        self,
+        *,
+        query: str,
+        limit: typing.Optional[int] = None,
+        offset: typing.Optional[int] = None,
+        status: typing.Optional[typing.List[TaskStatus]] = None,
+    ) -> typing.Sequence[TaskSearchResult]:
+        """
+        Full-text search over task titles and descriptions, best match first
+        (title matches weigh more). `query` accepts web-search syntax: quoted
+        phrases, `or` and `-word` to exclude. Page with `limit` (default 20,
+        at most 100) and `offset`.
+        """
+        ...
+
+    @abc.abstractmethod
+    def find_similar_tasks(
+        self, *, title: str, threshold: typing.Optional[float] = None, limit: typing.Optional[int] = None
+    ) -> typing.Sequence[SimilarTask]:
+        """
+        Tasks whose titles are close to `title` (trigram similarity of the
+        normalized titles: case, punctuation and filler words such as "the"
+        are ignored), most similar first. Only matches with a similarity of at
+        least `threshold` (default 0.5) are returned, at most `limit`
+        (default 5, up to 50).
+        """
+        ...
+
+    @abc.abstractmethod
+    def stream_generate_tasks(self, *, body: GenerateTasksRequest) -> fastapi.responses.StreamingResponse:
+        """
+        Like generate-tasks, but streams the agent's work as Server-Sent
+        Events while it runs: `progress` events for each stage, `tool_call`
+        events when the agent starts and finishes a tool call, a `task` event
+        for every task of the final list as soon as the model has written it,
+        and one closing `done` (with the whole list) or `error` event.
+        """
+        ...
+
     """
     Below are internal methods used by Fern to register your implementation.
     You can ignore them.
@@ -53,6 +205,16 @@ class AbstractTasksService(AbstractFernService):
         cls.__init_delete_task(router=router)
         cls.__init_get_tasks(router=router)
         cls.__init_generate_tasks(router=router)
+        cls.__init_import_tasks(router=router)
+        cls.__init_batch_tasks(router=router)
+        cls.__init_get_task_ancestors(router=router)
+        cls.__init_get_task_descendants(router=router)
+        cls.__init_rank_tasks(router=router)
+        cls.__init_get_task_changes(router=router)
+        cls.__init_stream_task_changes(router=router)
+        cls.__init_search_tasks(router=router)
+        cls.__init_find_similar_tasks(router=router)
+        cls.__init_stream_generate_tasks(router=router)
 
     @classmethod
     def __init_create_task(cls, router: fastapi.APIRouter) -> None:
@@ -67,17 +229,33 @@ class AbstractTasksService(AbstractFernService):
                 new_parameters.append(parameter)
         setattr(cls.create_task, "__signature__", endpoint_function.replace(parameters=new_parameters))
 
-        @functools.wraps(cls.create_task)
-        def wrapper(*args: typing.Any, **kwargs: typing.Any) -> Task:
-            try:
-                return cls.create_task(*args, **kwargs)
-            except FernHTTPException as e:
-                logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
-                    f"Endpoint 'create_task' unexpectedly threw {e.__class__.__name__}. "
-                    + f"If this was intentional, please add {e.__class__.__name__} to "
-                    + "the endpoint's errors list in your Fern Definition."
-                )
-                raise e
+        if inspect.iscoroutinefunction(cls.create_task):
+
+            @functools.wraps(cls.create_task)
+            async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> Task:
+                try:
+                    return await cls.create_task(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'create_task' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        else:
+
+            @functools.wraps(cls.create_task)
+            def wrapper(*args: typing.Any, **kwargs: typing.Any) -> Task:
+                try:
+                    return cls.create_task(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'create_task' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
 
         # this is necessary for FastAPI to find forward-ref'ed type hints.
         # https://github.com/tiangolo/fastapi/pull/5077
@@ -103,17 +281,33 @@ class AbstractTasksService(AbstractFernService):
                 new_parameters.append(parameter)
         setattr(cls.update_task, "__signature__", endpoint_function.replace(parameters=new_parameters))
 
-        @functools.wraps(cls.update_task)
-        def wrapper(*args: typing.Any, **kwargs: typing.Any) -> Task:
-            try:
-                return cls.update_task(*args, **kwargs)
-            except FernHTTPException as e:
-                logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
-                    f"Endpoint 'update_task' unexpectedly threw {e.__class__.__name__}. "
-                    + f"If this was intentional, please add {e.__class__.__name__} to "
-                    + "the endpoint's errors list in your Fern Definition."
-                )
-                raise e
+        if inspect.iscoroutinefunction(cls.update_task):
+
+            @functools.wraps(cls.update_task)
+            async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> Task:
+                try:
+                    return await cls.update_task(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'update_task' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        else:
+
+            @functools.wraps(cls.update_task)
+            def wrapper(*args: typing.Any, **kwargs: typing.Any) -> Task:
+                try:
+                    return cls.update_task(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'update_task' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
 
         # this is necessary for FastAPI to find forward-ref'ed type hints.
         # https://github.com/tiangolo/fastapi/pull/5077
@@ -137,17 +331,33 @@ class AbstractTasksService(AbstractFernService):
                 new_parameters.append(parameter)
         setattr(cls.delete_task, "__signature__", endpoint_function.replace(parameters=new_parameters))
 
-        @functools.wraps(cls.delete_task)
-        def wrapper(*args: typing.Any, **kwargs: typing.Any) -> Task:
-            try:
-                return cls.delete_task(*args, **kwargs)
-            except FernHTTPException as e:
-                logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
-                    f"Endpoint 'delete_task' unexpectedly threw {e.__class__.__name__}. "
-                    + f"If this was intentional, please add {e.__class__.__name__} to "
-                    + "the endpoint's errors list in your Fern Definition."
-                )
-                raise e
+        if inspect.iscoroutinefunction(cls.delete_task):
+
+            @functools.wraps(cls.delete_task)
+            async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> Task:
+                try:
+                    return await cls.delete_task(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'delete_task' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        else:
+
+            @functools.wraps(cls.delete_task)
+            def wrapper(*args: typing.Any, **kwargs: typing.Any) -> Task:
+                try:
+                    return cls.delete_task(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'delete_task' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
 
         # this is necessary for FastAPI to find forward-ref'ed type hints.
         # https://github.com/tiangolo/fastapi/pull/5077
@@ -167,21 +377,57 @@ class AbstractTasksService(AbstractFernService):
         for index, (parameter_name, parameter) in enumerate(endpoint_function.parameters.items()):
             if index == 0:
                 new_parameters.append(parameter.replace(default=fastapi.Depends(cls)))
+            elif parameter_name == "limit":
+                new_parameters.append(parameter.replace(default=fastapi.Query(default=None)))
+            elif parameter_name == "cursor":
+                new_parameters.append(parameter.replace(default=fastapi.Query(default=None)))
+            elif parameter_name == "status":
+                new_parameters.append(parameter.replace(default=fastapi.Query(default=None)))
+            elif parameter_name == "deadline_after":
+                new_parameters.append(parameter.replace(default=fastapi.Query(default=None)))
+            elif parameter_name == "deadline_before":
+                new_parameters.append(parameter.replace(default=fastapi.Query(default=None)))
+            elif parameter_name == "priority_min":
+                new_parameters.append(parameter.replace(default=fastapi.Query(default=None)))
+            elif parameter_name == "priority_max":
+                new_parameters.append(parameter.replace(default=fastapi.Query(default=None)))
+            elif parameter_name == "order":
+                new_parameters.append(parameter.replace(default=fastapi.Query(default=None)))
+            elif parameter_name == "accept":
+                new_parameters.append(parameter.replace(default=fastapi.Header(default=None, alias="Accept")))
+            elif parameter_name == "if_none_match":
+                new_parameters.append(parameter.replace(default=fastapi.Header(default=None, alias="If-None-Match")))
             else:
                 new_parameters.append(parameter)
         setattr(cls.get_tasks, "__signature__", endpoint_function.replace(parameters=new_parameters))
 
-        @functools.wraps(cls.get_tasks)
-        def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Sequence[Task]:
-            try:
-                return cls.get_tasks(*args, **kwargs)
-            except FernHTTPException as e:
-                logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
-                    f"Endpoint 'get_tasks' unexpectedly threw {e.__class__.__name__}. "
-                    + f"If this was intentional, please add {e.__class__.__name__} to "
-                    + "the endpoint's errors list in your Fern Definition."
-                )
-                raise e
+        if inspect.iscoroutinefunction(cls.get_tasks):
+
+            @functools.wraps(cls.get_tasks)
+            async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Sequence[Task]:
+                try:
+                    return await cls.get_tasks(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'get_tasks' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        else:
+
+            @functools.wraps(cls.get_tasks)
+            def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Sequence[Task]:
+                try:
+                    return cls.get_tasks(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'get_tasks' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
 
         # this is necessary for FastAPI to find forward-ref'ed type hints.
         # https://github.com/tiangolo/fastapi/pull/5077
@@ -207,17 +453,33 @@ class AbstractTasksService(AbstractFernService):
                 new_parameters.append(parameter)
         setattr(cls.generate_tasks, "__signature__", endpoint_function.replace(parameters=new_parameters))
 
-        @functools.wraps(cls.generate_tasks)
-        def wrapper(*args: typing.Any, **kwargs: typing.Any) -> GenerateTasksResponse:
-            try:
-                return cls.generate_tasks(*args, **kwargs)
-            except FernHTTPException as e:
-                logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
-                    f"Endpoint 'generate_tasks' unexpectedly threw {e.__class__.__name__}. "
-                    + f"If this was intentional, please add {e.__class__.__name__} to "
-                    + "the endpoint's errors list in your Fern Definition."
-                )
-                raise e
+        if inspect.iscoroutinefunction(cls.generate_tasks):
+
+            @functools.wraps(cls.generate_tasks)
+            async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> GenerateTasksResponse:
+                try:
+                    return await cls.generate_tasks(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'generate_tasks' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        else:
+
+            @functools.wraps(cls.generate_tasks)
+            def wrapper(*args: typing.Any, **kwargs: typing.Any) -> GenerateTasksResponse:
+                try:
+                    return cls.generate_tasks(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'generate_tasks' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
 
         # this is necessary for FastAPI to find forward-ref'ed type hints.
         # https://github.com/tiangolo/fastapi/pull/5077
@@ -229,3 +491,539 @@ class AbstractTasksService(AbstractFernService):
             description=AbstractTasksService.generate_tasks.__doc__,
             **get_route_args(cls.generate_tasks, default_tag="tasks"),
         )(wrapper)
+
+    @classmethod
+    def __init_import_tasks(cls, router: fastapi.APIRouter) -> None:
+        endpoint_function = inspect.signature(cls.import_tasks)
+        new_parameters: typing.List[inspect.Parameter] = []
+        for index, (parameter_name, parameter) in enumerate(endpoint_function.parameters.items()):
+            if index == 0:
+                new_parameters.append(parameter.replace(default=fastapi.Depends(cls)))
+            elif parameter_name == "file":
+                new_parameters.append(parameter.replace(default=fastapi.UploadFile))
+            else:
+                new_parameters.append(parameter)
+        setattr(cls.import_tasks, "__signature__", endpoint_function.replace(parameters=new_parameters))
+
+        if inspect.iscoroutinefunction(cls.import_tasks):
+
+            @functools.wraps(cls.import_tasks)
+            async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> ImportTasksResponse:
+                try:
+                    return await cls.import_tasks(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'import_tasks' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        else:
+
+            @functools.wraps(cls.import_tasks)
+            def wrapper(*args: typing.Any, **kwargs: typing.Any) -> ImportTasksResponse:
+                try:
+                    return cls.import_tasks(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'import_tasks' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        # this is necessary for FastAPI to find forward-ref'ed type hints.
+        # https://github.com/tiangolo/fastapi/pull/5077
+        wrapper.__globals__.update(cls.import_tasks.__globals__)
+
+        router.post(
+            path="/api/import-tasks",
+            response_model=ImportTasksResponse,
+            description=AbstractTasksService.import_tasks.__doc__,
+            **get_route_args(cls.import_tasks, default_tag="tasks"),
+        )(wrapper)
+
+    @classmethod
+    def __init_batch_tasks(cls, router: fastapi.APIRouter) -> None:
+        endpoint_function = inspect.signature(cls.batch_tasks)
+        new_parameters: typing.List[inspect.Parameter] = []
+        for index, (parameter_name, parameter) in enumerate(endpoint_function.parameters.items()):
+            if index == 0:
+                new_parameters.append(parameter.replace(default=fastapi.Depends(cls)))
+            elif parameter_name == "body":
+                new_parameters.append(parameter.replace(default=fastapi.Body(...)))
+            else:
+                new_parameters.append(parameter)
+        setattr(cls.batch_tasks, "__signature__", endpoint_function.replace(parameters=new_parameters))
+
+        if inspect.iscoroutinefunction(cls.batch_tasks):
+
+            @functools.wraps(cls.batch_tasks)
+            async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> BatchTasksResponse:
+                try:
+                    return await cls.batch_tasks(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'batch_tasks' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        else:
+
+            @functools.wraps(cls.batch_tasks)
+            def wrapper(*args: typing.Any, **kwargs: typing.Any) -> BatchTasksResponse:
+                try:
+                    return cls.batch_tasks(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'batch_tasks' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        # this is necessary for FastAPI to find forward-ref'ed type hints.
+        # https://github.com/tiangolo/fastapi/pull/5077
+        wrapper.__globals__.update(cls.batch_tasks.__globals__)
+
+        router.post(
+            path="/api/batch-tasks",
+            response_model=BatchTasksResponse,
+            description=AbstractTasksService.batch_tasks.__doc__,
+            **get_route_args(cls.batch_tasks, default_tag="tasks"),
+        )(wrapper)
+
+    @classmethod
+    def __init_get_task_ancestors(cls, router: fastapi.APIRouter) -> None:
+        endpoint_function = inspect.signature(cls.get_task_ancestors)
+        new_parameters: typing.List[inspect.Parameter] = []
+        for index, (parameter_name, parameter) in enumerate(endpoint_function.parameters.items()):
+            if index == 0:
+                new_parameters.append(parameter.replace(default=fastapi.Depends(cls)))
+            elif parameter_name == "title":
+                new_parameters.append(parameter.replace(default=fastapi.Query(...)))
+            elif parameter_name == "max_depth":
+                new_parameters.append(parameter.replace(default=fastapi.Query(default=None)))
+            else:
+                new_parameters.append(parameter)
+        setattr(cls.get_task_ancestors, "__signature__", endpoint_function.replace(parameters=new_parameters))
+
+        if inspect.iscoroutinefunction(cls.get_task_ancestors):
+
+            @functools.wraps(cls.get_task_ancestors)
+            async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Sequence[Task]:
+                try:
+                    return await cls.get_task_ancestors(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'get_task_ancestors' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        else:
+
+            @functools.wraps(cls.get_task_ancestors)
+            def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Sequence[Task]:
+                try:
+                    return cls.get_task_ancestors(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'get_task_ancestors' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        # this is necessary for FastAPI to find forward-ref'ed type hints.
+        # https://github.com/tiangolo/fastapi/pull/5077
+        wrapper.__globals__.update(cls.get_task_ancestors.__globals__)
+
+        router.get(
+            path="/api/get-task-ancestors",
+            response_model=typing.Sequence[Task],
+            description=AbstractTasksService.get_task_ancestors.__doc__,
+            **get_route_args(cls.get_task_ancestors, default_tag="tasks"),
+        )(wrapper)
+
+    @classmethod
+    def __init_get_task_descendants(cls, router: fastapi.APIRouter) -> None:
+        endpoint_function = inspect.signature(cls.get_task_descendants)
+        new_parameters: typing.List[inspect.Parameter] = []
+        for index, (parameter_name, parameter) in enumerate(endpoint_function.parameters.items()):
+            if index == 0:
+                new_parameters.append(parameter.replace(default=fastapi.Depends(cls)))
+            elif parameter_name == "title":
+                new_parameters.append(parameter.replace(default=fastapi.Query(...)))
+            elif parameter_name == "max_depth":
+                new_parameters.append(parameter.replace(default=fastapi.Query(default=None)))
+            else:
+                new_parameters.append(parameter)
+        setattr(cls.get_task_descendants, "__signature__", endpoint_function.replace(parameters=new_parameters))
+
+        if inspect.iscoroutinefunction(cls.get_task_descendants):
+
+            @functools.wraps(cls.get_task_descendants)
+            async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Sequence[Task]:
+                try:
+                    return await cls.get_task_descendants(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'get_task_descendants' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        else:
+
+            @functools.wraps(cls.get_task_descendants)
+            def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Sequence[Task]:
+                try:
+                    return cls.get_task_descendants(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'get_task_descendants' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        # this is necessary for FastAPI to find forward-ref'ed type hints.
+        # https://github.com/tiangolo/fastapi/pull/5077
+        wrapper.__globals__.update(cls.get_task_descendants.__globals__)
+
+        router.get(
+            path="/api/get-task-descendants",
+            response_model=typing.Sequence[Task],
+            description=AbstractTasksService.get_task_descendants.__doc__,
+            **get_route_args(cls.get_task_descendants, default_tag="tasks"),
+        )(wrapper)
+
+    @classmethod
+    def __init_rank_tasks(cls, router: fastapi.APIRouter) -> None:
+        endpoint_function = inspect.signature(cls.rank_tasks)
+        new_parameters: typing.List[inspect.Parameter] = []
+        for index, (parameter_name, parameter) in enumerate(endpoint_function.parameters.items()):
+            if index == 0:
+                new_parameters.append(parameter.replace(default=fastapi.Depends(cls)))
+            elif parameter_name == "limit":
+                new_parameters.append(parameter.replace(default=fastapi.Query(default=None)))
+            else:
+                new_parameters.append(parameter)
+        setattr(cls.rank_tasks, "__signature__", endpoint_function.replace(parameters=new_parameters))
+
+        if inspect.iscoroutinefunction(cls.rank_tasks):
+
+            @functools.wraps(cls.rank_tasks)
+            async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Sequence[RankedTask]:
+                try:
+                    return await cls.rank_tasks(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'rank_tasks' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        else:
+
+            @functools.wraps(cls.rank_tasks)
+            def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Sequence[RankedTask]:
+                try:
+                    return cls.rank_tasks(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'rank_tasks' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        # this is necessary for FastAPI to find forward-ref'ed type hints.
+        # https://github.com/tiangolo/fastapi/pull/5077
+        wrapper.__globals__.update(cls.rank_tasks.__globals__)
+
+        router.get(
+            path="/api/rank-tasks",
+            response_model=typing.Sequence[RankedTask],
+            description=AbstractTasksService.rank_tasks.__doc__,
+            **get_route_args(cls.rank_tasks, default_tag="tasks"),
+        )(wrapper)
+
+    @classmethod
+    def __init_get_task_changes(cls, router: fastapi.APIRouter) -> None:
+        endpoint_function = inspect.signature(cls.get_task_changes)
+        new_parameters: typing.List[inspect.Parameter] = []
+        for index, (parameter_name, parameter) in enumerate(endpoint_function.parameters.items()):
+            if index == 0:
+                new_parameters.append(parameter.replace(default=fastapi.Depends(cls)))
+            elif parameter_name == "since":
+                new_parameters.append(parameter.replace(default=fastapi.Query(default=None)))
+            else:
+                new_parameters.append(parameter)
+        setattr(cls.get_task_changes, "__signature__", endpoint_function.replace(parameters=new_parameters))
+
+        if inspect.iscoroutinefunction(cls.get_task_changes):
+
+            @functools.wraps(cls.get_task_changes)
+            async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> TaskChangesResponse:
+                try:
+                    return await cls.get_task_changes(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'get_task_changes' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        else:
+
+            @functools.wraps(cls.get_task_changes)
+            def wrapper(*args: typing.Any, **kwargs: typing.Any) -> TaskChangesResponse:
+                try:
+                    return cls.get_task_changes(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'get_task_changes' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        # this is necessary for FastAPI to find forward-ref'ed type hints.
+        # https://github.com/tiangolo/fastapi/pull/5077
+        wrapper.__globals__.update(cls.get_task_changes.__globals__)
+
+        router.get(
+            path="/api/get-task-changes",
+            response_model=TaskChangesResponse,
+            description=AbstractTasksService.get_task_changes.__doc__,
+            **get_route_args(cls.get_task_changes, default_tag="tasks"),
+        )(wrapper)
+
+    @classmethod
+    def __init_stream_task_changes(cls, router: fastapi.APIRouter) -> None:
+        endpoint_function = inspect.signature(cls.stream_task_changes)
+        new_parameters: typing.List[inspect.Parameter] = []
+        for index, (parameter_name, parameter) in enumerate(endpoint_function.parameters.items()):
+            if index == 0:
+                new_parameters.append(parameter.replace(default=fastapi.Depends(cls)))
+            elif parameter_name == "since":
+                new_parameters.append(parameter.replace(default=fastapi.Query(default=None)))
+            elif parameter_name == "last_event_id":
+                new_parameters.append(parameter.replace(default=fastapi.Header(default=None, alias="Last-Event-ID")))
+            else:
+                new_parameters.append(parameter)
+        setattr(cls.stream_task_changes, "__signature__", endpoint_function.replace(parameters=new_parameters))
+
+        if inspect.iscoroutinefunction(cls.stream_task_changes):
+
+            @functools.wraps(cls.stream_task_changes)
+            async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> fastapi.responses.StreamingResponse:
+                try:
+                    return await cls.stream_task_changes(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'stream_task_changes' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        else:
+
+            @functools.wraps(cls.stream_task_changes)
+            def wrapper(*args: typing.Any, **kwargs: typing.Any) -> fastapi.responses.StreamingResponse:
+                try:
+                    return cls.stream_task_changes(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'stream_task_changes' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        # this is necessary for FastAPI to find forward-ref'ed type hints.
+        # https://github.com/tiangolo/fastapi/pull/5077
+        wrapper.__globals__.update(cls.stream_task_changes.__globals__)
+
+        router.get(
+            path="/api/stream-task-changes",
+            response_model=None,
+            description=AbstractTasksService.stream_task_changes.__doc__,
+            **get_route_args(cls.stream_task_changes, default_tag="tasks"),
+        )(wrapper)
+
+    @classmethod
+    def __init_search_tasks(cls, router: fastapi.APIRouter) -> None:
+        endpoint_function = inspect.signature(cls.search_tasks)
+        new_parameters: typing.List[inspect.Parameter] = []
+        for index, (parameter_name, parameter) in enumerate(endpoint_function.parameters.items()):
+            if index == 0:
+                new_parameters.append(parameter.replace(default=fastapi.Depends(cls)))
+            elif parameter_name == "query":
+                new_parameters.append(parameter.replace(default=fastapi.Query(...)))
+            elif parameter_name == "limit":
+                new_parameters.append(parameter.replace(default=fastapi.Query(default=None)))
+            elif parameter_name == "offset":
+                new_parameters.append(parameter.replace(default=fastapi.Query(default=None)))
+            elif parameter_name == "status":
+                new_parameters.append(parameter.replace(default=fastapi.Query(default=None)))
+            else:
+                new_parameters.append(parameter)
+        setattr(cls.search_tasks, "__signature__", endpoint_function.replace(parameters=new_parameters))
+
+        if inspect.iscoroutinefunction(cls.search_tasks):
+
+            @functools.wraps(cls.search_tasks)
+            async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Sequence[TaskSearchResult]:
+                try:
+                    return await cls.search_tasks(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'search_tasks' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        else:
+
+            @functools.wraps(cls.search_tasks)
+            def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Sequence[TaskSearchResult]:
+                try:
+                    return cls.search_tasks(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'search_tasks' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        # this is necessary for FastAPI to find forward-ref'ed type hints.
+        # https://github.com/tiangolo/fastapi/pull/5077
+        wrapper.__globals__.update(cls.search_tasks.__globals__)
+
+        router.get(
+            path="/api/search-tasks",
+            response_model=typing.Sequence[TaskSearchResult],
+            description=AbstractTasksService.search_tasks.__doc__,
+            **get_route_args(cls.search_tasks, default_tag="tasks"),
+        )(wrapper)
+
+    @classmethod
+    def __init_find_similar_tasks(cls, router: fastapi.APIRouter) -> None:
+        endpoint_function = inspect.signature(cls.find_similar_tasks)
+        new_parameters: typing.List[inspect.Parameter] = []
+        for index, (parameter_name, parameter) in enumerate(endpoint_function.parameters.items()):
+            if index == 0:
+                new_parameters.append(parameter.replace(default=fastapi.Depends(cls)))
+            elif parameter_name == "title":
+                new_parameters.append(parameter.replace(default=fastapi.Query(...)))
+            elif parameter_name == "threshold":
+                new_parameters.append(parameter.replace(default=fastapi.Query(default=None)))
+            elif parameter_name == "limit":
+                new_parameters.append(parameter.replace(default=fastapi.Query(default=None)))
+            else:
+                new_parameters.append(parameter)
+        setattr(cls.find_similar_tasks, "__signature__", endpoint_function.replace(parameters=new_parameters))
+
+        if inspect.iscoroutinefunction(cls.find_similar_tasks):
+
+            @functools.wraps(cls.find_similar_tasks)
+            async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Sequence[SimilarTask]:
+                try:
+                    return await cls.find_similar_tasks(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'find_similar_tasks' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        else:
+
+            @functools.wraps(cls.find_similar_tasks)
+            def wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Sequence[SimilarTask]:
+                try:
+                    return cls.find_similar_tasks(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'find_similar_tasks' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        # this is necessary for FastAPI to find forward-ref'ed type hints.
+        # https://github.com/tiangolo/fastapi/pull/5077
+        wrapper.__globals__.update(cls.find_similar_tasks.__globals__)
+
+        router.get(
+            path="/api/find-similar-tasks",
+            response_model=typing.Sequence[SimilarTask],
+            description=AbstractTasksService.find_similar_tasks.__doc__,
+            **get_route_args(cls.find_similar_tasks, default_tag="tasks"),
+        )(wrapper)
+
+    @classmethod
+    def __init_stream_generate_tasks(cls, router: fastapi.APIRouter) -> None:
+        endpoint_function = inspect.signature(cls.stream_generate_tasks)
+        new_parameters: typing.List[inspect.Parameter] = []
+        for index, (parameter_name, parameter) in enumerate(endpoint_function.parameters.items()):
+            if index == 0:
+                new_parameters.append(parameter.replace(default=fastapi.Depends(cls)))
+            elif parameter_name == "body":
+                new_parameters.append(parameter.replace(default=fastapi.Body(...)))
+            else:
+                new_parameters.append(parameter)
+        setattr(cls.stream_generate_tasks, "__signature__", endpoint_function.replace(parameters=new_parameters))
+
+        if inspect.iscoroutinefunction(cls.stream_generate_tasks):
+
+            @functools.wraps(cls.stream_generate_tasks)
+            async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> fastapi.responses.StreamingResponse:
+                try:
+                    return await cls.stream_generate_tasks(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'stream_generate_tasks' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        else:
+
+            @functools.wraps(cls.stream_generate_tasks)
+            def wrapper(*args: typing.Any, **kwargs: typing.Any) -> fastapi.responses.StreamingResponse:
+                try:
+                    return cls.stream_generate_tasks(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'stream_generate_tasks' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        # this is necessary for FastAPI to find forward-ref'ed type hints.
+        # https://github.com/tiangolo/fastapi/pull/5077
+        wrapper.__globals__.update(cls.stream_generate_tasks.__globals__)
+
+        router.post(
+            path="/api/stream-generate-tasks",
+            response_model=None,
+            description=AbstractTasksService.stream_generate_tasks.__doc__,
+            **get_route_args(cls.stream_generate_tasks, default_tag="tasks"),
+        )(wrapper)
@@ -2,20 +2,48 @@
 
 # isort: skip_file
 
+from .batch_task_operation import BatchTaskOperation
+from .batch_task_operation_type import BatchTaskOperationType
+from .batch_task_result import BatchTaskResult
+from .batch_tasks_request import BatchTasksRequest
+from .batch_tasks_response import BatchTasksResponse
 from .create_task_request import CreateTaskRequest
 from .delete_task_request import DeleteTaskRequest
+from .generate_tasks_event import GenerateTasksEvent
+from .generate_tasks_event_type import GenerateTasksEventType
 from .generate_tasks_request import GenerateTasksRequest
 from .generate_tasks_response import GenerateTasksResponse
+from .import_tasks_response import ImportTasksResponse
+from .ranked_task import RankedTask
+from .similar_task import SimilarTask
 from .task import Task
+from .task_changes_response import TaskChangesResponse
+from .task_order import TaskOrder
+from .task_search_result import TaskSearchResult
 from .task_status import TaskStatus
+from .task_tombstone import TaskTombstone
 from .update_task_request import UpdateTaskRequest
 
 __all__ = [
+    "BatchTaskOperation",
+    "BatchTaskOperationType",
+    "BatchTaskResult",
+    "BatchTasksRequest",
+    "BatchTasksResponse",
     "CreateTaskRequest",
     "DeleteTaskRequest",
+    "GenerateTasksEvent",
+    "GenerateTasksEventType",
     "GenerateTasksRequest",
     "GenerateTasksResponse",
+    "ImportTasksResponse",
+    "RankedTask",
+    "SimilarTask",
     "Task",
+    "TaskChangesResponse",
+    "TaskOrder",
+    "TaskSearchResult",
     "TaskStatus",
+    "TaskTombstone",
     "UpdateTaskRequest",
 ]
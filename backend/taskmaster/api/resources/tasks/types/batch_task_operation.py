@@ -0,0 +1,35 @@
+# This file was auto-generated by Fern from our API Definition.
+
+import datetime as dt
+import typing
+import uuid
+
+import pydantic
+from ....core.pydantic_utilities import IS_PYDANTIC_V2, UniversalBaseModel
+from .batch_task_operation_type import BatchTaskOperationType
+from .task_status import TaskStatus
+
+
+class BatchTaskOperation(UniversalBaseModel):
+    """
+    A single batch operation. CREATE requires the same fields as
+    CreateTaskRequest; UPDATE and DELETE target an existing task by title.
+    `prerequisite_titles` may reference tasks created earlier in the batch.
+    """
+
+    type: BatchTaskOperationType
+    title: str
+    description: typing.Optional[str] = None
+    status: typing.Optional[TaskStatus] = None
+    priority: typing.Optional[int] = None
+    duration_seconds: typing.Optional[int] = None
+    deadline: typing.Optional[dt.datetime] = None
+    prerequisite_tasks: typing.Optional[typing.List[uuid.UUID]] = None
+    prerequisite_titles: typing.Optional[typing.List[str]] = None
+
+    if IS_PYDANTIC_V2:
+        model_config: typing.ClassVar[pydantic.ConfigDict] = pydantic.ConfigDict(extra="forbid")  # type: ignore # Pydantic v2
+    else:
+
+        class Config:
+            extra = pydantic.Extra.forbid
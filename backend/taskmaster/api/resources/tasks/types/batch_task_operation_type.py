@@ -0,0 +1,25 @@
+# This file was auto-generated by Fern from our API Definition.
+
+import enum
+import typing
+
+T_Result = typing.TypeVar("T_Result")
+
+
+class BatchTaskOperationType(str, enum.Enum):
+    CREATE = "CREATE"
+    UPDATE = "UPDATE"
+    DELETE = "DELETE"
+
+    def visit(
+        self,
+        create: typing.Callable[[], T_Result],
+        update: typing.Callable[[], T_Result],
+        delete: typing.Callable[[], T_Result],
+    ) -> T_Result:
+        if self is BatchTaskOperationType.CREATE:
+            return create()
+        if self is BatchTaskOperationType.UPDATE:
+            return update()
+        if self is BatchTaskOperationType.DELETE:
+            return delete()
@@ -0,0 +1,23 @@
+# This file was auto-generated by Fern from our API Definition.
+
+import typing
+
+import pydantic
+from ....core.pydantic_utilities import IS_PYDANTIC_V2, UniversalBaseModel
+from .batch_task_operation_type import BatchTaskOperationType
+from .task import Task
+
+
+class BatchTaskResult(UniversalBaseModel):
+    index: int
+    type: BatchTaskOperationType
+    title: str
+    task: typing.Optional[Task] = None
+    error: typing.Optional[str] = None
+
+    if IS_PYDANTIC_V2:
+        model_config: typing.ClassVar[pydantic.ConfigDict] = pydantic.ConfigDict(extra="forbid")  # type: ignore # Pydantic v2
+    else:
+
+        class Config:
+            extra = pydantic.Extra.forbid
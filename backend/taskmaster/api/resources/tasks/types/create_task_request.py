@@ -17,6 +17,11 @@ class CreateTaskRequest(UniversalBaseModel):
     duration_seconds: int
     deadline: typing.Optional[dt.datetime] = None
     prerequisite_tasks: typing.Optional[typing.List[uuid.UUID]] = None
+    duplicate_threshold: typing.Optional[float] = pydantic.Field(default=None)
+    """
+    Refuse to create the task if an existing title is at least this
+    similar (0 to 1, see find-similar-tasks).
+    """
 
     if IS_PYDANTIC_V2:
         model_config: typing.ClassVar[pydantic.ConfigDict] = pydantic.ConfigDict(extra="forbid")  # type: ignore # Pydantic v2
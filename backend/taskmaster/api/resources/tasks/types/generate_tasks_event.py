@@ -0,0 +1,30 @@
+# This file was auto-generated by Fern from our API Definition.
+
+import typing
+
+import pydantic
+from ....core.pydantic_utilities import IS_PYDANTIC_V2, UniversalBaseModel
+from .generate_tasks_event_type import GenerateTasksEventType
+from .task import Task
+
+
+class GenerateTasksEvent(UniversalBaseModel):
+    """
+    One streamed generate-tasks event; which fields are set depends on
+    `type`. `stage` names the PROGRESS stage or the TOOL_CALL state
+    (`started`, `completed` or `failed`), `tool` the called tool.
+    """
+
+    type: GenerateTasksEventType
+    stage: typing.Optional[str] = None
+    tool: typing.Optional[str] = None
+    task: typing.Optional[Task] = None
+    tasks: typing.Optional[typing.List[Task]] = None
+    error: typing.Optional[str] = None
+
+    if IS_PYDANTIC_V2:
+        model_config: typing.ClassVar[pydantic.ConfigDict] = pydantic.ConfigDict(extra="forbid")  # type: ignore # Pydantic v2
+    else:
+
+        class Config:
+            extra = pydantic.Extra.forbid
@@ -0,0 +1,33 @@
+# This file was auto-generated by Fern from our API Definition.
+
+import enum
+import typing
+
+T_Result = typing.TypeVar("T_Result")
+
+
+class GenerateTasksEventType(str, enum.Enum):
+    PROGRESS = "PROGRESS"
+    TOOL_CALL = "TOOL_CALL"
+    TASK = "TASK"
+    DONE = "DONE"
+    ERROR = "ERROR"
+
+    def visit(
+        self,
+        progress: typing.Callable[[], T_Result],
+        tool_call: typing.Callable[[], T_Result],
+        task: typing.Callable[[], T_Result],
+        done: typing.Callable[[], T_Result],
+        error: typing.Callable[[], T_Result],
+    ) -> T_Result:
+        if self is GenerateTasksEventType.PROGRESS:
+            return progress()
+        if self is GenerateTasksEventType.TOOL_CALL:
+            return tool_call()
+        if self is GenerateTasksEventType.TASK:
+            return task()
+        if self is GenerateTasksEventType.DONE:
+            return done()
+        if self is GenerateTasksEventType.ERROR:
+            return error()
@@ -18,6 +18,13 @@ class Task(UniversalBaseModel):
     duration_seconds: int
     prerequisite_tasks: typing.List[uuid.UUID]
     deadline: typing.Optional[dt.datetime] = None
+    depth: typing.Optional[int] = pydantic.Field(default=None)
+    """
+    Only set by dependency queries. In topologically ordered listings,
+    the length of the longest prerequisite chain below this task (0 for
+    a task without prerequisites); in ancestor/descendant listings, the
+    shortest distance from the queried task.
+    """
 
     if IS_PYDANTIC_V2:
         model_config: typing.ClassVar[pydantic.ConfigDict] = pydantic.ConfigDict(extra="forbid")  # type: ignore # Pydantic v2
@@ -0,0 +1,32 @@
+# This file was auto-generated by Fern from our API Definition.
+
+import typing
+
+import pydantic
+from ....core.pydantic_utilities import IS_PYDANTIC_V2, UniversalBaseModel
+from .task import Task
+from .task_tombstone import TaskTombstone
+
+
+class TaskChangesResponse(UniversalBaseModel):
+    version: int = pydantic.Field()
+    """
+    Pass as `since` on the next call to receive only later changes.
+    """
+
+    tasks: typing.List[Task] = pydantic.Field()
+    """
+    Tasks created or updated after `since`, oldest change first.
+    """
+
+    deleted: typing.List[TaskTombstone] = pydantic.Field()
+    """
+    Tasks deleted after `since`, oldest first.
+    """
+
+    if IS_PYDANTIC_V2:
+        model_config: typing.ClassVar[pydantic.ConfigDict] = pydantic.ConfigDict(extra="forbid")  # type: ignore # Pydantic v2
+    else:
+
+        class Config:
+            extra = pydantic.Extra.forbid
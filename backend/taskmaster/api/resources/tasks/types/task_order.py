@@ -0,0 +1,21 @@
+# This file was auto-generated by Fern from our API Definition.
+
+import enum
+import typing
+
+T_Result = typing.TypeVar("T_Result")
+
+
+class TaskOrder(str, enum.Enum):
+    ID = "ID"
+    TOPOLOGICAL = "TOPOLOGICAL"
+
+    def visit(
+        self,
+        id: typing.Callable[[], T_Result],
+        topological: typing.Callable[[], T_Result],
+    ) -> T_Result:
+        if self is TaskOrder.ID:
+            return id()
+        if self is TaskOrder.TOPOLOGICAL:
+            return topological()
@@ -0,0 +1,33 @@
+# This file was auto-generated by Fern from our API Definition.
+
+import typing
+
+import pydantic
+from ....core.pydantic_utilities import IS_PYDANTIC_V2, UniversalBaseModel
+from .task import Task
+
+
+class TaskSearchResult(UniversalBaseModel):
+    task: Task
+    rank: float = pydantic.Field()
+    """
+    Relevance of the task to the query; higher is better.
+    """
+
+    title_highlight: str = pydantic.Field()
+    """
+    The title with matching words wrapped in `<mark>` tags.
+    """
+
+    snippet: str = pydantic.Field()
+    """
+    Fragments of the description around the matches, with matching
+    words wrapped in `<mark>` tags. Other text is returned unescaped.
+    """
+
+    if IS_PYDANTIC_V2:
+        model_config: typing.ClassVar[pydantic.ConfigDict] = pydantic.ConfigDict(extra="forbid")  # type: ignore # Pydantic v2
+    else:
+
+        class Config:
+            extra = pydantic.Extra.forbid
@@ -51,17 +51,33 @@ class AbstractTranscriptionService(AbstractFernService):
                 new_parameters.append(parameter)
         setattr(cls.create_transcription, "__signature__", endpoint_function.replace(parameters=new_parameters))
 
-        @functools.wraps(cls.create_transcription)
-        def wrapper(*args: typing.Any, **kwargs: typing.Any) -> TranscriptionResponse:
-            try:
-                return cls.create_transcription(*args, **kwargs)
-            except FernHTTPException as e:
-                logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
-                    f"Endpoint 'create_transcription' unexpectedly threw {e.__class__.__name__}. "
-                    + f"If this was intentional, please add {e.__class__.__name__} to "
-                    + "the endpoint's errors list in your Fern Definition."
-                )
-                raise e
+        if inspect.iscoroutinefunction(cls.create_transcription):
+
+            @functools.wraps(cls.create_transcription)
+            async def wrapper(*args: typing.Any, **kwargs: typing.Any) -> TranscriptionResponse:
+                try:
+                    return await cls.create_transcription(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'create_transcription' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
+
+        else:
+
+            @functools.wraps(cls.create_transcription)
+            def wrapper(*args: typing.Any, **kwargs: typing.Any) -> TranscriptionResponse:
+                try:
+                    return cls.create_transcription(*args, **kwargs)
+                except FernHTTPException as e:
+                    logging.getLogger(f"{cls.__module__}.{cls.__name__}").warn(
+                        f"Endpoint 'create_transcription' unexpectedly threw {e.__class__.__name__}. "
+                        + f"If this was intentional, please add {e.__class__.__name__} to "
+                        + "the endpoint's errors list in your Fern Definition."
+                    )
+                    raise e
 
         # this is necessary for FastAPI to find forward-ref'ed type hints.
         # https://github.com/tiangolo/fastapi/pull/5077
@@ -13,6 +13,8 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        # Lets optional settings be cleared explicitly, e.g. DB_PREPARE_THRESHOLD=null
+        env_parse_none_str="null",
     )
 
     # Absolute path to the monorepo/workspace root (e.g., /Users/.../taskmaster)
@@ -45,6 +47,142 @@ class Settings(BaseSettings):
         description="Database URL for Alembic migrations. Defaults to database_url if not set.",
     )
 
+    # Database performance profile (applies to both the sync and async engines)
+    db_pool_size: int = Field(
+        default=5, description="Connections kept open in the pool."
+    )
+    db_max_overflow: int = Field(
+        default=10,
+        description="Extra connections allowed beyond db_pool_size under load.",
+    )
+    db_pool_timeout_seconds: float = Field(
+        default=30.0, description="How long a checkout waits for a free connection."
+    )
+    db_pool_recycle_seconds: int = Field(
+        default=1800,
+        description="Replace pooled connections older than this; -1 disables recycling.",
+    )
+    db_pool_pre_ping: bool = Field(
+        default=True,
+        description=(
+            "Ping each connection on checkout. Costs one round-trip per checkout; "
+            "with a recycle interval shorter than server/proxy idle timeouts it can "
+            "usually be turned off."
+        ),
+    )
+    db_prepare_threshold: Optional[int] = Field(
+        default=5,
+        description=(
+            "psycopg prepare_threshold: executions before a query is server-side "
+            "prepared (0 prepares immediately, None disables, e.g. behind PgBouncer "
+            "in transaction mode)."
+        ),
+    )
+    db_compiled_cache_size: int = Field(
+        default=500,
+        description="SQLAlchemy compiled statement cache size per engine (0 disables).",
+    )
+    db_statement_timeout_ms: Optional[int] = Field(
+        default=None,
+        description="Per-statement timeout set on every connection; None means no limit.",
+    )
+
+    # Change feed
+    task_tombstone_retention_days: float = Field(
+        default=30.0,
+        description=(
+            "Keep tombstones of deleted tasks this long; get-task-changes answers 410 "
+            "to clients syncing from before pruned deletes. 0 keeps them forever."
+        ),
+    )
+
+    # Query instrumentation
+    db_query_headers: bool = Field(
+        default=False,
+        description=(
+            "Add X-DB-Query-Count and X-DB-Query-Time-Ms headers to every response "
+            "(for local debugging)."
+        ),
+    )
+    db_n_plus_one_threshold: int = Field(
+        default=5,
+        description="Log a warning when one SELECT runs this many times in a request.",
+    )
+
+    # Tracing
+    tracing_exporter: str = Field(
+        default="memory",
+        description=(
+            "Where finished spans go: memory (recent spans kept in process), "
+            "jsonl (appended to tracing_jsonl_path) or none."
+        ),
+    )
+    tracing_jsonl_path: str = Field(
+        default="traces.jsonl", description="Span output file for the jsonl exporter."
+    )
+
+    # Job queue (generation/transcription workers)
+    job_max_attempts: int = Field(
+        default=3,
+        description="Attempts per transcription job before it is marked FAILED.",
+    )
+    job_generate_max_attempts: int = Field(
+        default=1,
+        description=(
+            "Attempts per task generation job. The agent writes tasks through MCP "
+            "as it runs, so another attempt (after an error or a lost lease) may "
+            "create or change them twice."
+        ),
+    )
+    job_lease_seconds: float = Field(
+        default=60.0,
+        description=(
+            "How long a claimed job stays reserved without a heartbeat; workers renew "
+            "it every third of this, and jobs of a dead worker run again after it."
+        ),
+    )
+    job_retry_backoff_seconds: float = Field(
+        default=5.0,
+        description="Delay before the first retry of a failed job, doubled per attempt.",
+    )
+    job_poll_interval_seconds: float = Field(
+        default=5.0,
+        description=(
+            "Idle workers wake up on NOTIFY from new submissions, and poll at this "
+            "interval for retries that became due."
+        ),
+    )
+    job_worker_concurrency: int = Field(
+        default=2, description="Jobs one worker process runs at the same time."
+    )
+
+    # Agent prompt context
+    agent_context_token_budget: int = Field(
+        default=6000,
+        description=(
+            "Approximate tokens of existing tasks put in the agent prompt. Larger "
+            "backlogs are cut to the tasks most relevant to the transcript and their "
+            "prerequisites/dependents; 0 always sends every task."
+        ),
+    )
+
+    # Prompt templates
+    prompt_auto_reload: bool = Field(
+        default=True,
+        description=(
+            "Stat prompt templates (and the templates they include) on each use and "
+            "recompile edited ones; turn off in production to keep the first build."
+        ),
+    )
+    prompt_bytecode_cache: bool = Field(
+        default=True,
+        description="Persist compiled prompt templates so restarts skip compiling.",
+    )
+    prompt_bytecode_cache_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for the prompt bytecode cache; None uses a temp dir.",
+    )
+
     # Debugger settings (for local development)
     backend_debug: bool = Field(default=False)
     backend_debug_wait: bool = Field(default=False)
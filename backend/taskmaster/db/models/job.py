@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import enum
+import uuid
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import (
+    UUID,
+    CheckConstraint,
+    DateTime,
+    Enum,
+    Index,
+    Integer,
+    LargeBinary,
+    Text,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from taskmaster.db.base import Base
+
+
+class JobKindEnum(str, enum.Enum):
+    GENERATE_TASKS = "GENERATE_TASKS"
+    TRANSCRIPTION = "TRANSCRIPTION"
+
+
+class JobStatusEnum(str, enum.Enum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+
+
+class JobRow(Base):
+    """A unit of slow work (LLM/transcription calls) run by a job worker.
+
+    ``run_after`` is when the job may next be claimed: its enqueue or retry
+    time while QUEUED, and the expiry of the worker's lease while RUNNING, so
+    jobs of a worker that died are claimed again once the lease runs out.
+    """
+
+    __tablename__ = "jobs"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    kind: Mapped[JobKindEnum] = mapped_column(
+        Enum(JobKindEnum, name="job_kind"), nullable=False
+    )
+    status: Mapped[JobStatusEnum] = mapped_column(
+        Enum(JobStatusEnum, name="job_status"),
+        server_default=JobStatusEnum.QUEUED.value,
+        nullable=False,
+    )
+    payload: Mapped[Dict[str, Any]] = mapped_column(
+        JSONB, server_default=text("'{}'::jsonb"), nullable=False
+    )
+    # Uploaded bytes (audio); dropped once the job is finished. Deferred so
+    # status polls never read it.
+    input: Mapped[Optional[bytes]] = mapped_column(
+        LargeBinary, nullable=True, deferred=True
+    )
+    result: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    progress: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    attempts: Mapped[int] = mapped_column(
+        Integer, server_default=text("0"), nullable=False
+    )
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False)
+    run_after: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    locked_by: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Trace of the submitting request, continued by the worker
+    traceparent: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    started_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    finished_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        CheckConstraint("max_attempts >= 1", name="ck_jobs_max_attempts_positive"),
+        # Claim scans: only unfinished jobs, in the order they become due
+        Index(
+            "ix_jobs_claimable",
+            "run_after",
+            postgresql_where=text("status IN ('QUEUED', 'RUNNING')"),
+        ),
+    )
@@ -3,23 +3,30 @@ from __future__ import annotations
 import enum
 import uuid
 from datetime import datetime
-from typing import List
+from typing import Any, List
 
 from sqlalchemy import (
     UUID,
+    BigInteger,
     CheckConstraint,
     Column,
+    Computed,
     DateTime,
     Enum,
     ForeignKey,
     Integer,
+    Numeric,
+    Sequence,
+    SmallInteger,
     String,
     Table,
     Text,
     UniqueConstraint,
     func,
     Index,
+    text,
 )
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from taskmaster.db.base import Base
@@ -51,6 +58,47 @@ task_prerequisites = Table(
 )
 
 
+# Transitive closure of task_prerequisites: one row per (ancestor, descendant,
+# path length) with the number of distinct paths of that length. Maintained by
+# triggers on task_prerequisites (see migration 20261018_000002); the path
+# counts let an edge be removed without recomputing the closure. They grow
+# exponentially with depth on diamond-shaped graphs, hence numeric (000007).
+task_closure = Table(
+    "task_closure",
+    Base.metadata,
+    Column(
+        "ancestor_id",
+        UUID(as_uuid=True),
+        ForeignKey("tasks.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "descendant_id",
+        UUID(as_uuid=True),
+        ForeignKey("tasks.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column("depth", Integer, primary_key=True),
+    Column("paths", Numeric, nullable=False),
+    Index("ix_task_closure_descendant", "descendant_id", "depth", "ancestor_id"),
+)
+
+
+# Every task write takes a new value from this sequence (see TaskRow.version and
+# TaskTombstoneRow), so clients can ask for everything changed since a version.
+task_change_version_seq = Sequence("task_change_version_seq", metadata=Base.metadata)
+
+# Text search configuration of TaskRow.search_vector; queries must use the same
+SEARCH_CONFIG = "english"
+
+
+def _pg_trgm_installed(ddl: Any, target: Any, bind: Any, **kw: Any) -> bool:
+    # gin_trgm_ops needs the extension; without it the index is skipped
+    return bind is not None and bool(
+        bind.scalar(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'"))
+    )
+
+
 class TaskRow(Base):
     __tablename__ = "tasks"
 
@@ -73,9 +121,32 @@ class TaskRow(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        server_onupdate=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+    version: Mapped[int] = mapped_column(
+        BigInteger,
+        server_default=task_change_version_seq.next_value(),
+        onupdate=task_change_version_seq.next_value(),
         nullable=False,
     )
+    # Maintained by Postgres on every write (migration 20261018_000004). Left
+    # unmapped (a plain column in queries) so inserts never fetch it back.
+    search_vector = Column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', title), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', description), 'B')",
+            persisted=True,
+        ),
+        nullable=False,
+    )
+    # task_title_normalize(title), also unmapped; the trigram index on it only
+    # exists where pg_trgm is installed (migration 20261018_000005,
+    # _pg_trgm_installed below)
+    title_normalized = Column(
+        Text, Computed("task_title_normalize(title)", persisted=True), nullable=False
+    )
 
     prerequisites: Mapped[List["TaskRow"]] = relationship(
         "TaskRow",
@@ -92,4 +163,53 @@ class TaskRow(Base):
         CheckConstraint("duration_seconds >= 0", name="ck_tasks_duration_nonneg"),
         Index("ix_tasks_status", "status"),
         Index("ix_tasks_deadline", "deadline"),
+        Index("ix_tasks_version", "version"),
+        Index("ix_tasks_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_tasks_title_trgm",
+            "title_normalized",
+            postgresql_using="gin",
+            postgresql_ops={"title_normalized": "gin_trgm_ops"},
+        ).ddl_if(callable_=_pg_trgm_installed),
+    )
+    __mapper_args__ = {"exclude_properties": ["search_vector", "title_normalized"]}
+
+
+class TaskTombstoneRow(Base):
+    """Marker left behind by a deleted task for change-feed consumers."""
+
+    __tablename__ = "task_tombstones"
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    title: Mapped[str] = mapped_column(Text, nullable=False)
+    version: Mapped[int] = mapped_column(
+        BigInteger,
+        server_default=task_change_version_seq.next_value(),
+        nullable=False,
+    )
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        Index("ix_task_tombstones_version", "version"),
+        Index("ix_task_tombstones_deleted_at", "deleted_at"),
     )
+
+
+class TaskChangeFeedRow(Base):
+    """Single row of change-feed state.
+
+    Tombstones older than the retention period are pruned; ``pruned_version``
+    is the newest version pruned so far, so feeds from an older ``since`` may
+    have missed deletes and must resync from a snapshot.
+    """
+
+    __tablename__ = "task_change_feed"
+
+    id: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    pruned_version: Mapped[int] = mapped_column(
+        BigInteger, server_default=text("0"), nullable=False
+    )
+
+    __table_args__ = (CheckConstraint("id = 1", name="ck_task_change_feed_single_row"),)
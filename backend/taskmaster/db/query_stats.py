@@ -0,0 +1,173 @@
+"""Per-request SQL statement counting and N+1 detection.
+
+Engines passed to :func:`instrument_engine` report every cursor execution to
+the :class:`QueryStats` active in the current context (see
+:func:`track_queries`). The context variable follows async tasks, the greenlets
+``AsyncSession.run_sync`` uses and Starlette's threadpool, so one request's
+statements are counted together however its handler reaches the database.
+``COPY`` run directly on the psycopg cursor (bulk import) bypasses the engine
+events and is not counted.
+
+:class:`QueryStatsMiddleware` tracks every HTTP request, logs repeated
+identical ``SELECT`` statements (the usual N+1 signature, e.g. a lazy load per
+row) and, when enabled, reports the totals in response headers.
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import contextvars
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+QUERY_TIME_HEADER = "X-DB-Query-Time-Ms"
+
+_LOGGER = logging.getLogger(__name__)
+_START_TIMES_KEY = "taskmaster_query_start_times"
+
+_current: contextvars.ContextVar[Optional[QueryStats]] = contextvars.ContextVar(
+    "taskmaster_query_stats", default=None
+)
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    total_seconds: float = 0.0
+    # Executions per distinct statement text (parameters are bound separately,
+    # so one statement shape maps to one key)
+    statements: collections.Counter[str] = field(default_factory=collections.Counter)
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.total_seconds += elapsed
+        self.statements[statement] += 1
+
+    def repeated_selects(self, threshold: int) -> List[Tuple[str, int]]:
+        """``SELECT`` statements executed at least ``threshold`` times."""
+        return [
+            (statement, count)
+            for statement, count in self.statements.most_common()
+            if count >= threshold and statement.lstrip().upper().startswith("SELECT")
+        ]
+
+    def describe(self) -> str:
+        lines = [f"{self.count} statements in {self.total_seconds * 1000:.1f} ms:"]
+        lines.extend(
+            f"  {count}x {' '.join(statement.split())[:200]}"
+            for statement, count in self.statements.most_common()
+        )
+        return "\n".join(lines)
+
+
+@contextlib.contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count the statements executed in this context until the block exits."""
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+    if _current.get() is not None:
+        conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+    stats = _current.get()
+    start_times = conn.info.get(_START_TIMES_KEY)
+    if stats is None or not start_times:
+        return
+    stats.record(statement, time.perf_counter() - start_times.pop())
+
+
+def instrument_engine(engine: Engine | AsyncEngine) -> None:
+    """Report ``engine``'s statements to the active :class:`QueryStats`.
+
+    Without an active tracker the listeners cost one context variable lookup
+    per statement.
+    """
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    if not event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryStatsMiddleware:
+    """Track the statements each HTTP request runs.
+
+    Logs a warning when one ``SELECT`` runs ``n_plus_one_threshold`` times or
+    more within a request; long-lived event streams poll by design and are not
+    checked. With ``expose_headers`` the count and total database
+    time so far are added to the response headers (for streaming responses,
+    as of the first byte).
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        expose_headers: bool = False,
+        n_plus_one_threshold: int = 5,
+    ) -> None:
+        self.app = app
+        self._expose_headers = expose_headers
+        self._n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        streaming = False
+        with track_queries() as stats:
+
+            async def send_wrapper(message: Message) -> None:
+                nonlocal streaming
+                if message["type"] == "http.response.start":
+                    streaming = any(
+                        name == b"content-type"
+                        and value.startswith(b"text/event-stream")
+                        for name, value in message.get("headers", [])
+                    )
+                if self._expose_headers and message["type"] == "http.response.start":
+                    headers = list(message.get("headers", []))
+                    headers.append(
+                        (QUERY_COUNT_HEADER.lower().encode(), str(stats.count).encode())
+                    )
+                    headers.append(
+                        (
+                            QUERY_TIME_HEADER.lower().encode(),
+                            f"{stats.total_seconds * 1000:.2f}".encode(),
+                        )
+                    )
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                if not streaming:
+                    self._check_n_plus_one(scope, stats)
+
+    def _check_n_plus_one(self, scope: Scope, stats: QueryStats) -> None:
+        for statement, count in stats.repeated_selects(self._n_plus_one_threshold):
+            _LOGGER.warning(
+                "Possible N+1 query: %d executions during %s %s of: %s",
+                count,
+                scope["method"],
+                scope["path"],
+                " ".join(statement.split())[:500],
+            )
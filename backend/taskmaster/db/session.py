@@ -1,10 +1,20 @@
 from __future__ import annotations
 
-from typing import Generator, Optional
+import time
+from typing import Any, AsyncGenerator, Dict, Generator, Optional
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
-from taskmaster.config import get_settings
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from taskmaster import metrics
+from taskmaster.config import Settings, get_settings
+from taskmaster.db.query_stats import instrument_engine
 
 
 def _get_database_url() -> str:
@@ -12,16 +22,68 @@ def _get_database_url() -> str:
     return settings.get_database_url()
 
 
+def engine_options(settings: Settings) -> Dict[str, Any]:
+    """Keyword arguments for ``create_engine``/``create_async_engine`` built from
+    the database performance profile in ``settings``."""
+    connect_args: Dict[str, Any] = {"prepare_threshold": settings.db_prepare_threshold}
+    if settings.db_statement_timeout_ms is not None:
+        connect_args["options"] = (
+            f"-c statement_timeout={settings.db_statement_timeout_ms}"
+        )
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "query_cache_size": settings.db_compiled_cache_size,
+        "connect_args": connect_args,
+    }
+
+
+class _CheckoutTimingMixin:
+    """Record how long each pool checkout waited, connecting included."""
+
+    _checkout_wait = metrics.DB_POOL_CHECKOUT_WAIT.labels("sync")
+
+    # Pool._do_get is private SQLAlchemy API: it is the one place that spans
+    # both waiting for a free connection and opening a new one, which the
+    # public pool events do not. pyproject.toml pins SQLAlchemy to 2.0.x and
+    # tests/test_metrics.py fails if checkouts stop being recorded.
+    def _do_get(self):  # type: ignore[no-untyped-def]
+        start = time.perf_counter()
+        try:
+            return super()._do_get()  # type: ignore[misc]
+        finally:
+            self._checkout_wait.observe(time.perf_counter() - start)
+
+
+class _TimedQueuePool(_CheckoutTimingMixin, QueuePool):
+    pass
+
+
+class _TimedAsyncQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    _checkout_wait = metrics.DB_POOL_CHECKOUT_WAIT.labels("async")
+
+
 _engine = None  # type: ignore[var-annotated]
 _SessionLocal: Optional[sessionmaker] = None
+_async_engine: Optional[AsyncEngine] = None
+_AsyncSessionLocal: Optional[async_sessionmaker[AsyncSession]] = None
 
 
 def _get_engine():
     global _engine  # noqa: PLW0603
     if _engine is None:
         _engine = create_engine(
-            _get_database_url(), echo=False, pool_pre_ping=True, future=True
+            _get_database_url(),
+            echo=False,
+            future=True,
+            poolclass=_TimedQueuePool,
+            **engine_options(get_settings()),
         )
+        metrics.watch_pool("sync", _engine.pool)
+        instrument_engine(_engine)
     return _engine
 
 
@@ -42,3 +104,36 @@ def get_db_session() -> Generator[Session, None, None]:
     SessionLocal = _get_session_local()
     with SessionLocal() as session:
         yield session
+
+
+def _get_async_engine() -> AsyncEngine:
+    global _async_engine  # noqa: PLW0603
+    if _async_engine is None:
+        # psycopg 3 serves both the sync and asyncio dialects from the same URL
+        _async_engine = create_async_engine(
+            _get_database_url(),
+            echo=False,
+            poolclass=_TimedAsyncQueuePool,
+            **engine_options(get_settings()),
+        )
+        metrics.watch_pool("async", _async_engine.pool)
+        instrument_engine(_async_engine)
+    return _async_engine
+
+
+def _get_async_session_local() -> async_sessionmaker[AsyncSession]:
+    global _AsyncSessionLocal  # noqa: PLW0603
+    if _AsyncSessionLocal is None:
+        _AsyncSessionLocal = async_sessionmaker(
+            bind=_get_async_engine(),
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+        )
+    return _AsyncSessionLocal
+
+
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    AsyncSessionLocal = _get_async_session_local()
+    async with AsyncSessionLocal() as session:
+        yield session
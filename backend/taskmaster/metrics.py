@@ -0,0 +1,387 @@
+"""In-process metrics rendered in the Prometheus text exposition format.
+
+A deliberately small subset of the Prometheus client model: counters, gauges and
+histograms with fixed label names, plus gauges whose samples are collected at
+scrape time. Recording is a dict lookup and a few additions under a lock, cheap
+enough to leave on in production. Label values must come from a bounded set
+(route templates, not raw paths).
+
+    GET /api/metrics
+"""
+
+from __future__ import annotations
+
+import abc
+import bisect
+import contextlib
+import math
+import threading
+import time
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+# OpenAI calls take seconds to minutes
+SLOW_CALL_BUCKETS: Tuple[float, ...] = (
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+)
+
+Labels = Tuple[str, ...]
+_M = TypeVar("_M", bound="_Metric")
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric(abc.ABC):
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _check_labels(self, values: Labels) -> None:
+        if len(values) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {values!r}"
+            )
+
+    @abc.abstractmethod
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        """Yield ``(suffix, formatted labels, value)`` for every series."""
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(
+            f"{self.name}{suffix}{labels} {_format_value(value)}"
+            for suffix, labels, value in self.samples()
+        )
+        return "\n".join(lines)
+
+
+class _ValueChild:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self, lock: threading.Lock) -> None:
+        self._lock = lock
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        with self._lock:
+            self.value = value
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self._children: Dict[Labels, _ValueChild] = {}
+
+    def labels(self, *values: str) -> _ValueChild:
+        child = self._children.get(values)
+        if child is None:
+            self._check_labels(values)
+            with self._lock:
+                child = self._children.setdefault(values, _ValueChild(self._lock))
+        return child
+
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        with self._lock:
+            children = list(self._children.items())
+        for values, child in children:
+            yield "", _format_labels(self.labelnames, values), child.value
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+
+class CallbackGauge(_Metric):
+    """Gauge whose samples are read from ``collect`` at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str],
+        collect: Callable[[], Iterable[Tuple[Labels, float]]],
+    ) -> None:
+        super().__init__(name, help, labelnames)
+        self._collect = collect
+
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        for values, value in self._collect():
+            yield "", _format_labels(self.labelnames, values), value
+
+
+class _HistogramChild:
+    __slots__ = ("_lock", "_buckets", "counts", "sum")
+
+    def __init__(self, lock: threading.Lock, buckets: Tuple[float, ...]) -> None:
+        self._lock = lock
+        self._buckets = buckets
+        # Per-bucket (not cumulative) counts; the last slot is +Inf
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self._buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    @contextlib.contextmanager
+    def time(self) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._children: Dict[Labels, _HistogramChild] = {}
+
+    def labels(self, *values: str) -> _HistogramChild:
+        child = self._children.get(values)
+        if child is None:
+            self._check_labels(values)
+            with self._lock:
+                child = self._children.setdefault(
+                    values, _HistogramChild(self._lock, self.buckets)
+                )
+        return child
+
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        with self._lock:
+            snapshot = [
+                (values, list(child.counts), child.sum)
+                for values, child in self._children.items()
+            ]
+        names = self.labelnames + ("le",)
+        for values, counts, total in snapshot:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                le = _format_value(bound)
+                yield "_bucket", _format_labels(names, values + (le,)), cumulative
+            labels = _format_labels(self.labelnames, values)
+            yield "_sum", labels, total
+            yield "_count", labels, cumulative
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _M) -> _M:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        return "\n".join(m.render() for m in self._metrics.values()) + "\n"
+
+
+REGISTRY = Registry()
+
+HTTP_REQUESTS = REGISTRY.register(
+    Counter(
+        "taskmaster_http_requests_total",
+        "HTTP requests handled, by route template and status code.",
+        ("method", "route", "status"),
+    )
+)
+HTTP_REQUEST_DURATION = REGISTRY.register(
+    Histogram(
+        "taskmaster_http_request_duration_seconds",
+        "Time from receiving a request until its response finished.",
+        ("method", "route"),
+    )
+)
+HTTP_REQUESTS_IN_FLIGHT = REGISTRY.register(
+    Gauge(
+        "taskmaster_http_requests_in_flight",
+        "Requests currently being handled, including open streams.",
+        ("method",),
+    )
+)
+DB_POOL_CHECKOUT_WAIT = REGISTRY.register(
+    Histogram(
+        "taskmaster_db_pool_checkout_wait_seconds",
+        "Time spent getting a connection from the pool, including connecting.",
+        ("engine",),
+    )
+)
+OPENAI_REQUEST_DURATION = REGISTRY.register(
+    Histogram(
+        "taskmaster_openai_request_duration_seconds",
+        "Latency of OpenAI API calls.",
+        ("operation", "outcome"),
+        buckets=SLOW_CALL_BUCKETS,
+    )
+)
+
+# Pools reported by taskmaster_db_pool_connections, keyed by engine label
+_POOLS: Dict[str, object] = {}
+
+
+def watch_pool(engine: str, pool: object) -> None:
+    """Report the size of ``pool`` (a SQLAlchemy ``QueuePool``) under ``engine``."""
+    _POOLS[engine] = pool
+
+
+def _collect_pool_connections() -> Iterator[Tuple[Labels, float]]:
+    for engine, pool in list(_POOLS.items()):
+        yield (engine, "checked_out"), pool.checkedout()  # type: ignore[attr-defined]
+        yield (engine, "idle"), pool.checkedin()  # type: ignore[attr-defined]
+        yield (engine, "overflow"), max(pool.overflow(), 0)  # type: ignore[attr-defined]
+
+
+DB_POOL_CONNECTIONS = REGISTRY.register(
+    CallbackGauge(
+        "taskmaster_db_pool_connections",
+        "Pooled database connections by state.",
+        ("engine", "state"),
+        _collect_pool_connections,
+    )
+)
+
+
+@contextlib.contextmanager
+def time_openai_call(operation: str) -> Iterator[None]:
+    start = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        OPENAI_REQUEST_DURATION.labels(operation, outcome).observe(
+            time.perf_counter() - start
+        )
+
+
+def render_latest() -> str:
+    return REGISTRY.render()
+
+
+_HTTP_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+
+
+class MetricsMiddleware:
+    """Record request count, latency and in-flight requests for HTTP routes.
+
+    Requests are labelled with the matched route's path template (set on the
+    scope by routing), so unmatched paths share one ``unmatched`` series. The
+    route is only known once routing ran, so in-flight requests are counted
+    per method.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method: str = scope["method"]
+        if method not in _HTTP_METHODS:
+            method = "OTHER"
+        status: Optional[int] = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        in_flight = HTTP_REQUESTS_IN_FLIGHT.labels(method)
+        in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            in_flight.dec()
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            # An exception escaping the app becomes a 500 further out
+            HTTP_REQUESTS.labels(method, route, str(status or 500)).inc()
+            HTTP_REQUEST_DURATION.labels(method, route).observe(elapsed)
@@ -0,0 +1,38 @@
+"""orjson-backed JSON encoding for the NDJSON and SSE task streams.
+
+JSON responses go through FastAPI's default path, which validates and dumps
+the handler's return value with pydantic straight to bytes. :func:`dumps`
+encodes models for the streams, which render each item themselves, with UUIDs,
+datetimes and enums handled natively and the same output pydantic gives.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any
+
+import orjson
+import pydantic
+
+# UTC datetimes end in "Z", as Fern's serialize_datetime renders them
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z
+
+
+@functools.lru_cache(maxsize=None)
+def _wire_names_are_field_names(model: type[pydantic.BaseModel]) -> bool:
+    return all(
+        field.alias in (None, name) for name, field in model.model_fields.items()
+    )
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, pydantic.BaseModel):
+        if _wire_names_are_field_names(type(obj)):
+            return obj.__dict__
+        return obj.model_dump(mode="json", by_alias=True)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+
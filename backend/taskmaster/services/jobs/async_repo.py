@@ -0,0 +1,43 @@
+"""Asyncio counterparts of the job repository functions used by the API.
+
+Like the task repository wrappers, these run :mod:`repo` through
+``AsyncSession.run_sync``; claiming and finishing jobs is done by the
+(synchronous) workers.
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import Any, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from taskmaster.api.resources.jobs.types.job import Job as ApiJob
+from taskmaster.db.models.job import JobKindEnum, JobRow
+from taskmaster.services.jobs import repo
+from taskmaster.tracing import traced
+
+
+@traced("repo.enqueue_job")
+async def enqueue_job(
+    session: AsyncSession,
+    *,
+    kind: JobKindEnum,
+    payload: Dict[str, Any],
+    input: Optional[bytes] = None,
+    max_attempts: int,
+    traceparent: Optional[str] = None,
+) -> ApiJob:
+    return await session.run_sync(
+        repo.enqueue_job,
+        kind=kind,
+        payload=payload,
+        input=input,
+        max_attempts=max_attempts,
+        traceparent=traceparent,
+    )
+
+
+@traced("repo.get_job")
+async def get_job(session: AsyncSession, *, job_id: uuid.UUID) -> Optional[JobRow]:
+    return await session.run_sync(repo.get_job, job_id=job_id)
@@ -0,0 +1,95 @@
+import typing
+import uuid
+
+import fastapi
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from taskmaster import tracing
+from taskmaster.api.core.exceptions.fern_http_exception import FernHTTPException
+from taskmaster.api.resources.jobs.service.service import AbstractJobsService
+from taskmaster.api.resources.jobs.types.job import Job
+from taskmaster.api.resources.tasks.types.generate_tasks_request import (
+    GenerateTasksRequest,
+)
+from taskmaster.api.resources.tasks.types.generate_tasks_response import (
+    GenerateTasksResponse,
+)
+from taskmaster.api.resources.transcription.types.transcription_response import (
+    TranscriptionResponse,
+)
+from taskmaster.config import get_settings
+from taskmaster.db.models.job import JobKindEnum, JobRow, JobStatusEnum
+from taskmaster.db.session import get_async_db_session
+from taskmaster.services.jobs import async_repo, repo
+
+
+class JobsService(AbstractJobsService):
+    def __init__(
+        self, db: AsyncSession = fastapi.Depends(get_async_db_session)
+    ) -> None:
+        self._db = db
+
+    async def _enqueue(
+        self,
+        kind: JobKindEnum,
+        payload: typing.Dict[str, typing.Any],
+        *,
+        max_attempts: int,
+        input: typing.Optional[bytes] = None,
+    ) -> Job:
+        return await async_repo.enqueue_job(
+            self._db,
+            kind=kind,
+            payload=payload,
+            input=input,
+            max_attempts=max_attempts,
+            traceparent=tracing.current_traceparent(),
+        )
+
+    async def submit_generate_tasks(self, *, body: GenerateTasksRequest) -> Job:
+        return await self._enqueue(
+            JobKindEnum.GENERATE_TASKS,
+            body.model_dump(mode="json"),
+            max_attempts=get_settings().job_generate_max_attempts,
+        )
+
+    async def submit_transcription(self, *, file: fastapi.UploadFile) -> Job:
+        contents = await file.read()
+        if not contents:
+            raise FernHTTPException(status_code=400, content="Audio file is empty")
+        return await self._enqueue(
+            JobKindEnum.TRANSCRIPTION,
+            {"filename": getattr(file, "filename", None) or "audio.webm"},
+            max_attempts=get_settings().job_max_attempts,
+            input=contents,
+        )
+
+    async def _get_job_row(self, job_id: uuid.UUID) -> JobRow:
+        row = await async_repo.get_job(self._db, job_id=job_id)
+        if row is None:
+            raise FernHTTPException(status_code=404, content="Job not found")
+        return row
+
+    async def _succeeded_result(
+        self, job_id: uuid.UUID, kind: JobKindEnum
+    ) -> typing.Dict[str, typing.Any]:
+        row = await self._get_job_row(job_id)
+        if row.kind is not kind:
+            raise FernHTTPException(status_code=404, content="Job not found")
+        if row.status is not JobStatusEnum.SUCCEEDED or row.result is None:
+            # Not done (or failed): hand back the job so clients see why
+            raise FernHTTPException(status_code=409, content=repo.to_api_job(row))
+        return row.result
+
+    async def get_job(self, *, id: uuid.UUID) -> Job:
+        return repo.to_api_job(await self._get_job_row(id))
+
+    async def get_generate_tasks_result(
+        self, *, id: uuid.UUID
+    ) -> GenerateTasksResponse:
+        result = await self._succeeded_result(id, JobKindEnum.GENERATE_TASKS)
+        return GenerateTasksResponse.model_validate(result)
+
+    async def get_transcription_result(self, *, id: uuid.UUID) -> TranscriptionResponse:
+        result = await self._succeeded_result(id, JobKindEnum.TRANSCRIPTION)
+        return TranscriptionResponse.model_validate(result)
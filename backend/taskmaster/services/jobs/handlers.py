@@ -0,0 +1,75 @@
+"""What each job kind runs.
+
+A handler gets a :class:`JobContext` and returns the JSON result stored on
+the job, which the result endpoints serve as the matching API model. Raising
+fails the attempt; the worker retries it unless the error is a ValueError
+(bad input that would fail again) or the job is out of attempts. Generation
+jobs get one attempt by default (``job_generate_max_attempts``): the agent's
+MCP tool calls have already written tasks by the time it can fail.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, ContextManager, Dict, Mapping
+
+from sqlalchemy.orm import Session
+
+from taskmaster.api.resources.tasks.types.generate_tasks_request import (
+    GenerateTasksRequest,
+)
+from taskmaster.api.resources.tasks.types.generate_tasks_response import (
+    GenerateTasksResponse,
+)
+from taskmaster.api.resources.transcription.types.transcription_response import (
+    TranscriptionResponse,
+)
+from taskmaster.db.models.job import JobKindEnum
+from taskmaster.services.jobs.repo import ClaimedJob
+from taskmaster.services.task_management import repo as task_repo
+from taskmaster.services.task_management.generation.agent import (
+    generate_tasks_with_agent,
+)
+from taskmaster.services.transcription.transcription import transcribe_audio_file
+
+
+@dataclass(frozen=True)
+class JobContext:
+    job: ClaimedJob
+    session: Callable[[], ContextManager[Session]]
+    # Records a progress stage on the job (and renews its lease)
+    report_progress: Callable[[str], None]
+
+
+JobHandler = Callable[[JobContext], Dict[str, Any]]
+
+
+def run_generate_tasks(ctx: JobContext) -> Dict[str, Any]:
+    body = GenerateTasksRequest.model_validate(ctx.job.payload)
+    # Like the synchronous endpoint, but with the tasks as of when the job runs
+    if body.existing_tasks is None:
+        ctx.report_progress("loading existing tasks")
+        with ctx.session() as session:
+            body.existing_tasks = task_repo.list_tasks(session)
+    resp = generate_tasks_with_agent(body, progress=ctx.report_progress)
+    tasks = resp.tasks
+    if not tasks:
+        with ctx.session() as session:
+            tasks = task_repo.list_tasks(session)
+    return GenerateTasksResponse(tasks=tasks).model_dump(mode="json")
+
+
+def run_transcription(ctx: JobContext) -> Dict[str, Any]:
+    if not ctx.job.input:
+        raise ValueError("Transcription job has no audio")
+    ctx.report_progress("transcribing")
+    text = transcribe_audio_file(
+        ctx.job.input, filename=ctx.job.payload.get("filename") or "audio.webm"
+    )
+    return TranscriptionResponse(text=text).model_dump(mode="json")
+
+
+HANDLERS: Mapping[JobKindEnum, JobHandler] = {
+    JobKindEnum.GENERATE_TASKS: run_generate_tasks,
+    JobKindEnum.TRANSCRIPTION: run_transcription,
+}
@@ -0,0 +1,224 @@
+"""Postgres-backed job queue.
+
+Jobs are rows in ``jobs``. Submitting inserts a QUEUED row and sends a
+``NOTIFY`` on :data:`JOBS_CHANNEL` (delivered on commit) to wake idle workers.
+Workers claim the earliest due job with ``FOR UPDATE SKIP LOCKED``, so any
+number of worker processes on any number of hosts can share the table without
+claiming the same job or waiting on each other's locks.
+
+A claim is a lease: the job is RUNNING and reserved for its worker until
+``run_after``, which the worker keeps pushing forward while it runs. A job
+whose lease ran out (the worker crashed or lost its connection) is due again
+and the next claim takes it over; writes from the old worker are then ignored
+because they are conditioned on ``locked_by``.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from taskmaster.api.resources.jobs.types.job import Job as ApiJob
+from taskmaster.api.resources.jobs.types.job_kind import JobKind as ApiJobKind
+from taskmaster.api.resources.jobs.types.job_status import JobStatus as ApiJobStatus
+from taskmaster.db.models.job import JobKindEnum, JobRow, JobStatusEnum
+
+JOBS_CHANNEL = "jobs"
+
+_UNFINISHED = (JobStatusEnum.QUEUED, JobStatusEnum.RUNNING)
+
+
+@dataclass(frozen=True)
+class ClaimedJob:
+    id: uuid.UUID
+    kind: JobKindEnum
+    payload: Dict[str, Any]
+    input: Optional[bytes]
+    attempts: int
+    max_attempts: int
+    error: Optional[str]
+    traceparent: Optional[str]
+
+
+def to_api_job(row: JobRow) -> ApiJob:
+    return ApiJob.model_construct(
+        id=row.id,
+        kind=ApiJobKind(row.kind.value),
+        status=ApiJobStatus(row.status.value),
+        progress=row.progress,
+        attempts=row.attempts,
+        error=row.error,
+        created_at=row.created_at,
+        started_at=row.started_at,
+        finished_at=row.finished_at,
+    )
+
+
+def enqueue_job(
+    session: Session,
+    *,
+    kind: JobKindEnum,
+    payload: Dict[str, Any],
+    input: Optional[bytes] = None,
+    max_attempts: int,
+    traceparent: Optional[str] = None,
+) -> ApiJob:
+    row = JobRow(
+        kind=kind,
+        payload=payload,
+        input=input,
+        max_attempts=max_attempts,
+        traceparent=traceparent,
+    )
+    session.add(row)
+    session.flush()
+    session.execute(select(func.pg_notify(JOBS_CHANNEL, kind.value)))
+    session.commit()
+    return to_api_job(row)
+
+
+def get_job(session: Session, *, job_id: uuid.UUID) -> Optional[JobRow]:
+    return session.get(JobRow, job_id)
+
+
+def claim_job(
+    session: Session,
+    *,
+    worker_id: str,
+    lease_seconds: float,
+    kinds: Optional[Sequence[JobKindEnum]] = None,
+) -> Optional[ClaimedJob]:
+    """Lease the earliest due job to ``worker_id`` and return it, if any.
+
+    Rows locked by a concurrent claim are skipped rather than waited for, so
+    concurrent workers each get a different job. The claim is committed
+    before returning; the job then belongs to the worker until its lease
+    runs out.
+    """
+    due = (
+        select(JobRow.id)
+        .where(JobRow.status.in_(_UNFINISHED), JobRow.run_after <= func.now())
+        .order_by(JobRow.run_after)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+    if kinds:
+        due = due.where(JobRow.kind.in_(kinds))
+    stmt = (
+        update(JobRow)
+        .where(JobRow.id == due.scalar_subquery())
+        .values(
+            status=JobStatusEnum.RUNNING,
+            attempts=JobRow.attempts + 1,
+            locked_by=worker_id,
+            run_after=func.now() + dt.timedelta(seconds=lease_seconds),
+            started_at=func.coalesce(JobRow.started_at, func.now()),
+            progress=None,
+        )
+        .returning(
+            JobRow.id,
+            JobRow.kind,
+            JobRow.payload,
+            JobRow.input,
+            JobRow.attempts,
+            JobRow.max_attempts,
+            JobRow.error,
+            JobRow.traceparent,
+        )
+    )
+    claimed = session.execute(stmt).one_or_none()
+    session.commit()
+    if claimed is None:
+        return None
+    return ClaimedJob(**claimed._asdict())
+
+
+def _update_leased(
+    session: Session, *, job_id: uuid.UUID, worker_id: str, **values: Any
+) -> bool:
+    # Only the worker currently holding the lease may write the job
+    result = session.execute(
+        update(JobRow)
+        .where(
+            JobRow.id == job_id,
+            JobRow.locked_by == worker_id,
+            JobRow.status == JobStatusEnum.RUNNING,
+        )
+        .values(**values)
+    )
+    session.commit()
+    return result.rowcount == 1  # type: ignore[attr-defined]
+
+
+def renew_lease(
+    session: Session,
+    *,
+    job_id: uuid.UUID,
+    worker_id: str,
+    lease_seconds: float,
+    progress: Optional[str] = None,
+) -> bool:
+    """Extend the lease, recording ``progress`` if given.
+
+    Returns False when the worker no longer holds the job.
+    """
+    values: Dict[str, Any] = {
+        "run_after": func.now() + dt.timedelta(seconds=lease_seconds)
+    }
+    if progress is not None:
+        values["progress"] = progress
+    return _update_leased(session, job_id=job_id, worker_id=worker_id, **values)
+
+
+def complete_job(
+    session: Session, *, job_id: uuid.UUID, worker_id: str, result: Dict[str, Any]
+) -> bool:
+    return _update_leased(
+        session,
+        job_id=job_id,
+        worker_id=worker_id,
+        status=JobStatusEnum.SUCCEEDED,
+        result=result,
+        error=None,
+        progress=None,
+        input=None,
+        locked_by=None,
+        finished_at=func.now(),
+    )
+
+
+def fail_job(
+    session: Session,
+    *,
+    job_id: uuid.UUID,
+    worker_id: str,
+    error: str,
+    retry_in_seconds: Optional[float],
+) -> bool:
+    """Record a failed attempt: queue a retry, or mark the job FAILED when
+    ``retry_in_seconds`` is None."""
+    if retry_in_seconds is None:
+        values: Dict[str, Any] = {
+            "status": JobStatusEnum.FAILED,
+            "input": None,
+            "finished_at": func.now(),
+        }
+    else:
+        values = {
+            "status": JobStatusEnum.QUEUED,
+            "run_after": func.now() + dt.timedelta(seconds=retry_in_seconds),
+        }
+    return _update_leased(
+        session,
+        job_id=job_id,
+        worker_id=worker_id,
+        error=error,
+        progress=None,
+        locked_by=None,
+        **values,
+    )
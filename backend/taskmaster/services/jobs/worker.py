@@ -0,0 +1,279 @@
+"""Job worker runtime.
+
+Run one or more worker processes next to the API, on any host that reaches
+the database::
+
+    cd backend
+    uv run python -m taskmaster.services.jobs.worker --concurrency 2
+
+Each process runs ``--concurrency`` worker threads that claim and run jobs
+(see :mod:`taskmaster.services.jobs.repo` for the claim protocol), plus one
+``LISTEN`` connection that wakes idle threads when a job is submitted. Idle
+threads also poll every ``job_poll_interval_seconds`` so retries that became
+due are picked up. While a job runs, a heartbeat renews its lease.
+
+SIGINT/SIGTERM stop claiming new jobs and wait for running ones to finish; a
+process that dies mid-job leaves it to be claimed again when its lease
+expires.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import signal
+import socket
+import threading
+import uuid
+from typing import Callable, ContextManager, List, Mapping, Optional, Sequence
+
+import psycopg
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+
+from taskmaster.config import get_settings
+from taskmaster.db.models.job import JobKindEnum
+from taskmaster.services.jobs import repo
+from taskmaster.services.jobs.handlers import HANDLERS, JobContext, JobHandler
+from taskmaster.tracing import get_tracer
+
+_LOGGER = logging.getLogger(__name__)
+
+SessionFactory = Callable[[], ContextManager[Session]]
+
+
+class _Heartbeat:
+    """Renew a job's lease in the background while it runs."""
+
+    def __init__(self, renew: Callable[[], bool], interval_seconds: float) -> None:
+        self._renew = renew
+        self._interval_seconds = interval_seconds
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> _Heartbeat:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval_seconds):
+            try:
+                if not self._renew():
+                    _LOGGER.warning("Lost the lease of a running job")
+                    return
+            except Exception:
+                _LOGGER.exception("Job heartbeat failed; retrying")
+
+
+class Worker:
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        *,
+        worker_id: Optional[str] = None,
+        handlers: Mapping[JobKindEnum, JobHandler] = HANDLERS,
+        kinds: Optional[Sequence[JobKindEnum]] = None,
+        lease_seconds: Optional[float] = None,
+        retry_backoff_seconds: Optional[float] = None,
+    ) -> None:
+        settings = get_settings()
+        self._sessions = session_factory
+        self.worker_id = worker_id or (
+            f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )
+        self._handlers = handlers
+        self._kinds = kinds
+        self._lease_seconds = lease_seconds or settings.job_lease_seconds
+        self._retry_backoff_seconds = (
+            settings.job_retry_backoff_seconds
+            if retry_backoff_seconds is None
+            else retry_backoff_seconds
+        )
+
+    def _renew(self, job: repo.ClaimedJob, progress: Optional[str] = None) -> bool:
+        with self._sessions() as session:
+            return repo.renew_lease(
+                session,
+                job_id=job.id,
+                worker_id=self.worker_id,
+                lease_seconds=self._lease_seconds,
+                progress=progress,
+            )
+
+    def run_once(self) -> bool:
+        """Claim and run one job; False when none was due."""
+        with self._sessions() as session:
+            job = repo.claim_job(
+                session,
+                worker_id=self.worker_id,
+                lease_seconds=self._lease_seconds,
+                kinds=self._kinds,
+            )
+        if job is None:
+            return False
+
+        if job.attempts > job.max_attempts:
+            # Earlier workers lost the lease on every attempt (crashed or hung)
+            self._fail(job, job.error or "Worker lost the job's lease", retry=False)
+            return True
+
+        with get_tracer().start_span(
+            f"job.{job.kind.value.lower()}",
+            attributes={"job.id": str(job.id), "job.attempt": job.attempts},
+            traceparent=job.traceparent,
+        ):
+            ctx = JobContext(
+                job=job,
+                session=self._sessions,
+                report_progress=lambda stage: self._report(job, stage),
+            )
+            try:
+                with _Heartbeat(lambda: self._renew(job), self._lease_seconds / 3):
+                    result = self._handlers[job.kind](ctx)
+            except Exception as exc:
+                _LOGGER.exception(
+                    "Job %s (%s) attempt %d failed",
+                    job.id,
+                    job.kind.value,
+                    job.attempts,
+                )
+                self._fail(
+                    job,
+                    f"{type(exc).__name__}: {exc}",
+                    retry=not isinstance(exc, ValueError),
+                )
+                return True
+
+        with self._sessions() as session:
+            if not repo.complete_job(
+                session, job_id=job.id, worker_id=self.worker_id, result=result
+            ):
+                _LOGGER.warning("Job %s finished after its lease moved on", job.id)
+        return True
+
+    def _report(self, job: repo.ClaimedJob, stage: str) -> None:
+        try:
+            self._renew(job, progress=stage)
+        except Exception:
+            # Progress is informational; never fail the job over it
+            _LOGGER.exception("Could not record progress of job %s", job.id)
+
+    def _fail(self, job: repo.ClaimedJob, error: str, *, retry: bool) -> None:
+        retry_in: Optional[float] = None
+        if retry and job.attempts < job.max_attempts:
+            retry_in = self._retry_backoff_seconds * 2 ** (job.attempts - 1)
+        with self._sessions() as session:
+            repo.fail_job(
+                session,
+                job_id=job.id,
+                worker_id=self.worker_id,
+                error=error,
+                retry_in_seconds=retry_in,
+            )
+
+    def run(
+        self,
+        stop: threading.Event,
+        *,
+        wakeup: Optional[threading.Event] = None,
+        poll_interval_seconds: Optional[float] = None,
+    ) -> None:
+        """Run jobs until ``stop`` is set, sleeping on ``wakeup`` when idle."""
+        wakeup = wakeup or threading.Event()
+        interval = poll_interval_seconds or get_settings().job_poll_interval_seconds
+        while not stop.is_set():
+            try:
+                if self.run_once():
+                    continue
+            except Exception:
+                # e.g. the database is unreachable; back off and try again
+                _LOGGER.exception("Job worker %s failed to claim", self.worker_id)
+            wakeup.wait(interval)
+            wakeup.clear()
+
+
+def listen_for_jobs(
+    dsn: str,
+    wakeup: threading.Event,
+    stop: threading.Event,
+    *,
+    timeout_seconds: float = 1.0,
+) -> None:
+    """Set ``wakeup`` whenever a job is submitted, until ``stop`` is set."""
+    while not stop.is_set():
+        try:
+            with psycopg.connect(dsn, autocommit=True) as conn:
+                conn.execute(f'LISTEN "{repo.JOBS_CHANNEL}"')
+                # Submissions while we were not listening are unknown
+                wakeup.set()
+                while not stop.is_set():
+                    for _ in conn.notifies(timeout=timeout_seconds, stop_after=1):
+                        wakeup.set()
+        except Exception:
+            _LOGGER.exception("Job listener failed; reconnecting")
+            stop.wait(timeout_seconds)
+
+
+def main() -> int:
+    from taskmaster.db.session import _get_session_local
+
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description="Run generation/transcription jobs.")
+    parser.add_argument(
+        "--concurrency", type=int, default=settings.job_worker_concurrency
+    )
+    parser.add_argument(
+        "--kind",
+        action="append",
+        choices=[kind.value for kind in JobKindEnum],
+        help="Only run jobs of this kind (repeatable; default all).",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s %(message)s"
+    )
+
+    stop = threading.Event()
+    wakeup = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: stop.set())
+
+    dsn = make_url(settings.get_database_url()).set(drivername="postgresql")
+    threads: List[threading.Thread] = [
+        threading.Thread(
+            target=listen_for_jobs,
+            args=(dsn.render_as_string(hide_password=False), wakeup, stop),
+            name="job-listener",
+            daemon=True,
+        )
+    ]
+    kinds = [JobKindEnum(kind) for kind in args.kind] if args.kind else None
+    sessions = _get_session_local()
+    for index in range(args.concurrency):
+        worker = Worker(sessions, kinds=kinds)
+        threads.append(
+            threading.Thread(
+                target=worker.run,
+                args=(stop,),
+                kwargs={"wakeup": wakeup},
+                name=f"job-worker-{index}",
+            )
+        )
+    for thread in threads:
+        thread.start()
+    _LOGGER.info("Job worker started with %d threads", args.concurrency)
+    while not stop.wait(1.0):
+        pass
+    _LOGGER.info("Stopping; waiting for running jobs to finish")
+    for thread in threads[1:]:
+        thread.join()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
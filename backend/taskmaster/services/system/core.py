@@ -1,7 +1,16 @@
+import fastapi
+
+from taskmaster import metrics
 from taskmaster.api.resources.system.service.service import AbstractSystemService
 from taskmaster.api.resources.system.types.health_response import HealthResponse
+from taskmaster.utils import SingletonService
 
 
-class SystemService(AbstractSystemService):
-    def get_health(self) -> HealthResponse:
+class SystemService(SingletonService, AbstractSystemService):
+    async def get_health(self) -> HealthResponse:
         return HealthResponse(status="OK")
+
+    async def get_metrics(self) -> fastapi.Response:
+        return fastapi.Response(
+            content=metrics.render_latest(), media_type=metrics.CONTENT_TYPE
+        )
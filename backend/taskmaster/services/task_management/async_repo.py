@@ -0,0 +1,200 @@
+"""Asyncio counterparts of the task repository functions.
+
+The query and write logic lives in :mod:`repo`; these wrappers run it through
+``AsyncSession.run_sync`` so that database I/O happens on the event loop via
+the async driver instead of a threadpool worker. Streaming reads use the
+native async result API. Each call runs in a tracing span named after the
+repo function.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import uuid
+from typing import Any, AsyncIterator, Iterable, List, Mapping, Optional, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from taskmaster.api.resources.tasks.types.batch_task_operation import (
+    BatchTaskOperation,
+)
+from taskmaster.api.resources.tasks.types.batch_tasks_response import (
+    BatchTasksResponse,
+)
+from taskmaster.api.resources.tasks.types.create_task_request import CreateTaskRequest
+from taskmaster.api.resources.tasks.types.import_tasks_response import (
+    ImportTasksResponse,
+)
+from taskmaster.api.resources.tasks.types.ranked_task import RankedTask
+from taskmaster.api.resources.tasks.types.task import Task as ApiTask
+from taskmaster.api.resources.tasks.types.task_changes_response import (
+    TaskChangesResponse,
+)
+from taskmaster.api.resources.tasks.types.task_order import TaskOrder as ApiTaskOrder
+from taskmaster.api.resources.tasks.types.similar_task import SimilarTask
+from taskmaster.api.resources.tasks.types.task_search_result import TaskSearchResult
+from taskmaster.api.resources.tasks.types.task_status import TaskStatus as ApiTaskStatus
+from taskmaster.api.resources.tasks.types.update_task_request import UpdateTaskRequest
+from taskmaster.db.models.task import TaskRow
+from taskmaster.services.task_management import repo, scoring
+from taskmaster.tracing import traced
+
+
+@traced("repo.get_task_by_title")
+async def get_task_by_title(session: AsyncSession, *, title: str) -> Optional[TaskRow]:
+    return await session.run_sync(repo.get_task_by_title, title=title)
+
+
+@traced("repo.list_tasks")
+async def list_tasks(
+    session: AsyncSession,
+    *,
+    limit: Optional[int] = None,
+    cursor: Optional[uuid.UUID] = None,
+    statuses: Optional[Sequence[ApiTaskStatus]] = None,
+    deadline_after: Optional[dt.datetime] = None,
+    deadline_before: Optional[dt.datetime] = None,
+    priority_min: Optional[int] = None,
+    priority_max: Optional[int] = None,
+    order: Optional[ApiTaskOrder] = None,
+) -> List[ApiTask]:
+    return await session.run_sync(
+        repo.list_tasks,
+        limit=limit,
+        cursor=cursor,
+        statuses=statuses,
+        deadline_after=deadline_after,
+        deadline_before=deadline_before,
+        priority_min=priority_min,
+        priority_max=priority_max,
+        order=order,
+    )
+
+
+async def iter_tasks(
+    session: AsyncSession,
+    *,
+    batch_size: int = 500,
+    statuses: Optional[Sequence[ApiTaskStatus]] = None,
+    deadline_after: Optional[dt.datetime] = None,
+    deadline_before: Optional[dt.datetime] = None,
+    priority_min: Optional[int] = None,
+    priority_max: Optional[int] = None,
+) -> AsyncIterator[ApiTask]:
+    stmt = repo._select_tasks(
+        statuses=statuses,
+        deadline_after=deadline_after,
+        deadline_before=deadline_before,
+        priority_min=priority_min,
+        priority_max=priority_max,
+    ).execution_options(yield_per=batch_size)
+    result = await session.stream_scalars(stmt)
+    async for row in result:
+        yield repo._to_api_task(row)
+
+
+@traced("repo.get_task_ancestors")
+async def get_task_ancestors(
+    session: AsyncSession, *, title: str, max_depth: Optional[int] = None
+) -> Optional[List[ApiTask]]:
+    return await session.run_sync(
+        repo.get_task_ancestors, title=title, max_depth=max_depth
+    )
+
+
+@traced("repo.get_task_descendants")
+async def get_task_descendants(
+    session: AsyncSession, *, title: str, max_depth: Optional[int] = None
+) -> Optional[List[ApiTask]]:
+    return await session.run_sync(
+        repo.get_task_descendants, title=title, max_depth=max_depth
+    )
+
+
+@traced("repo.search_tasks")
+async def search_tasks(
+    session: AsyncSession,
+    *,
+    query: str,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    statuses: Optional[Sequence[ApiTaskStatus]] = None,
+) -> List[TaskSearchResult]:
+    return await session.run_sync(
+        repo.search_tasks, query=query, limit=limit, offset=offset, statuses=statuses
+    )
+
+
+@traced("repo.find_similar_tasks")
+async def find_similar_tasks(
+    session: AsyncSession,
+    *,
+    title: str,
+    threshold: Optional[float] = None,
+    limit: Optional[int] = None,
+) -> List[SimilarTask]:
+    return await session.run_sync(
+        repo.find_similar_tasks, title=title, threshold=threshold, limit=limit
+    )
+
+
+@traced("repo.get_change_version")
+async def get_change_version(session: AsyncSession) -> Optional[int]:
+    return await session.run_sync(repo.get_change_version)
+
+
+@traced("repo.check_changes_available")
+async def check_changes_available(session: AsyncSession, *, since: int) -> None:
+    await session.run_sync(repo.check_changes_available, since=since)
+
+
+@traced("repo.get_task_changes")
+async def get_task_changes(
+    session: AsyncSession, *, since: int = 0
+) -> TaskChangesResponse:
+    return await session.run_sync(repo.get_task_changes, since=since)
+
+
+@traced("repo.rank_tasks")
+async def rank_tasks(
+    session: AsyncSession, *, limit: Optional[int] = None
+) -> List[RankedTask]:
+    return await session.run_sync(scoring.rank_tasks, limit=limit)
+
+
+@traced("repo.create_task")
+async def create_task(session: AsyncSession, *, body: CreateTaskRequest) -> ApiTask:
+    return await session.run_sync(repo.create_task, body=body)
+
+
+@traced("repo.update_task_by_title")
+async def update_task_by_title(
+    session: AsyncSession, *, title: str, body: UpdateTaskRequest
+) -> Optional[ApiTask]:
+    return await session.run_sync(repo.update_task_by_title, title=title, body=body)
+
+
+@traced("repo.delete_task_by_title")
+async def delete_task_by_title(
+    session: AsyncSession, *, title: str
+) -> Optional[ApiTask]:
+    return await session.run_sync(repo.delete_task_by_title, title=title)
+
+
+@traced("repo.bulk_import_tasks")
+async def bulk_import_tasks(
+    session: AsyncSession, *, records: Iterable[Mapping[str, Any]]
+) -> ImportTasksResponse:
+    return await session.run_sync(repo.bulk_import_tasks, records=records)
+
+
+@traced("repo.apply_batch")
+async def apply_batch(
+    session: AsyncSession,
+    *,
+    operations: Sequence[BatchTaskOperation],
+    atomic: bool = False,
+) -> BatchTasksResponse:
+    return await session.run_sync(
+        repo.apply_batch, operations=operations, atomic=atomic
+    )
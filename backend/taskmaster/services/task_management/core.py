@@ -1,59 +1,458 @@
+import asyncio
+import contextvars
+import datetime as dt
+import hashlib
+import json
+import logging
+import threading
+import typing
+import uuid
+
 from taskmaster.api.resources.tasks.service.service import AbstractTasksService
 from taskmaster.api.resources.tasks.types.task import Task
+from taskmaster.api.resources.tasks.types.task_changes_response import (
+    TaskChangesResponse,
+)
+from taskmaster.api.resources.tasks.types.task_order import TaskOrder
+from taskmaster.api.resources.tasks.types.task_status import TaskStatus
+from taskmaster.api.resources.tasks.types.batch_tasks_request import BatchTasksRequest
+from taskmaster.api.resources.tasks.types.batch_tasks_response import (
+    BatchTasksResponse,
+)
 from taskmaster.api.resources.tasks.types.create_task_request import CreateTaskRequest
 from taskmaster.api.resources.tasks.types.update_task_request import UpdateTaskRequest
 from taskmaster.api.resources.tasks.types.delete_task_request import DeleteTaskRequest
+from taskmaster.api.resources.tasks.types.generate_tasks_event import (
+    GenerateTasksEvent,
+)
+from taskmaster.api.resources.tasks.types.generate_tasks_event_type import (
+    GenerateTasksEventType,
+)
 from taskmaster.api.resources.tasks.types.generate_tasks_request import (
     GenerateTasksRequest,
 )
 from taskmaster.api.resources.tasks.types.generate_tasks_response import (
     GenerateTasksResponse,
 )
+from taskmaster.api.resources.tasks.types.import_tasks_response import (
+    ImportTasksResponse,
+)
+from taskmaster.api.resources.tasks.types.ranked_task import RankedTask
+from taskmaster.api.resources.tasks.types.similar_task import SimilarTask
+from taskmaster.api.resources.tasks.types.task_search_result import TaskSearchResult
 from taskmaster.api.core.exceptions.fern_http_exception import FernHTTPException
-from taskmaster.db.session import get_db_session
-from sqlalchemy.orm import Session
+from taskmaster.db.session import get_async_db_session
+from sqlalchemy.ext.asyncio import AsyncSession
 import fastapi
+from fastapi.responses import Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 
-from taskmaster.services.task_management import repo
+from taskmaster import tracing
+from taskmaster.responses import dumps
+from taskmaster.services.task_management import async_repo
+from taskmaster.services.task_management.repo import ChangesPruned, SimilarTasksExist
+from taskmaster.services.task_management.importer import read_import_records
+from taskmaster.services.task_management.notifications import (
+    NotificationHub,
+    get_notification_hub,
+)
 from taskmaster.services.task_management.generation.agent import (
     generate_tasks_with_agent,
+    stream_tasks_with_agent,
 )
 
+_LOGGER = logging.getLogger(__name__)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+SSE_MEDIA_TYPE = "text/event-stream"
+# Comment lines keep idle SSE connections from being closed by proxies
+SSE_KEEPALIVE_SECONDS = 15.0
+# How soon a stream without a starting version asks again while writes run
+_CHANGE_VERSION_RETRY_SECONDS = 0.05
+
+
+def _task_list_etag(version: int, **params: typing.Any) -> str:
+    # The change version moves on every write, so (version, request) pins the
+    # response body; the digest keeps different filters/pages apart.
+    digest = hashlib.blake2b(
+        json.dumps(params, sort_keys=True, default=str).encode(), digest_size=8
+    ).hexdigest()
+    return f'"{version}-{digest}"'
+
+
+def _etag_matches(if_none_match: typing.Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison, as RFC 9110 prescribes for If-None-Match
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
+
+async def _aiter(items: typing.Iterable[Task]) -> typing.AsyncIterator[Task]:
+    for item in items:
+        yield item
+
+
+async def _task_change_events(
+    db: AsyncSession, hub: NotificationHub, *, since: typing.Optional[int]
+) -> typing.AsyncIterator[str]:
+    # Subscribe before the first read so a commit in between still wakes us
+    async with hub.subscribe() as wakeups:
+        while since is None:
+            since = await async_repo.get_change_version(db)
+            if since is None:
+                # Writes are in flight; they finish within a few statements
+                await db.close()
+                await asyncio.sleep(_CHANGE_VERSION_RETRY_SECONDS)
+        first = True
+        while True:
+            try:
+                changes = await async_repo.get_task_changes(db, since=since)
+            except ChangesPruned as exc:
+                # Deletes we would have sent are gone: the client starts over
+                await db.close()
+                yield f"event: resync\ndata: {dumps({'error': str(exc)}).decode()}\n\n"
+                return
+            # Give the connection back to the pool while waiting
+            await db.close()
+            if first or changes.tasks or changes.deleted:
+                yield (
+                    f"event: changes\nid: {changes.version}\n"
+                    f"data: {dumps(changes).decode()}\n\n"
+                )
+            first = False
+            since = changes.version
+
+            while True:
+                try:
+                    await asyncio.wait_for(wakeups.get(), SSE_KEEPALIVE_SECONDS)
+                    break
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+            # Notifications that piled up meanwhile are covered by one read
+            while not wakeups.empty():
+                wakeups.get_nowait()
+
+
+# Marks the end of the agent thread's events
+_STREAM_END = object()
+
+
+async def _generate_task_events(
+    db: AsyncSession, body: GenerateTasksRequest
+) -> typing.AsyncIterator[str]:
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue[typing.Any] = asyncio.Queue()
+    stopped = threading.Event()
+
+    def run_agent() -> None:
+        # One thread for the whole run: the agent's spans stay in one context
+        agent = stream_tasks_with_agent(body)
+        try:
+            for event in agent:
+                loop.call_soon_threadsafe(events.put_nowait, event)
+                if stopped.is_set():
+                    break
+        except Exception as exc:
+            _LOGGER.exception("Streaming task generation failed")
+            error = GenerateTasksEvent(
+                type=GenerateTasksEventType.ERROR,
+                error=f"{type(exc).__name__}: {exc}",
+            )
+            loop.call_soon_threadsafe(events.put_nowait, error)
+        finally:
+            agent.close()
+            loop.call_soon_threadsafe(events.put_nowait, _STREAM_END)
+
+    threading.Thread(
+        target=contextvars.copy_context().run,
+        args=(run_agent,),
+        name="generate-tasks-stream",
+        daemon=True,
+    ).start()
+    try:
+        while True:
+            try:
+                event = await asyncio.wait_for(events.get(), SSE_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if event is _STREAM_END:
+                return
+            if event.type is GenerateTasksEventType.DONE and not event.tasks:
+                # Like generate-tasks, fall back to listing current tasks
+                event = GenerateTasksEvent(
+                    type=GenerateTasksEventType.DONE,
+                    tasks=await async_repo.list_tasks(db),
+                )
+            yield (
+                f"event: {event.type.value.lower()}\n"
+                f"data: {dumps(event).decode()}\n\n"
+            )
+    finally:
+        # The client went away (or the run ended): stop at the agent's next event
+        stopped.set()
+
 
 class TasksService(AbstractTasksService):
-    def __init__(self, db: Session = fastapi.Depends(get_db_session)) -> None:
+    def __init__(
+        self, db: AsyncSession = fastapi.Depends(get_async_db_session)
+    ) -> None:
         self._db = db
 
-    def create_task(self, *, body: CreateTaskRequest) -> Task:
+    async def create_task(self, *, body: CreateTaskRequest) -> Task:
         try:
-            return repo.create_task(self._db, body=body)
+            return await async_repo.create_task(self._db, body=body)
+        except SimilarTasksExist as exc:
+            raise FernHTTPException(
+                status_code=409,
+                content={"message": str(exc), "similar_tasks": exc.matches},
+            )
         except ValueError as exc:
             raise FernHTTPException(status_code=400, content=str(exc))
 
-    def update_task(self, *, body: UpdateTaskRequest) -> Task:
+    async def update_task(self, *, body: UpdateTaskRequest) -> Task:
         try:
-            updated = repo.update_task_by_title(self._db, title=body.title, body=body)
+            updated = await async_repo.update_task_by_title(
+                self._db, title=body.title, body=body
+            )
         except ValueError as exc:
             raise FernHTTPException(status_code=400, content=str(exc))
         if updated is None:
             raise FernHTTPException(status_code=404, content="Task not found")
         return updated
 
-    def delete_task(self, *, body: DeleteTaskRequest) -> Task:
-        deleted = repo.delete_task_by_title(self._db, title=body.title)
+    async def delete_task(self, *, body: DeleteTaskRequest) -> Task:
+        deleted = await async_repo.delete_task_by_title(self._db, title=body.title)
         if deleted is None:
             raise FernHTTPException(status_code=404, content="Task not found")
         return deleted
 
-    def get_tasks(self) -> list[Task]:
-        return repo.list_tasks(self._db)
+    async def get_tasks(  # type: ignore[override]
+        self,
+        *,
+        limit: typing.Optional[int] = None,
+        cursor: typing.Optional[uuid.UUID] = None,
+        status: typing.Optional[typing.List[TaskStatus]] = None,
+        deadline_after: typing.Optional[dt.datetime] = None,
+        deadline_before: typing.Optional[dt.datetime] = None,
+        priority_min: typing.Optional[int] = None,
+        priority_max: typing.Optional[int] = None,
+        order: typing.Optional[TaskOrder] = None,
+        accept: typing.Optional[str] = None,
+        if_none_match: typing.Optional[str] = None,
+        # Injected by FastAPI: carries the ETag of the JSON body
+        response: Response,
+    ) -> typing.Union[typing.List[Task], Response]:
+        ndjson = bool(accept and NDJSON_MEDIA_TYPE in accept)
+        version = await async_repo.get_change_version(self._db)
+        # Without a settled version (writes in flight) the response gets no ETag
+        headers: typing.Dict[str, str] = {}
+        if version is not None:
+            etag = _task_list_etag(
+                version,
+                limit=limit,
+                cursor=cursor,
+                status=status,
+                deadline_after=deadline_after,
+                deadline_before=deadline_before,
+                priority_min=priority_min,
+                priority_max=priority_max,
+                order=order,
+                ndjson=ndjson,
+            )
+            if _etag_matches(if_none_match, etag):
+                # Nothing was written since the client's copy: skip the query entirely
+                return Response(status_code=304, headers={"ETag": etag})
+            headers["ETag"] = etag
+        if ndjson:
+            filters = dict(
+                statuses=status,
+                deadline_after=deadline_after,
+                deadline_before=deadline_before,
+                priority_min=priority_min,
+                priority_max=priority_max,
+            )
+            if order is TaskOrder.TOPOLOGICAL:
+                # Depths need the whole graph first, so there is nothing to stream
+                # incrementally from the database
+                try:
+                    listed = await async_repo.list_tasks(
+                        self._db, order=order, **filters
+                    )
+                except ValueError as exc:
+                    raise FernHTTPException(status_code=400, content=str(exc))
+                tasks = _aiter(listed)
+            else:
+                tasks = async_repo.iter_tasks(self._db, **filters)
+            # Returned as-is by FastAPI, bypassing response_model serialization
+            return StreamingResponse(
+                (dumps(task) + b"\n" async for task in tasks),
+                media_type=NDJSON_MEDIA_TYPE,
+                headers=headers,
+            )
+        try:
+            tasks = await async_repo.list_tasks(
+                self._db,
+                limit=limit,
+                cursor=cursor,
+                statuses=status,
+                deadline_after=deadline_after,
+                deadline_before=deadline_before,
+                priority_min=priority_min,
+                priority_max=priority_max,
+                order=order,
+            )
+        except ValueError as exc:
+            raise FernHTTPException(status_code=400, content=str(exc))
+        response.headers.update(headers)
+        return tasks
 
-    def generate_tasks(self, *, body: GenerateTasksRequest) -> GenerateTasksResponse:
+    async def generate_tasks(
+        self, *, body: GenerateTasksRequest
+    ) -> GenerateTasksResponse:
         # Ensure existing tasks are available to the agent
         if body.existing_tasks is None:
-            body.existing_tasks = repo.list_tasks(self._db)
+            body.existing_tasks = await async_repo.list_tasks(self._db)
         # Run multi-turn GPT-5 agent to perform task mutations via MCP tools
-        resp = generate_tasks_with_agent(body)
+        # The agent blocks on OpenAI for the whole run, so keep it off the event loop
+        with tracing.span("agent.generate_tasks"):
+            resp = await run_in_threadpool(generate_tasks_with_agent, body)
         # If agent didn't return tasks, fall back to listing current tasks
-        tasks = resp.tasks or repo.list_tasks(self._db)
+        tasks = resp.tasks or await async_repo.list_tasks(self._db)
         return GenerateTasksResponse(tasks=tasks)
+
+    async def stream_generate_tasks(
+        self, *, body: GenerateTasksRequest
+    ) -> StreamingResponse:
+        if body.existing_tasks is None:
+            body.existing_tasks = await async_repo.list_tasks(self._db)
+        # Nothing else is read until the agent is done; free the connection
+        await self._db.close()
+        return StreamingResponse(
+            _generate_task_events(self._db, body),
+            media_type=SSE_MEDIA_TYPE,
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    async def import_tasks(self, *, file: fastapi.UploadFile) -> ImportTasksResponse:
+        records = read_import_records(file.file, filename=file.filename)
+        try:
+            return await async_repo.bulk_import_tasks(self._db, records=records)
+        except ValueError as exc:
+            raise FernHTTPException(status_code=400, content=str(exc))
+
+    async def batch_tasks(self, *, body: BatchTasksRequest) -> BatchTasksResponse:
+        try:
+            return await async_repo.apply_batch(
+                self._db, operations=body.operations, atomic=bool(body.atomic)
+            )
+        except ValueError as exc:
+            raise FernHTTPException(status_code=400, content=str(exc))
+
+    async def get_task_ancestors(
+        self, *, title: str, max_depth: typing.Optional[int] = None
+    ) -> list[Task]:
+        try:
+            tasks = await async_repo.get_task_ancestors(
+                self._db, title=title, max_depth=max_depth
+            )
+        except ValueError as exc:
+            raise FernHTTPException(status_code=400, content=str(exc))
+        if tasks is None:
+            raise FernHTTPException(status_code=404, content="Task not found")
+        return tasks
+
+    async def get_task_descendants(
+        self, *, title: str, max_depth: typing.Optional[int] = None
+    ) -> list[Task]:
+        try:
+            tasks = await async_repo.get_task_descendants(
+                self._db, title=title, max_depth=max_depth
+            )
+        except ValueError as exc:
+            raise FernHTTPException(status_code=400, content=str(exc))
+        if tasks is None:
+            raise FernHTTPException(status_code=404, content="Task not found")
+        return tasks
+
+    async def rank_tasks(
+        self, *, limit: typing.Optional[int] = None
+    ) -> list[RankedTask]:
+        try:
+            ranked = await async_repo.rank_tasks(self._db, limit=limit)
+        except ValueError as exc:
+            raise FernHTTPException(status_code=400, content=str(exc))
+        return ranked
+
+    async def get_task_changes(
+        self, *, since: typing.Optional[int] = None
+    ) -> TaskChangesResponse:
+        try:
+            changes = await async_repo.get_task_changes(self._db, since=since or 0)
+        except ChangesPruned as exc:
+            raise FernHTTPException(status_code=410, content=str(exc))
+        except ValueError as exc:
+            raise FernHTTPException(status_code=400, content=str(exc))
+        return changes
+
+    async def stream_task_changes(
+        self,
+        *,
+        since: typing.Optional[int] = None,
+        last_event_id: typing.Optional[str] = None,
+    ) -> StreamingResponse:
+        if since is None and last_event_id:
+            try:
+                since = int(last_event_id)
+            except ValueError:
+                raise FernHTTPException(
+                    status_code=400, content="Last-Event-ID must be a change version"
+                )
+        if since is not None and since < 0:
+            raise FernHTTPException(
+                status_code=400, content="since must be a non-negative version"
+            )
+        if since is not None:
+            try:
+                await async_repo.check_changes_available(self._db, since=since)
+            except ChangesPruned as exc:
+                raise FernHTTPException(status_code=410, content=str(exc))
+        return StreamingResponse(
+            _task_change_events(self._db, get_notification_hub(), since=since),
+            media_type=SSE_MEDIA_TYPE,
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    async def search_tasks(
+        self,
+        *,
+        query: str,
+        limit: typing.Optional[int] = None,
+        offset: typing.Optional[int] = None,
+        status: typing.Optional[typing.List[TaskStatus]] = None,
+    ) -> list[TaskSearchResult]:
+        try:
+            results = await async_repo.search_tasks(
+                self._db, query=query, limit=limit, offset=offset, statuses=status
+            )
+        except ValueError as exc:
+            raise FernHTTPException(status_code=400, content=str(exc))
+        return results
+
+    async def find_similar_tasks(
+        self,
+        *,
+        title: str,
+        threshold: typing.Optional[float] = None,
+        limit: typing.Optional[int] = None,
+    ) -> list[SimilarTask]:
+        try:
+            matches = await async_repo.find_similar_tasks(
+                self._db, title=title, threshold=threshold, limit=limit
+            )
+        except ValueError as exc:
+            raise FernHTTPException(status_code=400, content=str(exc))
+        return matches
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
 import json
-from typing import Dict, List
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 from openai import OpenAI
 
+from taskmaster.api.resources.tasks.types.generate_tasks_event import (
+    GenerateTasksEvent,
+)
+from taskmaster.api.resources.tasks.types.generate_tasks_event_type import (
+    GenerateTasksEventType,
+)
 from taskmaster.api.resources.tasks.types.generate_tasks_request import (
     GenerateTasksRequest,
 )
@@ -12,14 +19,24 @@ from taskmaster.api.resources.tasks.types.generate_tasks_response import (
     GenerateTasksResponse,
 )
 from taskmaster.api.resources.tasks.types.task import Task
-from taskmaster.config import get_settings
+from taskmaster.config import Settings, get_settings
+from taskmaster.metrics import time_openai_call
+from taskmaster.services.task_management.generation.context import (
+    select_context_tasks,
+)
 from taskmaster.services.task_management.generation.prompt_loader import PromptLoader
+from taskmaster.services.task_management.generation.task_stream import (
+    TaskArrayParser,
+    parse_task_array,
+)
+from taskmaster.tracing import current_traceparent, span
 
-PROMPT_LOADER = PromptLoader()
+PROMPT_LOADER = PromptLoader.from_settings(get_settings())
 ALLOWED_TOOLS = [
     "tasks.create_task_api_create_task_post",
     "tasks.update_task_api_update_task_post",
     "tasks.delete_task_api_delete_task_post",
+    "tasks.find_similar_tasks_api_find_similar_tasks_get",
 ]
 # TODO: Build proper agent object to abstract a lot of this functionality
 
@@ -27,9 +44,9 @@ ALLOWED_TOOLS = [
 def _load_prompts() -> Dict[str, str]:
     # Render jinja2 templates to strings using the prompt loader
     loader = PROMPT_LOADER
-    system = loader.render("system.md", variables={})
-    developer = loader.render("developer.md", variables={})
-    user_template = loader.get("user_template.md").render  # rendered later with vars
+    system = loader.render("system.j2", variables={})
+    developer = loader.render("developer.j2", variables={})
+    user_template = loader.get("user_template.j2").render  # rendered later with vars
 
     # Allowed tools remains JSON file content
 
@@ -47,27 +64,45 @@ def _serialize_tasks(tasks: List[Task] | None) -> str:
     return json.dumps([json.loads(t.model_dump_json()) for t in tasks])
 
 
-def generate_tasks_with_agent(body: GenerateTasksRequest) -> GenerateTasksResponse:
-    prompts = _load_prompts()
-    settings = get_settings()
-    client = (
+def _client(settings: Settings) -> OpenAI:
+    return (
         OpenAI(api_key=settings.openai_api_key) if settings.openai_api_key else OpenAI()
     )
 
-    # Render user prompt with required variables; loader checks missing/extra vars
-    user_prompt = PROMPT_LOADER.render(
-        "user_template.md",
-        variables={
-            "transcript": body.transcript,
-            "existing_tasks_json": _serialize_tasks(body.existing_tasks),
-        },
-    )
+
+def _agent_request(body: GenerateTasksRequest, settings: Settings) -> Dict[str, Any]:
+    """Keyword arguments of the Responses API call that runs the agent on ``body``."""
+    with span("agent.render_prompts") as render_span:
+        prompts = _load_prompts()
+        # Only the existing tasks relevant to the transcript fit large backlogs
+        context = select_context_tasks(
+            body.transcript,
+            body.existing_tasks or [],
+            token_budget=settings.agent_context_token_budget,
+        )
+        render_span.set_attribute("agent.context_tasks", len(context.tasks))
+        render_span.set_attribute("agent.context_dropped", context.dropped)
+        # Render user prompt with required variables; loader checks missing/extra vars
+        user_prompt = PROMPT_LOADER.render(
+            "user_template.j2",
+            variables={
+                "transcript": body.transcript,
+                "existing_tasks_json": _serialize_tasks(context.tasks),
+                "omitted_tasks": context.dropped,
+            },
+        )
+
+    # MCP tool calls back into our API join this trace through the env
+    mcp_env = {"TASKMASTER_BASE_URL": settings.base_url}
+    traceparent = current_traceparent()
+    if traceparent is not None:
+        mcp_env["TASKMASTER_TRACEPARENT"] = traceparent
 
     # Responses API style with multi-roles and tool allowances
-    response = client.responses.create(
-        model=settings.openai_model,
-        reasoning={"effort": settings.openai_reasoning_effort},
-        input=[
+    return {
+        "model": settings.openai_model,
+        "reasoning": {"effort": settings.openai_reasoning_effort},
+        "input": [
             {"role": "system", "content": prompts["system"]},
             {
                 "role": "developer",
@@ -79,55 +114,156 @@ def generate_tasks_with_agent(body: GenerateTasksRequest) -> GenerateTasksRespon
             },
             {"role": "user", "content": user_prompt},
         ],
-        tools=[  # TODO: How are the tools included here surfaced to the model? Can we see them in traces?
+        "tools": [  # TODO: How are the tools included here surfaced to the model? Can we see them in traces?
             {
                 "type": "mcp",
                 "server": {
                     "name": "taskmaster-mcp",
                     "command": "node",
                     "args": [settings.mcp_server_absolute_path()],
-                    "env": {
-                        "TASKMASTER_BASE_URL": settings.base_url,
-                    },
+                    "env": mcp_env,
                 },
-                "allowed_tools": [  # TODO: is this an actual parameter we can use?
-                    "tasks.create_task_api_create_task_post",
-                    "tasks.update_task_api_update_task_post",
-                    "tasks.delete_task_api_delete_task_post",
-                ],
+                "allowed_tools": ALLOWED_TOOLS,  # TODO: is this an actual parameter we can use?
             }
         ],
-        tool_choice="auto",
-        max_output_tokens=settings.openai_max_output_tokens,
-    )
+        "tool_choice": "auto",
+        "max_output_tokens": settings.openai_max_output_tokens,
+    }
 
-    # Extract final task list from the model's final message if provided; otherwise fallback to API listing
-    final_tasks: List[Task] = []
+
+def _field(obj: Any, name: str) -> Any:
+    # SDK objects are models; raw/recorded payloads are plain dicts
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def _to_task(obj: Dict[str, Any]) -> Optional[Task]:
+    # Tolerate partial fields by skipping invalid entries
     try:
-        # The Responses API returns output messages; we scan for a JSON array in the last text
-        outputs = response.output or []  # type: ignore[attr-defined]
-        last_text_chunks: List[str] = []
-        for item in outputs:
-            if item.get("type") == "message":
-                for c in item.get("content", []):
-                    if c.get("type") == "output_text" and isinstance(
-                        c.get("text"), str
-                    ):
-                        last_text_chunks.append(c.get("text"))
-        final_text = "\n".join(last_text_chunks).strip()
-        # Heuristic: find first JSON array in the text
-        start = final_text.find("[")
-        end = final_text.rfind("]")
-        if start != -1 and end != -1 and end > start:
-            arr = json.loads(final_text[start : end + 1])
-            # Coerce into Task models; tolerate partial fields by skipping invalid entries
-            for obj in arr:
-                try:
-                    final_tasks.append(Task.model_validate(obj))
-                except Exception:
-                    continue
+        return Task.model_validate(obj)
     except Exception:
-        final_tasks = []
+        return None
+
+
+def _output_text(response: Any) -> str:
+    chunks: List[str] = []
+    for item in _field(response, "output") or []:
+        if _field(item, "type") != "message":
+            continue
+        for content in _field(item, "content") or []:
+            text = _field(content, "text")
+            if _field(content, "type") == "output_text" and isinstance(text, str):
+                chunks.append(text)
+    return "\n".join(chunks)
+
+
+def generate_tasks_with_agent(
+    body: GenerateTasksRequest, progress: Optional[Callable[[str], None]] = None
+) -> GenerateTasksResponse:
+    """Run the agent on ``body``; ``progress`` is called with each stage."""
+    report = progress or (lambda stage: None)
+    settings = get_settings()
+    client = _client(settings)
+
+    report("rendering prompts")
+    request = _agent_request(body, settings)
+
+    report("running agent")
+    with span("openai.responses.create"), time_openai_call("responses.create"):
+        response = client.responses.create(**request)
+
+    # Extract final task list from the model's final message if provided; otherwise fallback to API listing
+    report("reading agent output")
+    final_tasks: List[Task] = []
+    for obj in parse_task_array(_output_text(response)):
+        task = _to_task(obj)
+        if task is not None:
+            final_tasks.append(task)
 
     # If the model did not return parsed tasks, we can simply list tasks via our repo for now in the service layer.
     return GenerateTasksResponse(tasks=final_tasks)
+
+
+def _tool_call_event(event_type: str, item: Any) -> Optional[GenerateTasksEvent]:
+    if _field(item, "type") != "mcp_call":
+        return None
+    if event_type == "response.output_item.added":
+        stage = "started"
+    else:
+        stage = "failed" if _field(item, "error") else "completed"
+    return GenerateTasksEvent(
+        type=GenerateTasksEventType.TOOL_CALL,
+        stage=stage,
+        tool=_field(item, "name"),
+        error=_field(item, "error") or None,
+    )
+
+
+def _stream_error(event: Any) -> str:
+    if _field(event, "type") == "error":
+        return _field(event, "message") or "Agent stream failed"
+    error = _field(_field(event, "response"), "error")
+    return _field(error, "message") or "Agent response failed"
+
+
+def stream_tasks_with_agent(body: GenerateTasksRequest) -> Iterator[GenerateTasksEvent]:
+    """Run the agent on ``body`` with a streamed response, yielding events as they happen.
+
+    Tasks are yielded as soon as the model finishes writing each object of the
+    final list; the closing DONE event carries all of them (empty when the
+    model returned none). Failures of the response are raised as RuntimeError.
+    """
+    settings = get_settings()
+    client = _client(settings)
+
+    yield GenerateTasksEvent(
+        type=GenerateTasksEventType.PROGRESS, stage="rendering prompts"
+    )
+    request = _agent_request(body, settings)
+
+    yield GenerateTasksEvent(
+        type=GenerateTasksEventType.PROGRESS, stage="running agent"
+    )
+    parser = TaskArrayParser()
+    tasks: List[Task] = []
+    with (
+        span("openai.responses.stream") as stream_span,
+        time_openai_call("responses.stream"),
+    ):
+        started = time.perf_counter()
+        stream = client.responses.create(**request, stream=True)
+        try:
+            for event in stream:
+                event_type = _field(event, "type")
+                if event_type == "response.output_text.delta":
+                    for obj in parser.feed(_field(event, "delta") or ""):
+                        task = _to_task(obj)
+                        if task is None:
+                            continue
+                        if not tasks:
+                            stream_span.set_attribute(
+                                "agent.first_task_seconds",
+                                round(time.perf_counter() - started, 3),
+                            )
+                        tasks.append(task)
+                        yield GenerateTasksEvent(
+                            type=GenerateTasksEventType.TASK, task=task
+                        )
+                elif event_type in (
+                    "response.output_item.added",
+                    "response.output_item.done",
+                ):
+                    tool_call = _tool_call_event(event_type, _field(event, "item"))
+                    if tool_call is not None:
+                        yield tool_call
+                # An incomplete response (e.g. out of tokens) just ends the
+                # stream, keeping the tasks written so far
+                elif event_type in ("response.failed", "error"):
+                    raise RuntimeError(_stream_error(event))
+        finally:
+            # Also when the consumer stops early: give the connection back
+            stream.close()
+        stream_span.set_attribute("agent.tasks", len(tasks))
+
+    yield GenerateTasksEvent(type=GenerateTasksEventType.DONE, tasks=tasks)
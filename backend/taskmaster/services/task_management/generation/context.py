@@ -0,0 +1,153 @@
+"""Choosing which existing tasks go into the agent's prompt.
+
+Sending the whole backlog makes prompt size, latency and cost grow with it.
+When the tasks do not fit ``agent_context_token_budget``,
+:func:`select_context_tasks` keeps the ones that matter for the transcript:
+
+1. Tasks are ranked by BM25 relevance of their title (counted twice) and
+   description to the transcript's words, using an index built on the spot.
+2. Each matching task, best first, is taken together with its direct
+   prerequisites and dependents, so the agent sees the dependency edges
+   around what the transcript talks about.
+3. Budget left over goes to the remaining tasks, open ones first.
+
+Token counts are estimated from the serialized JSON (about four characters a
+token), which is close enough to keep the prompt near the budget.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import uuid
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Sequence, Set
+
+from taskmaster.api.resources.tasks.types.task import Task
+from taskmaster.api.resources.tasks.types.task_status import TaskStatus
+
+_WORD_RE = re.compile(r"[^\W_]+")
+_STOPWORDS: FrozenSet[str] = frozenset(
+    "a an and are as at be but by do for from has have i in is it its of on or "
+    "our so that the their then this to up we will with you".split()
+)
+_CHARS_PER_TOKEN = 4
+_CLOSED = (TaskStatus.COMPLETED, TaskStatus.CANCELLED)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase words without stopwords, with a plural ``s`` stripped."""
+    terms = []
+    for word in _WORD_RE.findall(text.lower()):
+        if word in _STOPWORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        terms.append(word)
+    return terms
+
+
+def estimate_tokens(text: str) -> int:
+    return -(-len(text) // _CHARS_PER_TOKEN)
+
+
+class BM25Index:
+    """Okapi BM25 over a fixed list of tokenized documents."""
+
+    def __init__(
+        self, documents: Sequence[Sequence[str]], *, k1: float = 1.2, b: float = 0.75
+    ) -> None:
+        self._k1 = k1
+        self._b = b
+        self._frequencies = [Counter(doc) for doc in documents]
+        self._lengths = [len(doc) for doc in documents]
+        self._average_length = sum(self._lengths) / len(documents) if documents else 0.0
+        document_frequency: Counter[str] = Counter()
+        for frequencies in self._frequencies:
+            document_frequency.update(frequencies.keys())
+        count = len(documents)
+        self._idf = {
+            term: math.log(1 + (count - df + 0.5) / (df + 0.5))
+            for term, df in document_frequency.items()
+        }
+
+    def scores(self, query: Iterable[str]) -> List[float]:
+        """Score of every document for the distinct terms of ``query``."""
+        terms = [term for term in set(query) if term in self._idf]
+        scores = [0.0] * len(self._frequencies)
+        if not terms:
+            return scores
+        for index, frequencies in enumerate(self._frequencies):
+            norm = self._k1 * (
+                1 - self._b + self._b * self._lengths[index] / self._average_length
+            )
+            score = 0.0
+            for term in terms:
+                tf = frequencies.get(term)
+                if tf:
+                    score += self._idf[term] * tf * (self._k1 + 1) / (tf + norm)
+            scores[index] = score
+        return scores
+
+
+@dataclass(frozen=True)
+class ContextSelection:
+    # Kept tasks, in their original order
+    tasks: List[Task]
+    dropped: int
+
+
+def _neighbors(tasks: Sequence[Task]) -> Dict[int, List[int]]:
+    positions: Dict[uuid.UUID, int] = {task.id: i for i, task in enumerate(tasks)}
+    neighbors: Dict[int, List[int]] = defaultdict(list)
+    for i, task in enumerate(tasks):
+        for prerequisite in task.prerequisite_tasks:
+            j = positions.get(prerequisite)
+            if j is not None and j != i:
+                neighbors[i].append(j)
+                neighbors[j].append(i)
+    return neighbors
+
+
+def select_context_tasks(
+    transcript: str, tasks: Sequence[Task], *, token_budget: int
+) -> ContextSelection:
+    """The existing tasks to show the agent for ``transcript`` within ``token_budget``.
+
+    A budget of 0 or less keeps every task.
+    """
+    costs = [estimate_tokens(task.model_dump_json()) for task in tasks]
+    if token_budget <= 0 or sum(costs) <= token_budget:
+        return ContextSelection(tasks=list(tasks), dropped=0)
+
+    index = BM25Index([tokenize(f"{t.title} {t.title} {t.description}") for t in tasks])
+    scores = index.scores(tokenize(transcript))
+    neighbors = _neighbors(tasks)
+
+    chosen: Set[int] = set()
+    used = 0
+
+    def take(i: int) -> bool:
+        nonlocal used
+        if i in chosen:
+            return True
+        if used + costs[i] > token_budget:
+            return False
+        chosen.add(i)
+        used += costs[i]
+        return True
+
+    matched = sorted(
+        (i for i, s in enumerate(scores) if s > 0), key=lambda i: -scores[i]
+    )
+    for i in matched:
+        if take(i):
+            for j in neighbors.get(i, ()):
+                take(j)
+    # Fill what is left, open tasks before completed/cancelled ones
+    for i in sorted(range(len(tasks)), key=lambda i: tasks[i].status in _CLOSED):
+        take(i)
+
+    kept = [tasks[i] for i in sorted(chosen)]
+    return ContextSelection(tasks=kept, dropped=len(tasks) - len(kept))
@@ -2,17 +2,56 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Any, Dict, Optional
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Optional, Set
 
-from jinja2 import Environment, FileSystemLoader, Template, meta
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    meta,
+)
+
+from taskmaster.config import Settings
 
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass
+class _CompiledPrompt:
+    template: Template
+    # Undeclared variables of the template and everything it includes/extends
+    variables: FrozenSet[str]
+    # Source path -> mtime for the same set of files, checked on auto-reload
+    mtimes: Dict[str, float]
+    # Output of a render without variables (static prompts), filled lazily
+    rendered: Optional[str] = None
+
+
 class PromptLoader:
-    def __init__(self, templates_dir: Optional[str] = None) -> None:
+    """Render prompt templates, compiling and analysing each file once.
+
+    Compiled templates, their variable sets and static renders are cached per
+    template. With ``auto_reload`` each lookup stats the template and the
+    templates it includes, imports or extends, and rebuilds the entry when any
+    of them changed, so edited prompts are picked up without a restart.
+    Without it the first build is kept for the life of the loader. A
+    ``bytecode_cache`` additionally keeps compiled templates across processes.
+    """
+
+    def __init__(
+        self,
+        templates_dir: Optional[str] = None,
+        *,
+        auto_reload: bool = True,
+        bytecode_cache: Optional[BytecodeCache] = None,
+    ) -> None:
         base_dir = templates_dir or os.path.join(os.path.dirname(__file__), "prompts")
+        self._auto_reload = auto_reload
         self._env = Environment(
             loader=FileSystemLoader(base_dir),
             autoescape=False,
@@ -20,33 +59,101 @@ class PromptLoader:
             # Default undefined: do not raise; we'll log missing ourselves
             trim_blocks=False,
             lstrip_blocks=False,
+            auto_reload=auto_reload,
+            bytecode_cache=bytecode_cache,
+        )
+        self._compiled: Dict[str, _CompiledPrompt] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> PromptLoader:
+        bytecode_cache = None
+        if settings.prompt_bytecode_cache:
+            bytecode_cache = FileSystemBytecodeCache(settings.prompt_bytecode_cache_dir)
+        return cls(
+            auto_reload=settings.prompt_auto_reload, bytecode_cache=bytecode_cache
         )
 
     def get(self, filename: str) -> Template:
-        return self._env.get_template(filename)
+        return self._load(filename).template
+
+    def variables(self, filename: str) -> FrozenSet[str]:
+        return self._load(filename).variables
 
     def render(
         self, filename: str, *, variables: Optional[Dict[str, Any]] = None
     ) -> str:
-        # Parse template source to determine referenced variables
-        source, _, _ = self._env.loader.get_source(self._env, filename)
-        ast = self._env.parse(source)
-        referenced = set(meta.find_undeclared_variables(ast))
-        # Exclude env globals (builtins/macros) from expected set
-        referenced -= set(self._env.globals.keys())
+        compiled = self._load(filename)
 
         provided_keys = set(variables.keys()) if variables else set()
-        missing_keys = referenced - provided_keys
+        missing_keys = compiled.variables - provided_keys
         if missing_keys:
             _LOGGER.warning(
                 "Prompt '%s' missing variables: %s", filename, sorted(missing_keys)
             )
 
-        extra_keys = provided_keys - referenced
+        extra_keys = provided_keys - compiled.variables
         if extra_keys:
             raise ValueError(
                 f"Unexpected template variables provided: {sorted(extra_keys)}"
             )
 
-        template = self.get(filename)
-        return template.render(**(variables or {}))
+        if provided_keys:
+            return compiled.template.render(**variables)  # type: ignore[arg-type]
+        if compiled.rendered is None:
+            compiled.rendered = compiled.template.render()
+        return compiled.rendered
+
+    def _load(self, filename: str) -> _CompiledPrompt:
+        compiled = self._compiled.get(filename)
+        if compiled is not None and (
+            not self._auto_reload or self._is_current(compiled)
+        ):
+            return compiled
+        with self._lock:
+            compiled = self._compiled.get(filename)
+            if compiled is None or (
+                self._auto_reload and not self._is_current(compiled)
+            ):
+                compiled = self._compile(filename)
+                self._compiled[filename] = compiled
+            return compiled
+
+    @staticmethod
+    def _is_current(compiled: _CompiledPrompt) -> bool:
+        try:
+            return all(
+                os.path.getmtime(path) == mtime
+                for path, mtime in compiled.mtimes.items()
+            )
+        except OSError:
+            return False
+
+    def _compile(self, filename: str) -> _CompiledPrompt:
+        # Walk the template and its static dependencies (include/import/extends)
+        # once, collecting variables and file mtimes for invalidation
+        referenced: Set[str] = set()
+        mtimes: Dict[str, float] = {}
+        pending = [filename]
+        seen = set(pending)
+        while pending:
+            name = pending.pop()
+            source, path, _ = self._env.loader.get_source(self._env, name)  # type: ignore[union-attr]
+            if path is not None:
+                mtimes[path] = os.path.getmtime(path)
+            ast = self._env.parse(source, name, path)
+            referenced |= meta.find_undeclared_variables(ast)
+            for dependency in meta.find_referenced_templates(ast):
+                # Dynamic names (None) cannot be resolved until render time
+                if dependency is not None and dependency not in seen:
+                    seen.add(dependency)
+                    pending.append(dependency)
+        # Exclude env globals (builtins/macros) from expected set
+        referenced -= set(self._env.globals.keys())
+
+        # Compiled code comes from the environment's template cache, or the
+        # bytecode cache when the source checksum matches
+        template = self._env.get_template(filename)
+        return _CompiledPrompt(
+            template=template, variables=frozenset(referenced), mtimes=mtimes
+        )
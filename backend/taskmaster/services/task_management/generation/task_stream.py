@@ -0,0 +1,114 @@
+"""Incremental parsing of the task list in the agent's output.
+
+The agent ends its run by writing the final task list as a JSON array of task
+objects, possibly wrapped in prose or a code fence. :class:`TaskArrayParser`
+takes that text in pieces as it streams in and hands back each object of the
+array as soon as its closing brace arrives, so tasks can be shown while the
+model is still writing the rest of the list.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Optional
+
+_WHITESPACE = " \t\r\n"
+
+
+class TaskArrayParser:
+    """Pull the objects of the first JSON array of objects out of ``feed``-ed text.
+
+    The array is the first ``[`` whose next non-blank character is ``{`` or
+    ``]`` (so bracketed prose before it is skipped). Elements that are not
+    objects, or objects that are not valid JSON, are skipped; text after the
+    array is ignored.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = ""
+        self._pos = 0
+        self._in_array = False
+        self.finished = False
+        # Scan state inside the array
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._start: Optional[int] = None
+
+    def feed(self, text: str) -> List[Dict[str, Any]]:
+        """Add ``text`` and return the objects it completed, in order."""
+        if self.finished:
+            return []
+        self._buffer += text
+        if not self._in_array and not self._find_array():
+            return []
+        return self._scan()
+
+    def _find_array(self) -> bool:
+        buffer = self._buffer
+        while True:
+            start = buffer.find("[", self._pos)
+            if start == -1:
+                # Nothing before the end can start the array any more
+                self._buffer, self._pos = "", 0
+                return False
+            nxt = start + 1
+            while nxt < len(buffer) and buffer[nxt] in _WHITESPACE:
+                nxt += 1
+            if nxt == len(buffer):
+                # Decide once the next character arrives
+                self._buffer, self._pos = buffer[start:], 0
+                return False
+            if buffer[nxt] in "{]":
+                self._buffer, self._pos = buffer[start + 1 :], 0
+                self._in_array = True
+                return True
+            self._pos = start + 1
+
+    def _scan(self) -> List[Dict[str, Any]]:
+        objects: List[Dict[str, Any]] = []
+        buffer = self._buffer
+        i = self._pos
+        while i < len(buffer):
+            char = buffer[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                if self._depth == 0 and char == "{":
+                    self._start = i
+                self._depth += 1
+            elif char in "}]":
+                if self._depth == 0:
+                    # The array itself closed
+                    self.finished = True
+                    self._buffer, self._pos = "", 0
+                    return objects
+                self._depth -= 1
+                if self._depth == 0 and self._start is not None:
+                    try:
+                        obj = json.loads(buffer[self._start : i + 1])
+                    except json.JSONDecodeError:
+                        obj = None
+                    if isinstance(obj, dict):
+                        objects.append(obj)
+                    self._start = None
+            i += 1
+        # Keep only the unfinished element around
+        keep = i if self._start is None else self._start
+        self._buffer = buffer[keep:]
+        self._pos = i - keep
+        if self._start is not None:
+            self._start = 0
+        return objects
+
+
+def parse_task_array(text: str) -> List[Dict[str, Any]]:
+    """The objects of the task array in a complete ``text``."""
+    return TaskArrayParser().feed(text)
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, Optional
+
+CSV_PREREQUISITE_SEPARATOR = ";"
+
+
+def read_import_records(
+    stream: IO[bytes], *, filename: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """Yield raw task records from a JSONL or CSV upload.
+
+    The format is chosen from the filename suffix (``.csv`` means CSV, anything
+    else is read as JSONL). Records use the ``CreateTaskRequest`` field names,
+    except that prerequisites are given as a list of titles under
+    ``prerequisites``; in CSV they are separated by ``;``.
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+    try:
+        if filename and Path(filename).suffix.lower() == ".csv":
+            yield from _read_csv(text)
+        else:
+            yield from _read_jsonl(text)
+    finally:
+        # Leave the underlying upload open for the framework to close
+        if not text.closed:
+            text.detach()
+
+
+def _read_jsonl(text: IO[str]) -> Iterator[Dict[str, Any]]:
+    for line_no, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"Line {line_no}: invalid JSON ({exc.msg})") from exc
+        if not isinstance(record, dict):
+            raise ValueError(f"Line {line_no}: expected a JSON object")
+        yield record
+
+
+def _read_csv(text: IO[str]) -> Iterator[Dict[str, Any]]:
+    for record in csv.DictReader(text):
+        prerequisites = record.get("prerequisites") or ""
+        record["prerequisites"] = [
+            title.strip()
+            for title in prerequisites.split(CSV_PREREQUISITE_SEPARATOR)
+            if title.strip()
+        ]
+        if not record.get("deadline"):
+            record["deadline"] = None
+        yield record
@@ -0,0 +1,135 @@
+"""Task change notifications over Postgres ``LISTEN``/``NOTIFY``.
+
+Repo write paths call :func:`notify_task_changes` inside their transaction, so
+a notification is delivered exactly when the change commits, to every backend
+process listening on the channel. Each process runs one
+:class:`NotificationHub`, which holds a single ``LISTEN`` connection and fans
+payloads out to in-process subscribers (e.g. SSE streams).
+
+Payloads are hints ("something changed, these ids if few enough"); consumers
+read the actual delta from the change feed, so a dropped or coalesced
+notification never loses data.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import uuid
+from functools import lru_cache
+from typing import AsyncIterator, Optional, Sequence, Set
+
+import psycopg
+from sqlalchemy import func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+
+from taskmaster.config import get_settings
+
+TASK_CHANGES_CHANNEL = "task_changes"
+
+# Postgres caps NOTIFY payloads at 8000 bytes; larger writes only send a count
+_MAX_NOTIFY_IDS = 100
+# Sent to subscribers when the listener (re)connects and may have missed events
+RESYNC_PAYLOAD = json.dumps({"op": "resync"})
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def notify_task_changes(
+    session: Session, *, op: str, task_ids: Sequence[uuid.UUID]
+) -> None:
+    """Queue a change notification that Postgres delivers on commit."""
+    payload = {"op": op, "count": len(task_ids)}
+    if len(task_ids) <= _MAX_NOTIFY_IDS:
+        payload["ids"] = [str(task_id) for task_id in task_ids]
+    session.execute(select(func.pg_notify(TASK_CHANGES_CHANNEL, json.dumps(payload))))
+
+
+class NotificationHub:
+    """Fan out notifications from one ``LISTEN`` connection to many subscribers.
+
+    The listener starts with the first subscriber and stops with the last one.
+    Each subscriber gets a small queue; when it is full the subscriber already
+    has a wake-up pending, so further payloads are dropped for it.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        *,
+        channel: str = TASK_CHANGES_CHANNEL,
+        queue_size: int = 16,
+        reconnect_delay_seconds: float = 1.0,
+    ) -> None:
+        self._dsn = dsn
+        self._channel = channel
+        self._queue_size = queue_size
+        self._reconnect_delay_seconds = reconnect_delay_seconds
+        self._subscribers: Set[asyncio.Queue[str]] = set()
+        self._listener: Optional[asyncio.Task[None]] = None
+        self._listening = asyncio.Event()
+
+    @contextlib.asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[asyncio.Queue[str]]:
+        queue: asyncio.Queue[str] = asyncio.Queue(maxsize=self._queue_size)
+        self._subscribers.add(queue)
+        self._ensure_listener()
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
+            if not self._subscribers:
+                await self.aclose()
+
+    async def wait_listening(self, timeout: Optional[float] = None) -> None:
+        """Wait until ``LISTEN`` is active, i.e. no commit can be missed."""
+        await asyncio.wait_for(self._listening.wait(), timeout)
+
+    async def aclose(self) -> None:
+        listener, self._listener = self._listener, None
+        if listener is not None and not listener.done():
+            listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await listener
+
+    def _ensure_listener(self) -> None:
+        loop = asyncio.get_running_loop()
+        if (
+            self._listener is None
+            or self._listener.done()
+            or self._listener.get_loop() is not loop
+        ):
+            self._listening = asyncio.Event()
+            self._listener = loop.create_task(self._listen())
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                conn = await psycopg.AsyncConnection.connect(self._dsn, autocommit=True)
+                async with conn:
+                    await conn.execute(f'LISTEN "{self._channel}"')
+                    self._listening.set()
+                    # Anything committed while we were not listening is unknown
+                    self._publish(RESYNC_PAYLOAD)
+                    async for notify in conn.notifies():
+                        self._publish(notify.payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                _LOGGER.exception("Task change listener failed; reconnecting")
+            self._listening.clear()
+            await asyncio.sleep(self._reconnect_delay_seconds)
+
+    def _publish(self, payload: str) -> None:
+        for queue in list(self._subscribers):
+            with contextlib.suppress(asyncio.QueueFull):
+                queue.put_nowait(payload)
+
+
+@lru_cache(maxsize=1)
+def get_notification_hub() -> NotificationHub:
+    url = make_url(get_settings().get_database_url()).set(drivername="postgresql")
+    return NotificationHub(url.render_as_string(hide_password=False))
@@ -1,25 +1,183 @@
 from __future__ import annotations
 
+import datetime as dt
 import uuid
-from typing import Iterable, List, Optional
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
-from sqlalchemy import select
+import psycopg
+
+from sqlalchemy import Select, exists, func, select, text, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.util import await_only
 
+from taskmaster.api.resources.tasks.types.batch_task_operation import (
+    BatchTaskOperation,
+)
+from taskmaster.api.resources.tasks.types.batch_task_operation_type import (
+    BatchTaskOperationType,
+)
+from taskmaster.api.resources.tasks.types.batch_task_result import BatchTaskResult
+from taskmaster.api.resources.tasks.types.batch_tasks_response import (
+    BatchTasksResponse,
+)
 from taskmaster.api.resources.tasks.types.create_task_request import CreateTaskRequest
+from taskmaster.api.resources.tasks.types.import_tasks_response import (
+    ImportTasksResponse,
+)
 from taskmaster.api.resources.tasks.types.update_task_request import UpdateTaskRequest
 from taskmaster.api.resources.tasks.types.task import Task as ApiTask
+from taskmaster.api.resources.tasks.types.task_changes_response import (
+    TaskChangesResponse,
+)
+from taskmaster.api.resources.tasks.types.similar_task import SimilarTask
+from taskmaster.api.resources.tasks.types.task_search_result import TaskSearchResult
+from taskmaster.api.resources.tasks.types.task_tombstone import TaskTombstone
+from taskmaster.api.resources.tasks.types.task_order import TaskOrder as ApiTaskOrder
 from taskmaster.api.resources.tasks.types.task_status import TaskStatus as ApiTaskStatus
-from taskmaster.db.models.task import TaskRow, TaskStatusEnum
+from taskmaster.config import get_settings
+from taskmaster.db.models.task import (
+    SEARCH_CONFIG,
+    TaskChangeFeedRow,
+    TaskRow,
+    TaskStatusEnum,
+    TaskTombstoneRow,
+    task_change_version_seq,
+    task_closure,
+    task_prerequisites,
+)
+from taskmaster.services.task_management.notifications import notify_task_changes
+from taskmaster.services.task_management.similarity import similarity, trigrams
+
+# Writers hold this advisory lock in shared mode until they commit. The change
+# feed tries it exclusively while reading the version high-water mark, so every
+# version at or below that mark belongs to a finished transaction.
+_CHANGE_FEED_LOCK_KEY = 0x7461736B
+
+# Lock, read and unlock in one statement, so a failure between them cannot
+# leave the lock held on a pooled connection. No row when the lock is busy.
+_DRAINED_CHANGE_VERSION = text(
+    """
+    WITH drained AS (
+        SELECT coalesce(pg_sequence_last_value('task_change_version_seq'), 0) AS version
+        WHERE pg_try_advisory_lock(:key)
+    )
+    SELECT version FROM drained WHERE pg_advisory_unlock(:key)
+    """
+)
+
+
+# Held exclusively by writes that change prerequisite edges, from before their
+# cycle check until they commit; the closure triggers take it too
+_PREREQUISITE_GRAPH_LOCK_KEY = 0x7461736C
+
+
+def _lock_for_write(session: Session, *, graph: bool = False) -> None:
+    """Take the write locks in one statement, the change feed's first.
+
+    Pass ``graph`` when the write may add or remove prerequisite edges. It has
+    to be taken before any task row is locked: the triggers would otherwise
+    take it later, behind row locks that a concurrent delete is waiting on.
+    """
+    locks = [func.pg_advisory_xact_lock_shared(_CHANGE_FEED_LOCK_KEY)]
+    if graph:
+        locks.append(func.pg_advisory_xact_lock(_PREREQUISITE_GRAPH_LOCK_KEY))
+    session.execute(select(*locks))
+
+
+# Held by a duplicate-checked create from its check until it commits
+_DUPLICATE_CHECK_LOCK_KEY = 0x7461736E
+
+# Waits for duplicate-checked creates in flight, then reads the version
+# high-water mark; rows they write later get higher versions. Without pg_trgm
+# the check scans everything written up to here before taking the lock above.
+_CHECKED_CREATES_VERSION = text(
+    """
+    WITH settled AS (
+        SELECT coalesce(pg_sequence_last_value('task_change_version_seq'), 0) AS version
+        FROM (SELECT pg_advisory_lock_shared(:key)) AS locked
+    )
+    SELECT version FROM settled WHERE pg_advisory_unlock_shared(:key)
+    """
+)
+
+# Taken (try-only) by the write that prunes tombstones; the others skip pruning
+_TOMBSTONE_PRUNE_LOCK_KEY = 0x7461736D
+
+_PRUNE_TOMBSTONES = text(
+    """
+    WITH pruned AS (
+        DELETE FROM task_tombstones
+        WHERE (SELECT pg_try_advisory_xact_lock(:lock_key))
+        AND deleted_at < now() - make_interval(secs => :retention_seconds)
+        RETURNING version
+    )
+    UPDATE task_change_feed
+    SET pruned_version = GREATEST(pruned_version, (SELECT max(version) FROM pruned))
+    WHERE EXISTS (SELECT 1 FROM pruned)
+    """
+)
+
+
+class ChangesPruned(Exception):
+    """``since`` is older than the pruned tombstones; the client must resync."""
+
+    def __init__(self, pruned_version: int) -> None:
+        super().__init__(
+            f"Changes up to version {pruned_version} are no longer available; "
+            "resync from a full snapshot (omit since)"
+        )
+        self.pruned_version = pruned_version
+
+
+def _prune_tombstones(session: Session) -> None:
+    retention_days = get_settings().task_tombstone_retention_days
+    if retention_days <= 0:
+        return
+    session.execute(
+        _PRUNE_TOMBSTONES,
+        {
+            "lock_key": _TOMBSTONE_PRUNE_LOCK_KEY,
+            "retention_seconds": retention_days * 86400,
+        },
+    )
+
+
+@dataclass
+class _ImportRow:
+    id: uuid.UUID
+    title: str
+    description: str
+    status: TaskStatusEnum
+    priority: int
+    duration_seconds: int
+    deadline: Optional[dt.datetime]
+    prerequisite_titles: List[str]
 
 
 def _map_status_to_api(status: TaskStatusEnum) -> ApiTaskStatus:
     return ApiTaskStatus(status.value)
 
 
-def _to_api_task(row: TaskRow) -> ApiTask:
-    return ApiTask(
+def _map_status_from_api(status: ApiTaskStatus) -> TaskStatusEnum:
+    return TaskStatusEnum(status.value)
+
+
+def _to_api_task(row: TaskRow, *, depth: Optional[int] = None) -> ApiTask:
+    # Rows come from our own schema, so skip pydantic validation
+    return ApiTask.model_construct(
         id=row.id,
         title=row.title,
         description=row.description,
@@ -28,6 +186,7 @@ def _to_api_task(row: TaskRow) -> ApiTask:
         duration_seconds=row.duration_seconds,
         prerequisite_tasks=[t.id for t in row.prerequisites],
         deadline=row.deadline,
+        depth=depth,
     )
 
 
@@ -42,13 +201,451 @@ def get_task_by_title(session: Session, *, title: str) -> Optional[TaskRow]:
     return result.scalars().first()
 
 
-def list_tasks(session: Session) -> List[ApiTask]:
+def _select_tasks(
+    *,
+    statuses: Optional[Sequence[ApiTaskStatus]] = None,
+    deadline_after: Optional[dt.datetime] = None,
+    deadline_before: Optional[dt.datetime] = None,
+    priority_min: Optional[int] = None,
+    priority_max: Optional[int] = None,
+    cursor: Optional[uuid.UUID] = None,
+) -> Select[tuple[TaskRow]]:
     stmt = select(TaskRow).options(selectinload(TaskRow.prerequisites))
+    if statuses:
+        stmt = stmt.where(
+            TaskRow.status.in_([_map_status_from_api(s) for s in statuses])
+        )
+    if deadline_after is not None:
+        stmt = stmt.where(TaskRow.deadline >= deadline_after)
+    if deadline_before is not None:
+        stmt = stmt.where(TaskRow.deadline < deadline_before)
+    if priority_min is not None:
+        stmt = stmt.where(TaskRow.priority >= priority_min)
+    if priority_max is not None:
+        stmt = stmt.where(TaskRow.priority <= priority_max)
+    if cursor is not None:
+        stmt = stmt.where(TaskRow.id > cursor)
+    return stmt.order_by(TaskRow.id)
+
+
+def list_tasks(
+    session: Session,
+    *,
+    limit: Optional[int] = None,
+    cursor: Optional[uuid.UUID] = None,
+    statuses: Optional[Sequence[ApiTaskStatus]] = None,
+    deadline_after: Optional[dt.datetime] = None,
+    deadline_before: Optional[dt.datetime] = None,
+    priority_min: Optional[int] = None,
+    priority_max: Optional[int] = None,
+    order: Optional[ApiTaskOrder] = None,
+) -> List[ApiTask]:
+    """List tasks, optionally filtered and keyset-paginated on the primary key.
+
+    Pages are ordered by ``id``; pass the ``id`` of the last task of a page as
+    ``cursor`` to fetch the next one. Without ``limit`` every matching task is
+    returned. With ``order=TOPOLOGICAL`` tasks are sorted by dependency depth
+    (then ``id``) and carry their ``depth``; ``cursor`` is rejected since the
+    order is not keyed on a column.
+    """
+    if limit is not None and limit < 1:
+        raise ValueError("limit must be a positive integer")
+    if order is ApiTaskOrder.TOPOLOGICAL:
+        if cursor is not None:
+            raise ValueError("cursor is not supported with topological order")
+        return _list_tasks_topological(
+            session,
+            limit=limit,
+            statuses=statuses,
+            deadline_after=deadline_after,
+            deadline_before=deadline_before,
+            priority_min=priority_min,
+            priority_max=priority_max,
+        )
+
+    stmt = _select_tasks(
+        statuses=statuses,
+        deadline_after=deadline_after,
+        deadline_before=deadline_before,
+        priority_min=priority_min,
+        priority_max=priority_max,
+        cursor=cursor,
+    )
+    if limit is not None:
+        stmt = stmt.limit(limit)
+
     result = session.execute(stmt)
     rows = list(result.scalars().all())
     return [_to_api_task(r) for r in rows]
 
 
+def _dependency_depths(
+    edges: Iterable[Tuple[uuid.UUID, uuid.UUID]],
+) -> Dict[uuid.UUID, int]:
+    """Compute the dependency depth of every task in ``(task, prerequisite)`` edges.
+
+    Uses Kahn's algorithm, so a task's depth is one more than the deepest of its
+    prerequisites. Tasks that appear in no edge have depth 0 and are omitted.
+    Raises ``ValueError`` if the edges contain a cycle.
+    """
+    remaining: Dict[uuid.UUID, int] = defaultdict(int)
+    dependents: Dict[uuid.UUID, List[uuid.UUID]] = defaultdict(list)
+    for task_id, prerequisite_id in edges:
+        remaining[task_id] += 1
+        remaining.setdefault(prerequisite_id, 0)
+        dependents[prerequisite_id].append(task_id)
+
+    depths = {task_id: 0 for task_id, count in remaining.items() if count == 0}
+    queue = deque(depths)
+    while queue:
+        task_id = queue.popleft()
+        for dependent_id in dependents.get(task_id, ()):
+            depths[dependent_id] = max(depths.get(dependent_id, 0), depths[task_id] + 1)
+            remaining[dependent_id] -= 1
+            if remaining[dependent_id] == 0:
+                queue.append(dependent_id)
+
+    if any(count for count in remaining.values()):
+        raise ValueError("Task prerequisites contain a cycle")
+    return depths
+
+
+def _list_tasks_topological(
+    session: Session,
+    *,
+    limit: Optional[int] = None,
+    statuses: Optional[Sequence[ApiTaskStatus]] = None,
+    deadline_after: Optional[dt.datetime] = None,
+    deadline_before: Optional[dt.datetime] = None,
+    priority_min: Optional[int] = None,
+    priority_max: Optional[int] = None,
+) -> List[ApiTask]:
+    # Depth depends on the whole graph, not only on the filtered tasks, but the
+    # edge list is just two ids per link.
+    edges = session.execute(
+        select(task_prerequisites.c.task_id, task_prerequisites.c.prerequisite_task_id)
+    ).tuples()
+    depths = _dependency_depths(edges)
+    stmt = _select_tasks(
+        statuses=statuses,
+        deadline_after=deadline_after,
+        deadline_before=deadline_before,
+        priority_min=priority_min,
+        priority_max=priority_max,
+    )
+    rows = sorted(session.scalars(stmt), key=lambda r: (depths.get(r.id, 0), r.id))
+    if limit is not None:
+        rows = rows[:limit]
+    return [_to_api_task(r, depth=depths.get(r.id, 0)) for r in rows]
+
+
+def iter_tasks(
+    session: Session,
+    *,
+    batch_size: int = 500,
+    statuses: Optional[Sequence[ApiTaskStatus]] = None,
+    deadline_after: Optional[dt.datetime] = None,
+    deadline_before: Optional[dt.datetime] = None,
+    priority_min: Optional[int] = None,
+    priority_max: Optional[int] = None,
+) -> Iterator[ApiTask]:
+    """Stream matching tasks in ``id`` order through a server-side cursor.
+
+    Rows are fetched ``batch_size`` at a time (prerequisites are loaded per
+    batch), so memory use stays bounded regardless of table size.
+    """
+    stmt = _select_tasks(
+        statuses=statuses,
+        deadline_after=deadline_after,
+        deadline_before=deadline_before,
+        priority_min=priority_min,
+        priority_max=priority_max,
+    ).execution_options(yield_per=batch_size)
+    for row in session.scalars(stmt):
+        yield _to_api_task(row)
+
+
+def _list_related_tasks(
+    session: Session,
+    *,
+    title: str,
+    ancestors: bool,
+    max_depth: Optional[int] = None,
+) -> Optional[List[ApiTask]]:
+    if max_depth is not None and max_depth < 1:
+        raise ValueError("max_depth must be a positive integer")
+    task_id = session.scalar(select(TaskRow.id).where(TaskRow.title == title))
+    if task_id is None:
+        return None
+
+    closure = task_closure.c
+    anchor, related = (
+        (closure.descendant_id, closure.ancestor_id)
+        if ancestors
+        else (closure.ancestor_id, closure.descendant_id)
+    )
+    # One index range scan on the closure, whatever the length of the chains
+    related_ids = select(related.label("id"), func.min(closure.depth).label("depth"))
+    related_ids = related_ids.where(anchor == task_id).group_by(related)
+    if max_depth is not None:
+        related_ids = related_ids.where(closure.depth <= max_depth)
+    related_ids = related_ids.subquery()
+
+    stmt = (
+        select(TaskRow, related_ids.c.depth)
+        .join(related_ids, TaskRow.id == related_ids.c.id)
+        .options(selectinload(TaskRow.prerequisites))
+        .order_by(related_ids.c.depth, TaskRow.id)
+    )
+    return [
+        _to_api_task(row, depth=depth) for row, depth in session.execute(stmt).tuples()
+    ]
+
+
+def get_task_ancestors(
+    session: Session, *, title: str, max_depth: Optional[int] = None
+) -> Optional[List[ApiTask]]:
+    """Tasks that ``title`` transitively depends on, nearest first.
+
+    ``depth`` is the shortest distance in prerequisite links. Returns ``None``
+    if the task does not exist.
+    """
+    return _list_related_tasks(
+        session, title=title, ancestors=True, max_depth=max_depth
+    )
+
+
+def get_task_descendants(
+    session: Session, *, title: str, max_depth: Optional[int] = None
+) -> Optional[List[ApiTask]]:
+    """Tasks that transitively depend on ``title``, nearest first.
+
+    ``depth`` is the shortest distance in prerequisite links. Returns ``None``
+    if the task does not exist.
+    """
+    return _list_related_tasks(
+        session, title=title, ancestors=False, max_depth=max_depth
+    )
+
+
+SEARCH_DEFAULT_LIMIT = 20
+SEARCH_MAX_LIMIT = 100
+_HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, HighlightAll=true"
+_SNIPPET_OPTIONS = (
+    "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=20, MinWords=8, "
+    'FragmentDelimiter=" ... "'
+)
+
+
+def search_tasks(
+    session: Session,
+    *,
+    query: str,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None,
+    statuses: Optional[Sequence[ApiTaskStatus]] = None,
+) -> List[TaskSearchResult]:
+    """Full-text search over titles and descriptions, best match first.
+
+    Matching uses the GIN index on ``search_vector``. Highlights are
+    computed only for the returned page, since ``ts_headline`` re-parses the
+    text of each row.
+    """
+    if not query.strip():
+        raise ValueError("query must not be empty")
+    limit = SEARCH_DEFAULT_LIMIT if limit is None else limit
+    if not 1 <= limit <= SEARCH_MAX_LIMIT:
+        raise ValueError(f"limit must be between 1 and {SEARCH_MAX_LIMIT}")
+    if offset is not None and offset < 0:
+        raise ValueError("offset must be non-negative")
+
+    tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+    rank = func.ts_rank_cd(TaskRow.search_vector, tsquery)
+    page_stmt = select(TaskRow.id, rank.label("rank")).where(
+        TaskRow.search_vector.bool_op("@@")(tsquery)
+    )
+    if statuses:
+        page_stmt = page_stmt.where(
+            TaskRow.status.in_([_map_status_from_api(s) for s in statuses])
+        )
+    page = (
+        page_stmt.order_by(rank.desc(), TaskRow.id)
+        .limit(limit)
+        .offset(offset or 0)
+        .subquery()
+    )
+    stmt = (
+        select(
+            TaskRow,
+            page.c.rank,
+            func.ts_headline(SEARCH_CONFIG, TaskRow.title, tsquery, _HEADLINE_OPTIONS),
+            func.ts_headline(
+                SEARCH_CONFIG, TaskRow.description, tsquery, _SNIPPET_OPTIONS
+            ),
+        )
+        .join(page, page.c.id == TaskRow.id)
+        .options(selectinload(TaskRow.prerequisites))
+        .order_by(page.c.rank.desc(), TaskRow.id)
+    )
+    return [
+        TaskSearchResult.model_construct(
+            task=_to_api_task(row),
+            rank=rank_value,
+            title_highlight=title_highlight,
+            snippet=snippet,
+        )
+        for row, rank_value, title_highlight, snippet in session.execute(stmt)
+    ]
+
+
+SIMILAR_DEFAULT_THRESHOLD = 0.5
+SIMILAR_DEFAULT_LIMIT = 5
+SIMILAR_MAX_LIMIT = 50
+
+# Whether pg_trgm is installed, per database URL
+_pg_trgm_installed: Dict[str, bool] = {}
+
+
+class SimilarTasksExist(ValueError):
+    """Raised by :func:`create_task` when its duplicate check finds matches."""
+
+    def __init__(self, matches: List[SimilarTask]) -> None:
+        super().__init__("Tasks with similar titles already exist")
+        self.matches = matches
+
+
+def _has_pg_trgm(session: Session) -> bool:
+    bind = session.get_bind()
+    key = str(getattr(bind, "engine", bind).url)
+    if key not in _pg_trgm_installed:
+        _pg_trgm_installed[key] = bool(
+            session.scalar(
+                select(func.to_regprocedure("similarity(text,text)").is_not(None))
+            )
+        )
+    return _pg_trgm_installed[key]
+
+
+def _similar_task_ids_by_scan(
+    session: Session,
+    *,
+    title: str,
+    threshold: float,
+    limit: int,
+    written_after: Optional[int] = None,
+) -> List[Tuple[uuid.UUID, float]]:
+    # Without pg_trgm: score every normalized title with the same trigram rules
+    query = trigrams(session.scalar(select(func.task_title_normalize(title))) or "")
+    stmt = select(TaskRow.id, TaskRow.title_normalized)
+    if written_after is not None:
+        stmt = stmt.where(TaskRow.version > written_after)
+    candidates = session.execute(stmt.execution_options(yield_per=1000))
+    matches = [
+        (task_id, score)
+        for task_id, normalized in candidates
+        if (score := similarity(query, trigrams(normalized))) >= threshold
+    ]
+    matches.sort(key=lambda m: (-m[1], m[0]))
+    return matches[:limit]
+
+
+def find_similar_tasks(
+    session: Session,
+    *,
+    title: str,
+    threshold: Optional[float] = None,
+    limit: Optional[int] = None,
+) -> List[SimilarTask]:
+    """Tasks whose normalized titles are trigram-similar to ``title``.
+
+    With ``pg_trgm`` this is one query on the ``ix_tasks_title_trgm`` GIN
+    index. Without it, normalized titles are scanned and scored in Python with
+    equivalent results.
+    """
+    if not title.strip():
+        raise ValueError("title must not be empty")
+    threshold = SIMILAR_DEFAULT_THRESHOLD if threshold is None else threshold
+    if not 0 < threshold <= 1:
+        raise ValueError("threshold must be greater than 0 and at most 1")
+    limit = SIMILAR_DEFAULT_LIMIT if limit is None else limit
+    if not 1 <= limit <= SIMILAR_MAX_LIMIT:
+        raise ValueError(f"limit must be between 1 and {SIMILAR_MAX_LIMIT}")
+
+    if not _has_pg_trgm(session):
+        scored = _similar_task_ids_by_scan(
+            session, title=title, threshold=threshold, limit=limit
+        )
+        return _load_similar_tasks(session, scored)
+
+    # The % operator is what the index serves; it filters on this setting
+    session.execute(
+        select(func.set_config("pg_trgm.similarity_threshold", str(threshold), True))
+    )
+    normalized = func.task_title_normalize(title)
+    score = func.similarity(TaskRow.title_normalized, normalized)
+    stmt = (
+        select(TaskRow, score)
+        .where(TaskRow.title_normalized.bool_op("%")(normalized))
+        .where(score >= threshold)
+        .options(selectinload(TaskRow.prerequisites))
+        .order_by(score.desc(), TaskRow.id)
+        .limit(limit)
+    )
+    return [
+        SimilarTask.model_construct(task=_to_api_task(row), similarity=value)
+        for row, value in session.execute(stmt)
+    ]
+
+
+def _load_similar_tasks(
+    session: Session, scored: Sequence[Tuple[uuid.UUID, float]]
+) -> List[SimilarTask]:
+    rows = {
+        row.id: row
+        for row in session.scalars(
+            select(TaskRow)
+            .where(TaskRow.id.in_([task_id for task_id, _ in scored]))
+            .options(selectinload(TaskRow.prerequisites))
+        )
+    }
+    return [
+        SimilarTask.model_construct(task=_to_api_task(rows[task_id]), similarity=score)
+        for task_id, score in scored
+        if task_id in rows
+    ]
+
+
+def _check_duplicates(
+    session: Session, *, title: str, threshold: float
+) -> List[SimilarTask]:
+    """Find tasks similar to ``title`` and take the duplicate-check lock.
+
+    With ``pg_trgm`` the indexed lookup runs under the lock. Without it, the
+    titles are scanned before the lock, so other checked creates do not queue
+    behind the scan; under the lock, only tasks written since are scored.
+    """
+    if _has_pg_trgm(session):
+        session.execute(select(func.pg_advisory_xact_lock(_DUPLICATE_CHECK_LOCK_KEY)))
+        return find_similar_tasks(session, title=title, threshold=threshold)
+
+    since = session.scalar(_CHECKED_CREATES_VERSION, {"key": _DUPLICATE_CHECK_LOCK_KEY})
+    matches = find_similar_tasks(session, title=title, threshold=threshold)
+    session.execute(select(func.pg_advisory_xact_lock(_DUPLICATE_CHECK_LOCK_KEY)))
+    recent = _similar_task_ids_by_scan(
+        session,
+        title=title,
+        threshold=threshold,
+        limit=SIMILAR_DEFAULT_LIMIT,
+        written_after=since,
+    )
+    seen = {m.task.id for m in matches}
+    matches += _load_similar_tasks(
+        session, [(task_id, score) for task_id, score in recent if task_id not in seen]
+    )
+    matches.sort(key=lambda m: (-m.similarity, m.task.id))
+    return matches[:SIMILAR_DEFAULT_LIMIT]
+
+
 def _load_prerequisites_by_ids(
     session: Session, ids: Iterable[uuid.UUID]
 ) -> List[TaskRow]:
@@ -59,11 +656,74 @@ def _load_prerequisites_by_ids(
     return list(result.scalars().all())
 
 
-def _map_status_from_api(status: ApiTaskStatus) -> TaskStatusEnum:
-    return TaskStatusEnum(status.value)
+def _load_prerequisites_by_titles(
+    session: Session, titles: Iterable[str]
+) -> List[TaskRow]:
+    if not titles:
+        return []
+    stmt = select(TaskRow).where(TaskRow.title.in_(list(titles)))
+    result = session.execute(stmt)
+    return list(result.scalars().all())
 
 
-def create_task(session: Session, *, body: CreateTaskRequest) -> ApiTask:
+def _resolve_prerequisites(
+    session: Session,
+    *,
+    ids: Optional[Sequence[uuid.UUID]],
+    titles: Optional[Sequence[str]] = None,
+) -> List[TaskRow]:
+    resolved: Dict[uuid.UUID, TaskRow] = {}
+    if ids:
+        prereq_rows = _load_prerequisites_by_ids(session, ids)
+        if len(prereq_rows) != len(set(ids)):
+            raise ValueError("One or more prerequisite tasks do not exist")
+        resolved.update((r.id, r) for r in prereq_rows)
+    if titles:
+        prereq_rows = _load_prerequisites_by_titles(session, titles)
+        if len(prereq_rows) != len(set(titles)):
+            raise ValueError("One or more prerequisite tasks do not exist")
+        resolved.update((r.id, r) for r in prereq_rows)
+    return list(resolved.values())
+
+
+def _check_no_cycle(
+    session: Session, *, task_id: uuid.UUID, prerequisite_ids: Sequence[uuid.UUID]
+) -> None:
+    """Raise ``ValueError`` if depending on ``prerequisite_ids`` closes a cycle.
+
+    A recursive CTE walks the prerequisites of the new prerequisites; the task
+    must not be among them. Postgres evaluates the CTE lazily, so the walk
+    stops at the first hit and only visits the reachable part of the graph.
+    The caller must hold the graph lock (``_lock_for_write(graph=True)``), or
+    two updates could each pass the check and together close a cycle.
+    """
+    if not prerequisite_ids:
+        return
+    if task_id in prerequisite_ids:
+        raise ValueError("A task cannot be its own prerequisite")
+    edges = task_prerequisites.c
+    reachable = (
+        select(edges.prerequisite_task_id.label("id"))
+        .where(edges.task_id.in_(list(prerequisite_ids)))
+        .cte("reachable", recursive=True)
+    )
+    # UNION (not UNION ALL) keeps the walk finite on graphs that already
+    # contain a cycle.
+    reachable = reachable.union(
+        select(edges.prerequisite_task_id).join(
+            reachable, edges.task_id == reachable.c.id
+        )
+    )
+    if session.scalar(select(exists().where(reachable.c.id == task_id))):
+        raise ValueError("Prerequisites would create a dependency cycle")
+
+
+def _add_task(
+    session: Session,
+    *,
+    body: CreateTaskRequest,
+    prerequisite_titles: Optional[Sequence[str]] = None,
+) -> TaskRow:
     row = TaskRow(
         title=body.title,
         description=body.description,
@@ -72,14 +732,81 @@ def create_task(session: Session, *, body: CreateTaskRequest) -> ApiTask:
         duration_seconds=body.duration_seconds,
         deadline=body.deadline,
     )
-    if body.prerequisite_tasks:
-        prereq_rows = _load_prerequisites_by_ids(session, body.prerequisite_tasks)
-        if len(prereq_rows) != len(set(body.prerequisite_tasks)):
-            raise ValueError("One or more prerequisite tasks do not exist")
-        row.prerequisites = prereq_rows
-
+    if body.prerequisite_tasks or prerequisite_titles:
+        row.prerequisites = _resolve_prerequisites(
+            session, ids=body.prerequisite_tasks, titles=prerequisite_titles
+        )
     session.add(row)
+    return row
+
+
+def _apply_update(
+    session: Session,
+    row: TaskRow,
+    *,
+    body: UpdateTaskRequest,
+    prerequisite_titles: Optional[Sequence[str]] = None,
+) -> None:
+    # Always emit an UPDATE, even for prerequisite-only changes, so that the
+    # updated_at and version onupdate defaults fire
+    row.updated_at = func.now()
+    if body.description is not None:
+        row.description = body.description
+    if body.status is not None:
+        row.status = _map_status_from_api(body.status)
+    if body.priority is not None:
+        row.priority = body.priority
+    if body.duration_seconds is not None:
+        row.duration_seconds = body.duration_seconds
+    if body.deadline is not None:
+        row.deadline = body.deadline
+    if body.prerequisite_tasks is not None or prerequisite_titles is not None:
+        prerequisites = _resolve_prerequisites(
+            session, ids=body.prerequisite_tasks, titles=prerequisite_titles
+        )
+        # A new task has no dependents yet, so only updates can close a cycle
+        _check_no_cycle(
+            session, task_id=row.id, prerequisite_ids=[p.id for p in prerequisites]
+        )
+        row.prerequisites = prerequisites
+
+
+def _delete_task(session: Session, row: TaskRow) -> ApiTask:
+    api_task = _to_api_task(row)
+    dependent_ids = [t.id for t in row.dependents]
+    _prune_tombstones(session)
+    session.add(TaskTombstoneRow(id=row.id, title=row.title))
+    session.delete(row)
+    if dependent_ids:
+        # Deleting a task also unlinks it from its dependents
+        session.execute(
+            update(TaskRow)
+            .where(TaskRow.id.in_(dependent_ids))
+            .values(version=task_change_version_seq.next_value(), updated_at=func.now())
+        )
+    return api_task
+
+
+def create_task(session: Session, *, body: CreateTaskRequest) -> ApiTask:
+    """Insert a task.
+
+    With ``duplicate_threshold`` set, raise :class:`SimilarTasksExist` instead
+    when a task with a similar title exists. Duplicate-checked creates run one
+    at a time, so two of them cannot both miss each other; a create without a
+    threshold is not checked against. The caller's transaction is left open
+    either way.
+    """
+    _lock_for_write(session, graph=bool(body.prerequisite_tasks))
+    if body.duplicate_threshold is not None:
+        matches = _check_duplicates(
+            session, title=body.title, threshold=body.duplicate_threshold
+        )
+        if matches:
+            raise SimilarTasksExist(matches)
+    row = _add_task(session, body=body)
     try:
+        session.flush()
+        notify_task_changes(session, op="create", task_ids=[row.id])
         session.commit()
     except IntegrityError as exc:
         session.rollback()
@@ -88,30 +815,166 @@ def create_task(session: Session, *, body: CreateTaskRequest) -> ApiTask:
     return _to_api_task(row)
 
 
+def _copy_rows(session: Session, sql: str, rows: Iterable[Sequence[Any]]) -> None:
+    """Run ``COPY ... FROM STDIN`` on the session's connection and transaction."""
+    driver_conn = session.connection().connection.driver_connection
+    if isinstance(driver_conn, psycopg.AsyncConnection):
+        # Called through AsyncSession.run_sync: drive the async COPY API from
+        # the greenlet SQLAlchemy runs us in.
+        await_only(_copy_rows_async(driver_conn, sql, rows))
+        return
+    with driver_conn.cursor() as cur:
+        with cur.copy(sql) as copy:
+            for row in rows:
+                copy.write_row(row)
+
+
+async def _copy_rows_async(
+    driver_conn: psycopg.AsyncConnection, sql: str, rows: Iterable[Sequence[Any]]
+) -> None:
+    async with driver_conn.cursor() as cur:
+        async with cur.copy(sql) as copy:
+            for row in rows:
+                await copy.write_row(row)
+
+
+_IMPORT_REQUIRED_FIELDS = (
+    "title",
+    "description",
+    "status",
+    "priority",
+    "duration_seconds",
+)
+
+
+def _parse_import_record(record: Mapping[str, Any], index: int) -> _ImportRow:
+    missing = [f for f in _IMPORT_REQUIRED_FIELDS if record.get(f) in (None, "")]
+    if missing:
+        raise ValueError(f"Record {index}: missing required fields {missing}")
+    try:
+        status = TaskStatusEnum(record["status"])
+        priority = int(record["priority"])
+        duration_seconds = int(record["duration_seconds"])
+        deadline = record.get("deadline")
+        if isinstance(deadline, str):
+            deadline = dt.datetime.fromisoformat(deadline)
+        elif deadline is not None:
+            raise ValueError("deadline must be an ISO 8601 string")
+    except (TypeError, ValueError) as exc:
+        # e.g. "priority": [1] from JSONL is a TypeError for int()
+        raise ValueError(f"Record {index}: {exc}") from exc
+    if priority < 0 or duration_seconds < 0:
+        raise ValueError(
+            f"Record {index}: priority and duration_seconds must be non-negative"
+        )
+    prerequisites = record.get("prerequisites") or []
+    if not isinstance(prerequisites, list) or not all(
+        isinstance(t, str) for t in prerequisites
+    ):
+        raise ValueError(f"Record {index}: prerequisites must be a list of titles")
+    return _ImportRow(
+        id=uuid.uuid4(),
+        title=str(record["title"]),
+        description=str(record["description"]),
+        status=status,
+        priority=priority,
+        duration_seconds=duration_seconds,
+        deadline=deadline,
+        prerequisite_titles=list(dict.fromkeys(prerequisites)),
+    )
+
+
+def bulk_import_tasks(
+    session: Session, *, records: Iterable[Mapping[str, Any]]
+) -> ImportTasksResponse:
+    """Validate and load many tasks at once using Postgres ``COPY``.
+
+    Prerequisites are resolved by title, first within the batch and then
+    against existing tasks. Everything is written in one transaction, so either
+    the whole batch is imported or nothing is.
+    """
+    rows: List[_ImportRow] = []
+    ids_by_title: Dict[str, uuid.UUID] = {}
+    for index, record in enumerate(records, start=1):
+        row = _parse_import_record(record, index)
+        if row.title in ids_by_title:
+            raise ValueError(f"Record {index}: duplicate title '{row.title}'")
+        ids_by_title[row.title] = row.id
+        rows.append(row)
+
+    unresolved = {
+        title
+        for row in rows
+        for title in row.prerequisite_titles
+        if title not in ids_by_title
+    }
+    if unresolved:
+        stmt = select(TaskRow.title, TaskRow.id).where(
+            TaskRow.title.in_(sorted(unresolved))
+        )
+        existing = dict(session.execute(stmt).tuples().all())
+        missing = sorted(unresolved - existing.keys())
+        if missing:
+            raise ValueError(f"Unknown prerequisite titles: {missing[:10]}")
+        ids_by_title.update(existing)
+
+    links = [
+        (row.id, ids_by_title[title])
+        for row in rows
+        for title in row.prerequisite_titles
+    ]
+    if any(task_id == prereq_id for task_id, prereq_id in links):
+        raise ValueError("A task cannot be its own prerequisite")
+    # Existing tasks cannot depend on new ones, so any cycle lies within the batch
+    new_ids = {row.id for row in rows}
+    _dependency_depths(link for link in links if link[1] in new_ids)
+    # Nothing is written before this point
+    _lock_for_write(session, graph=bool(links))
+
+    try:
+        notify_task_changes(session, op="import", task_ids=[row.id for row in rows])
+        _copy_rows(
+            session,
+            "COPY tasks (id, title, description, status, priority,"
+            " duration_seconds, deadline) FROM STDIN",
+            (
+                (
+                    row.id,
+                    row.title,
+                    row.description,
+                    row.status.value,
+                    row.priority,
+                    row.duration_seconds,
+                    row.deadline,
+                )
+                for row in rows
+            ),
+        )
+        _copy_rows(
+            session,
+            "COPY task_prerequisites (task_id, prerequisite_task_id) FROM STDIN",
+            links,
+        )
+        session.commit()
+    except psycopg.IntegrityError as exc:
+        session.rollback()
+        raise ValueError(
+            "Import failed: a task with one of these titles already exists"
+        ) from exc
+    return ImportTasksResponse(imported=len(rows), prerequisite_links=len(links))
+
+
 def update_task_by_title(
     session: Session, *, title: str, body: UpdateTaskRequest
 ) -> Optional[ApiTask]:
+    _lock_for_write(session, graph=body.prerequisite_tasks is not None)
     row = get_task_by_title(session, title=title)
     if row is None:
         return None
 
-    if body.description is not None:
-        row.description = body.description
-    if body.status is not None:
-        row.status = _map_status_from_api(body.status)
-    if body.priority is not None:
-        row.priority = body.priority
-    if body.duration_seconds is not None:
-        row.duration_seconds = body.duration_seconds
-    if body.deadline is not None:
-        row.deadline = body.deadline
-    if body.prerequisite_tasks is not None:
-        prereq_rows = _load_prerequisites_by_ids(session, body.prerequisite_tasks)
-        if len(prereq_rows) != len(set(body.prerequisite_tasks)):
-            raise ValueError("One or more prerequisite tasks do not exist")
-        row.prerequisites = prereq_rows
-
+    _apply_update(session, row, body=body)
     try:
+        notify_task_changes(session, op="update", task_ids=[row.id])
         session.commit()
     except IntegrityError as exc:
         session.rollback()
@@ -121,10 +984,163 @@ def update_task_by_title(
 
 
 def delete_task_by_title(session: Session, *, title: str) -> Optional[ApiTask]:
+    # The task's edges go with it
+    _lock_for_write(session, graph=True)
     row = get_task_by_title(session, title=title)
     if row is None:
         return None
-    api_task = _to_api_task(row)
-    session.delete(row)
+    api_task = _delete_task(session, row)
+    notify_task_changes(session, op="delete", task_ids=[row.id])
     session.commit()
     return api_task
+
+
+def _apply_batch_operation(session: Session, op: BatchTaskOperation) -> ApiTask:
+    if op.type is BatchTaskOperationType.CREATE:
+        row = _add_task(
+            session,
+            body=CreateTaskRequest(
+                title=op.title,
+                description=op.description,
+                status=op.status,
+                priority=op.priority,
+                duration_seconds=op.duration_seconds,
+                deadline=op.deadline,
+                prerequisite_tasks=op.prerequisite_tasks,
+            ),
+            prerequisite_titles=op.prerequisite_titles,
+        )
+        session.flush()
+        return _to_api_task(row)
+
+    row = get_task_by_title(session, title=op.title)
+    if row is None:
+        raise ValueError("Task not found")
+    if op.type is BatchTaskOperationType.DELETE:
+        api_task = _delete_task(session, row)
+        session.flush()
+        return api_task
+
+    _apply_update(
+        session,
+        row,
+        body=UpdateTaskRequest(
+            title=op.title,
+            description=op.description,
+            status=op.status,
+            priority=op.priority,
+            duration_seconds=op.duration_seconds,
+            deadline=op.deadline,
+            prerequisite_tasks=op.prerequisite_tasks,
+        ),
+        prerequisite_titles=op.prerequisite_titles,
+    )
+    session.flush()
+    return _to_api_task(row)
+
+
+def apply_batch(
+    session: Session,
+    *,
+    operations: Sequence[BatchTaskOperation],
+    atomic: bool = False,
+) -> BatchTasksResponse:
+    """Apply create/update/delete operations in order with a single commit.
+
+    Each operation runs in its own savepoint, so a failing operation is rolled
+    back and reported without affecting the others. With ``atomic`` the first
+    failure rolls back the whole batch and raises ``ValueError``.
+    """
+    _lock_for_write(
+        session,
+        graph=any(
+            op.type is BatchTaskOperationType.DELETE
+            or op.prerequisite_tasks is not None
+            or op.prerequisite_titles is not None
+            for op in operations
+        ),
+    )
+    results: List[BatchTaskResult] = []
+    for index, op in enumerate(operations):
+        try:
+            with session.begin_nested():
+                task = _apply_batch_operation(session, op)
+        except (ValueError, IntegrityError) as exc:
+            error = str(exc.orig) if isinstance(exc, IntegrityError) else str(exc)
+            if atomic:
+                session.rollback()
+                raise ValueError(
+                    f"Operation {index} ({op.type.value} '{op.title}') failed: {error}"
+                ) from exc
+            results.append(
+                BatchTaskResult(index=index, type=op.type, title=op.title, error=error)
+            )
+            continue
+        results.append(
+            BatchTaskResult(index=index, type=op.type, title=op.title, task=task)
+        )
+    changed_ids = [r.task.id for r in results if r.task is not None]
+    if changed_ids:
+        notify_task_changes(session, op="batch", task_ids=changed_ids)
+    session.commit()
+    return BatchTasksResponse(results=results)
+
+
+def get_change_version(session: Session) -> Optional[int]:
+    """Latest change version whose writing transaction has finished.
+
+    ``None`` while write transactions are in flight: readers only try the
+    change-feed lock, so they never queue behind (or in front of) writers.
+    """
+    return session.scalar(_DRAINED_CHANGE_VERSION, {"key": _CHANGE_FEED_LOCK_KEY})
+
+
+def check_changes_available(session: Session, *, since: int) -> None:
+    """Raise :class:`ChangesPruned` if deletes after ``since`` may have been pruned."""
+    if since == 0:
+        # A full snapshot needs no tombstones
+        return
+    pruned_version = session.scalar(select(TaskChangeFeedRow.pruned_version)) or 0
+    if since < pruned_version:
+        raise ChangesPruned(pruned_version)
+
+
+def get_task_changes(session: Session, *, since: int = 0) -> TaskChangesResponse:
+    """Tasks written and deleted after change version ``since``.
+
+    The returned ``version`` is the high-water mark to pass as ``since`` next
+    time. It is read while no write transaction is in flight, so a change
+    with a lower version can never become visible after this call. While
+    writes are in flight it stays at ``since``: every visible change is
+    returned and will be again on the next call.
+    """
+    if since < 0:
+        raise ValueError("since must be a non-negative version")
+    check_changes_available(session, since=since)
+    version = get_change_version(session)
+    task_query = (
+        select(TaskRow)
+        .where(TaskRow.version > since)
+        .options(selectinload(TaskRow.prerequisites))
+        .order_by(TaskRow.version)
+    )
+    tombstone_query = (
+        select(TaskTombstoneRow)
+        .where(TaskTombstoneRow.version > since)
+        .order_by(TaskTombstoneRow.version)
+    )
+    if version is None:
+        version = since
+    else:
+        task_query = task_query.where(TaskRow.version <= version)
+        tombstone_query = tombstone_query.where(TaskTombstoneRow.version <= version)
+    tasks = session.scalars(task_query)
+    tombstones = session.scalars(tombstone_query)
+    return TaskChangesResponse(
+        version=version,
+        tasks=[_to_api_task(row) for row in tasks],
+        deleted=[
+            TaskTombstone(id=row.id, title=row.title, version=row.version)
+            for row in tombstones
+        ],
+    )
@@ -0,0 +1,190 @@
+"""Vectorized urgency scoring over the whole task set.
+
+All tasks are loaded column-wise into NumPy arrays with a single query and
+scored in one pass, so ranking the full table costs a handful of array
+operations rather than a Python loop per task.
+
+The composite score is a weighted sum of four terms, each roughly in [0, 1]:
+
+- ``priority``: the task's priority relative to the highest in the set.
+- ``urgency``: how little slack is left before the deadline once the task's
+  own duration is accounted for (1 when overdue, 0 without a deadline).
+- ``blocking``: how many tasks directly wait on this one (log-scaled).
+- ``quick_win``: a small bonus for short tasks.
+
+Completed and cancelled tasks are not ranked.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import uuid
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import Float, String, cast, func, select
+from sqlalchemy.orm import Session, selectinload
+
+from taskmaster.api.resources.tasks.types.ranked_task import RankedTask
+from taskmaster.db.models.task import TaskRow, TaskStatusEnum, task_prerequisites
+from taskmaster.services.task_management.repo import _to_api_task
+
+ACTIVE_STATUSES: Tuple[str, ...] = (
+    TaskStatusEnum.TODO.value,
+    TaskStatusEnum.IN_PROGRESS.value,
+)
+
+
+@dataclass(frozen=True)
+class ScoringWeights:
+    priority: float = 1.0
+    urgency: float = 1.5
+    blocking: float = 0.75
+    quick_win: float = 0.25
+    # Slack (seconds) at which the urgency term has dropped to one half
+    deadline_horizon_seconds: float = 3 * 24 * 3600.0
+    # Duration (seconds) at which the quick-win term has dropped to one half
+    quick_win_seconds: float = 3600.0
+
+
+@dataclass
+class TaskColumns:
+    """Column-oriented snapshot of the task table."""
+
+    ids: List[uuid.UUID]
+    priority: np.ndarray  # float64
+    deadline: np.ndarray  # float64 epoch seconds, NaN without a deadline
+    duration_seconds: np.ndarray  # float64
+    status: np.ndarray  # unicode status values
+    dependents: np.ndarray  # int64 count of direct dependents
+    active: np.ndarray = field(init=False)  # bool
+
+    def __post_init__(self) -> None:
+        self.active = np.isin(self.status, ACTIVE_STATUSES)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def load_task_columns(session: Session) -> TaskColumns:
+    dependents = (
+        select(
+            task_prerequisites.c.prerequisite_task_id.label("task_id"),
+            func.count().label("dependents"),
+        )
+        .group_by(task_prerequisites.c.prerequisite_task_id)
+        .subquery()
+    )
+    stmt = select(
+        TaskRow.id,
+        TaskRow.priority,
+        cast(func.extract("epoch", TaskRow.deadline), Float),
+        TaskRow.duration_seconds,
+        cast(TaskRow.status, String),
+        func.coalesce(dependents.c.dependents, 0),
+    ).outerjoin(dependents, dependents.c.task_id == TaskRow.id)
+    rows = session.execute(stmt).all()
+    if not rows:
+        empty = np.empty(0)
+        return TaskColumns(
+            ids=[],
+            priority=empty,
+            deadline=empty,
+            duration_seconds=empty,
+            status=np.empty(0, dtype=str),
+            dependents=np.empty(0, dtype=np.int64),
+        )
+    ids, priority, deadline, duration, status, dependent_counts = zip(*rows)
+    return TaskColumns(
+        ids=list(ids),
+        priority=np.asarray(priority, dtype=np.float64),
+        # None becomes NaN
+        deadline=np.asarray(deadline, dtype=np.float64),
+        duration_seconds=np.asarray(duration, dtype=np.float64),
+        status=np.asarray(status, dtype=str),
+        dependents=np.asarray(dependent_counts, dtype=np.int64),
+    )
+
+
+def score_tasks(
+    columns: TaskColumns,
+    *,
+    now: Optional[dt.datetime] = None,
+    weights: ScoringWeights = ScoringWeights(),
+) -> np.ndarray:
+    """Composite urgency score per task; ``-inf`` for tasks that are not active."""
+    if len(columns) == 0:
+        return np.empty(0)
+    now_ts = (now or dt.datetime.now(dt.timezone.utc)).timestamp()
+
+    priority = columns.priority / max(float(columns.priority.max()), 1.0)
+
+    slack = columns.deadline - now_ts - columns.duration_seconds
+    urgency = weights.deadline_horizon_seconds / (
+        weights.deadline_horizon_seconds + np.maximum(slack, 0.0)
+    )
+    urgency = np.nan_to_num(urgency, nan=0.0)
+
+    most_dependents = int(columns.dependents.max())
+    blocking = (
+        np.log1p(columns.dependents) / np.log1p(most_dependents)
+        if most_dependents
+        else np.zeros(len(columns))
+    )
+
+    quick_win = weights.quick_win_seconds / (
+        weights.quick_win_seconds + columns.duration_seconds
+    )
+
+    score = (
+        weights.priority * priority
+        + weights.urgency * urgency
+        + weights.blocking * blocking
+        + weights.quick_win * quick_win
+    )
+    return np.where(columns.active, score, -np.inf)
+
+
+def rank_order(scores: np.ndarray, *, limit: Optional[int] = None) -> np.ndarray:
+    """Indices of ranked (finite-score) tasks, best first."""
+    ranked = np.flatnonzero(np.isfinite(scores))
+    if limit is not None and limit < len(ranked):
+        # Partition first so only the top ``limit`` scores get fully sorted
+        top = np.argpartition(-scores[ranked], limit - 1)[:limit]
+        ranked = ranked[top]
+    return ranked[np.argsort(-scores[ranked], kind="stable")]
+
+
+def rank_tasks(
+    session: Session,
+    *,
+    limit: Optional[int] = None,
+    now: Optional[dt.datetime] = None,
+    weights: ScoringWeights = ScoringWeights(),
+) -> List[RankedTask]:
+    """Score every task and return the active ones, most urgent first."""
+    if limit is not None and limit < 1:
+        raise ValueError("limit must be a positive integer")
+    columns = load_task_columns(session)
+    scores = score_tasks(columns, now=now, weights=weights)
+    order = rank_order(scores, limit=limit)
+
+    stmt = select(TaskRow).options(selectinload(TaskRow.prerequisites))
+    if limit is None:
+        # Every active task is ranked; avoid binding them all as IN parameters
+        stmt = stmt.where(
+            TaskRow.status.in_([TaskStatusEnum(s) for s in ACTIVE_STATUSES])
+        )
+    else:
+        top_ids: Sequence[uuid.UUID] = [columns.ids[i] for i in order]
+        stmt = stmt.where(TaskRow.id.in_(top_ids))
+    rows = session.scalars(stmt)
+    rows_by_id = {row.id: row for row in rows}
+    return [
+        RankedTask(
+            task=_to_api_task(rows_by_id[columns.ids[i]]), score=float(scores[i])
+        )
+        for i in order
+        if columns.ids[i] in rows_by_id
+    ]
@@ -0,0 +1,30 @@
+"""Trigram similarity matching Postgres' ``pg_trgm`` ``similarity()``.
+
+Used when the database has no ``pg_trgm`` extension: similar-title lookups
+then scan the normalized titles and score them here, with the same trigram
+rules (lowercase alphanumeric words, each padded with two leading blanks and
+one trailing blank), so thresholds mean the same with either backend.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import FrozenSet
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    grams = set()
+    for word in _WORD_RE.findall(text.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+def similarity(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Shared trigrams over all distinct trigrams of both texts (0 to 1)."""
+    if not a or not b:
+        return 0.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
@@ -5,15 +5,20 @@ from taskmaster.api.resources.transcription.types.transcription_response import
     TranscriptionResponse,
 )
 from taskmaster.services.transcription.transcription import transcribe_audio_file
+from taskmaster.utils import SingletonService
 import fastapi
+from starlette.concurrency import run_in_threadpool
 
 
-class TranscriptionService(AbstractTranscriptionService):
-    def create_transcription(
+class TranscriptionService(SingletonService, AbstractTranscriptionService):
+    async def create_transcription(
         self, *, file: fastapi.UploadFile
     ) -> TranscriptionResponse:
-        contents: bytes = file.file.read()
-        text: str = transcribe_audio_file(
-            contents, filename=getattr(file, "filename", None) or "audio.webm"
+        contents: bytes = await file.read()
+        # The OpenAI client call blocks; keep it off the event loop
+        text: str = await run_in_threadpool(
+            transcribe_audio_file,
+            contents,
+            filename=getattr(file, "filename", None) or "audio.webm",
         )
         return TranscriptionResponse(text=text)
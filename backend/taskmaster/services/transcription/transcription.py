@@ -8,6 +8,8 @@ from pathlib import Path
 
 from openai import OpenAI
 from taskmaster.config import get_settings
+from taskmaster.metrics import time_openai_call
+from taskmaster.tracing import span
 
 
 def transcribe_audio_file(file_bytes: bytes, filename: Optional[str] = None) -> str:
@@ -55,7 +57,11 @@ def transcribe_audio_file(file_bytes: bytes, filename: Optional[str] = None) ->
             tmp_path = tmp.name
 
         # Use Whisper for now
-        with open(tmp_path, "rb") as fh:
+        with (
+            open(tmp_path, "rb") as fh,
+            span("openai.audio.transcriptions.create"),
+            time_openai_call("audio.transcriptions.create"),
+        ):
             transcript = client.audio.transcriptions.create(
                 model="whisper-1",
                 file=fh,
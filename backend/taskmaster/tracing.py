@@ -0,0 +1,284 @@
+"""In-process tracing with W3C trace context propagation.
+
+Spans nest through a context variable, so ``with span("stage"):`` inside a
+request handler, an ``AsyncSession.run_sync`` greenlet or a threadpool worker
+becomes a child of the request's span. Finished spans go to local exporters
+(an in-memory ring buffer or a JSON Lines file), so traces work offline.
+
+Trace ids cross process boundaries as ``traceparent`` headers
+(https://www.w3.org/TR/trace-context/): :class:`TracingMiddleware` continues an
+incoming trace, and the agent hands the current ``traceparent`` to the MCP
+server, whose loopback calls into this API therefore join the generation's
+trace.
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import contextvars
+import functools
+import inspect
+import json
+import re
+import secrets
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from taskmaster.config import get_settings
+
+TRACEPARENT_HEADER = "traceparent"
+TRACE_ID_HEADER = "X-Trace-Id"
+
+_TRACEPARENT_RE = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start_time: float  # epoch seconds
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    duration_ms: Optional[float] = None
+    error: Optional[str] = None
+    _start_perf: float = field(default_factory=time.perf_counter, repr=False)
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "duration_ms": self.duration_ms,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class SpanExporter(Protocol):
+    def export(self, span: Span) -> None: ...
+
+
+class InMemorySpanExporter:
+    """Keep the most recent finished spans in process."""
+
+    def __init__(self, max_spans: int = 10_000) -> None:
+        self._spans: Deque[Span] = collections.deque(maxlen=max_spans)
+
+    def export(self, span: Span) -> None:
+        self._spans.append(span)
+
+    def spans(self, trace_id: Optional[str] = None) -> List[Span]:
+        return [s for s in list(self._spans) if trace_id in (None, s.trace_id)]
+
+    def clear(self) -> None:
+        self._spans.clear()
+
+
+class JsonLinesSpanExporter:
+    """Append each finished span to a file as one JSON object per line."""
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str) + "\n"
+        with self._lock, self._path.open("a", encoding="utf-8") as fh:
+            fh.write(line)
+
+
+_current_span: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "taskmaster_current_span", default=None
+)
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[Tuple[str, str]]:
+    """``(trace_id, parent span_id)`` from a ``traceparent`` header, if valid."""
+    match = _TRACEPARENT_RE.match((value or "").strip().lower())
+    if match is None or set(match.group(1)) == {"0"} or set(match.group(2)) == {"0"}:
+        return None
+    return match.group(1), match.group(2)
+
+
+class Tracer:
+    def __init__(self, exporters: Sequence[SpanExporter] = ()) -> None:
+        self.exporters = list(exporters)
+
+    @contextlib.contextmanager
+    def start_span(
+        self,
+        name: str,
+        *,
+        attributes: Optional[Dict[str, Any]] = None,
+        traceparent: Optional[str] = None,
+    ) -> Iterator[Span]:
+        """Run the block in a new span.
+
+        The span is a child of the current span, or of ``traceparent`` when
+        given (for spans continuing a trace from another process).
+        """
+        remote = parse_traceparent(traceparent)
+        parent = _current_span.get()
+        if remote is not None:
+            trace_id, parent_id = remote
+        elif parent is not None:
+            trace_id, parent_id = parent.trace_id, parent.span_id
+        else:
+            trace_id, parent_id = secrets.token_hex(16), None
+        span = Span(
+            name=name,
+            trace_id=trace_id,
+            span_id=secrets.token_hex(8),
+            parent_id=parent_id,
+            start_time=time.time(),
+            attributes=dict(attributes or {}),
+        )
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.error = f"{type(exc).__name__}: {exc}"
+            raise
+        finally:
+            _current_span.reset(token)
+            span.duration_ms = (time.perf_counter() - span._start_perf) * 1000.0
+            for exporter in self.exporters:
+                exporter.export(span)
+
+
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    global _tracer
+    if _tracer is None:
+        settings = get_settings()
+        exporters: List[SpanExporter] = []
+        if settings.tracing_exporter == "memory":
+            exporters.append(InMemorySpanExporter())
+        elif settings.tracing_exporter == "jsonl":
+            exporters.append(JsonLinesSpanExporter(settings.tracing_jsonl_path))
+        _tracer = Tracer(exporters)
+    return _tracer
+
+
+def set_tracer(tracer: Optional[Tracer]) -> None:
+    """Replace the process tracer (``None`` rebuilds it from settings)."""
+    global _tracer
+    _tracer = tracer
+
+
+def span(name: str, **attributes: Any) -> contextlib.AbstractContextManager[Span]:
+    return get_tracer().start_span(name, attributes=attributes)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def current_traceparent() -> Optional[str]:
+    active = _current_span.get()
+    return active.traceparent if active is not None else None
+
+
+def traced(name: str) -> Callable[[_F], _F]:
+    """Decorator running each call of a sync or async function in a span."""
+
+    def decorate(fn: _F) -> _F:
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with span(name):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+class TracingMiddleware:
+    """Run each HTTP request in a server span.
+
+    An incoming ``traceparent`` header makes the request part of the caller's
+    trace. The trace id is returned in ``X-Trace-Id``.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        traceparent = None
+        for name, value in scope.get("headers", []):
+            if name == TRACEPARENT_HEADER.encode():
+                traceparent = value.decode("latin-1")
+                break
+
+        method: str = scope["method"]
+        with get_tracer().start_span(
+            f"{method} {scope['path']}",
+            attributes={"http.method": method, "http.target": scope["path"]},
+            traceparent=traceparent,
+        ) as server_span:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    server_span.set_attribute("http.status_code", message["status"])
+                    headers = list(message.get("headers", []))
+                    headers.append(
+                        (
+                            TRACE_ID_HEADER.lower().encode(),
+                            server_span.trace_id.encode(),
+                        )
+                    )
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = getattr(scope.get("route"), "path", None)
+                if route is not None:
+                    # Name by route template so spans group across paths
+                    server_span.name = f"{method} {route}"
+                    server_span.set_attribute("http.route", route)
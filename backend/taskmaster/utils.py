@@ -0,0 +1,31 @@
+"""Helpers for wiring the Fern-generated routes into an app."""
+
+from __future__ import annotations
+
+import threading
+import typing
+
+_Service = typing.TypeVar("_Service", bound="SingletonService")
+
+
+class SingletonService:
+    """Mixin for Fern service implementations with no per-request state.
+
+    The generated routes resolve their service through ``Depends(cls)``, which
+    calls the class on every request. With this mixin every call returns the
+    class's first instance (the one passed to ``register()``), so the route's
+    own dependency is the cache and nothing has to be overridden per app.
+    Subclasses get an instance of their own.
+    """
+
+    _singleton_lock = threading.Lock()
+
+    def __new__(cls: typing.Type[_Service]) -> _Service:
+        instance = cls.__dict__.get("_singleton")
+        if instance is None:
+            with cls._singleton_lock:
+                instance = cls.__dict__.get("_singleton")
+                if instance is None:
+                    instance = super().__new__(cls)
+                    cls._singleton = instance  # type: ignore[attr-defined]
+        return instance
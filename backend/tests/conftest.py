@@ -2,15 +2,20 @@ import os
 import tempfile  # noqa: F401
 import contextlib  # noqa: F401
 import pytest
-from typing import Iterator
+from typing import AsyncIterator, Callable, ContextManager, Iterator
 
-from sqlalchemy import create_engine, event
+from sqlalchemy import Connection, create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
 
 from taskmaster.db.base import Base  # noqa: F401  # ensure models import
+from taskmaster.db.models.job import JobRow  # noqa: F401  # ensure models import
 from taskmaster.db.models.task import TaskRow  # noqa: F401  # ensure models import
-from taskmaster.db.session import get_db_session
+from taskmaster.db.query_stats import QueryStats, instrument_engine, track_queries
+from taskmaster.db.session import get_async_db_session, get_db_session
 from taskmaster.api.register import register as register_fern
+from taskmaster.services.jobs.core import JobsService
 from taskmaster.services.system.core import SystemService
 from taskmaster.services.task_management.core import TasksService
 from taskmaster.services.transcription.core import TranscriptionService
@@ -40,20 +45,29 @@ def _apply_migrations(_ensure_urls: None) -> None:
     os.system("uv run alembic upgrade head > /dev/null 2>&1")
 
 
+def _delete_all_rows(connection: Connection) -> None:
+    connection.exec_driver_sql("DELETE FROM task_closure")
+    connection.exec_driver_sql("DELETE FROM task_prerequisites")
+    connection.exec_driver_sql("DELETE FROM tasks")
+    connection.exec_driver_sql("DELETE FROM task_tombstones")
+    connection.exec_driver_sql("UPDATE task_change_feed SET pruned_version = 0")
+    connection.exec_driver_sql("DELETE FROM jobs")
+
+
 @pytest.fixture()
 def db_session(_apply_migrations: None) -> Iterator[Session]:
     # Provide a clean transactional scope per test
     settings = get_settings()
     sync_url = settings.get_alembic_database_url()
     engine = create_engine(sync_url, future=True)
+    instrument_engine(engine)
     connection = engine.connect()
     # Ensure a clean state for each test without taking heavy ACCESS EXCLUSIVE locks
     # that TRUNCATE would require (which can hang if another session holds locks).
     # We perform a quick cleanup transaction prior to the test transaction.
     try:
         cleanup_trans = connection.begin()
-        connection.exec_driver_sql("DELETE FROM task_prerequisites")
-        connection.exec_driver_sql("DELETE FROM tasks")
+        _delete_all_rows(connection)
         cleanup_trans.commit()
     except Exception:
         # Best-effort cleanup; continue even if deletion fails. The nested
@@ -63,19 +77,16 @@ def db_session(_apply_migrations: None) -> Iterator[Session]:
         except Exception:
             pass
     trans = connection.begin()
+    # Join the outer transaction through SAVEPOINTs so that commit()/rollback()
+    # inside code under test (including nested savepoints) never end it.
     TestingSessionLocal = sessionmaker(
-        bind=connection, class_=Session, expire_on_commit=False
+        bind=connection,
+        class_=Session,
+        expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
     )
     session = TestingSessionLocal()
 
-    # Start a SAVEPOINT so that even if code calls commit(), we can rollback
-    session.begin_nested()
-
-    @event.listens_for(session, "after_transaction_end")
-    def _restart_savepoint(sess, transaction):  # type: ignore[no-redef]
-        if transaction.nested and not transaction._parent.nested:  # type: ignore[attr-defined]
-            sess.begin_nested()
-
     try:
         yield session
     finally:
@@ -85,24 +96,67 @@ def db_session(_apply_migrations: None) -> Iterator[Session]:
 
 
 @pytest.fixture()
-def app(db_session: Session) -> FastAPI:
+def app(db_session: Session) -> Iterator[FastAPI]:
     # Build a FastAPI app instance and override DB dep to use the test session
     def _override_get_db_session() -> Iterator[Session]:
         yield db_session
 
+    # Async handlers run on the TestClient's own event loop, so they cannot
+    # share db_session's connection. They commit for real against the test
+    # database (NullPool: no connection outlives its loop) and the rows are
+    # deleted again on teardown.
+    url = get_settings().get_alembic_database_url()
+    async_engine = create_async_engine(url, poolclass=NullPool)
+    instrument_engine(async_engine)
+    AsyncTestingSessionLocal = async_sessionmaker(
+        bind=async_engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async def _override_get_async_db_session() -> AsyncIterator[AsyncSession]:
+        async with AsyncTestingSessionLocal() as session:
+            yield session
+
     application = FastAPI()
     register_fern(
         application,
+        jobs=JobsService(),
         system=SystemService(),
         tasks=TasksService(),
         transcription=TranscriptionService(),
     )
     # Override dependency for TasksService init
     application.dependency_overrides[get_db_session] = _override_get_db_session
-    return application
+    application.dependency_overrides[get_async_db_session] = (
+        _override_get_async_db_session
+    )
+    yield application
+
+    cleanup_engine = create_engine(url, future=True)
+    with cleanup_engine.begin() as connection:
+        _delete_all_rows(connection)
+    cleanup_engine.dispose()
 
 
 @pytest.fixture()
 def client(app: FastAPI) -> Iterator[TestClient]:
     with TestClient(app) as c:
         yield c
+
+
+@pytest.fixture()
+def query_budget() -> Callable[[int], ContextManager[QueryStats]]:
+    """Fail the test if the block runs more than ``max_queries`` statements.
+
+    Savepoint statements issued by the test session count too, so budgets
+    are per code path under test rather than absolute production numbers.
+    """
+
+    @contextlib.contextmanager
+    def budget(max_queries: int) -> Iterator[QueryStats]:
+        with track_queries() as stats:
+            yield stats
+        assert stats.count <= max_queries, (
+            f"expected at most {max_queries} statements, got {stats.describe()}"
+        )
+
+    return budget
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import inspect
+
+import pytest
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+
+from taskmaster.api.register import register as register_fern
+from taskmaster.api.resources.system.types.health_response import HealthResponse
+from taskmaster.services.jobs.core import JobsService
+from taskmaster.services.system.core import SystemService
+from taskmaster.services.task_management.core import TasksService
+from taskmaster.services.transcription.core import TranscriptionService
+
+
+def _route(app: FastAPI, path: str) -> APIRoute:
+    routes = list(app.routes)
+    for included in app.routes:
+        # Newer FastAPI keeps included routers wrapped instead of copying routes
+        if hasattr(included, "original_router"):
+            routes.extend(included.original_router.routes)
+    return next(r for r in routes if isinstance(r, APIRoute) and r.path == path)
+
+
+def test_health(client: TestClient) -> None:
+    resp = client.get("/api/health")
+    assert resp.status_code == 200
+    assert resp.json() == {"status": "OK"}
+
+
+def test_async_handlers_register_as_coroutines(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    app = FastAPI()
+    system = SystemService()
+    register_fern(
+        app,
+        jobs=JobsService(),
+        system=system,
+        tasks=TasksService(),
+        transcription=TranscriptionService(),
+    )
+
+    health = _route(app, "/api/health")
+    assert inspect.iscoroutinefunction(health.endpoint)
+    assert inspect.iscoroutinefunction(_route(app, "/api/get-tasks").endpoint)
+    # The generated routes call the service class on every request
+    (service_dependency,) = health.dependant.dependencies
+    assert service_dependency.call is SystemService
+    assert SystemService() is system
+    assert TranscriptionService() is TranscriptionService()
+    assert not isinstance(system, TranscriptionService)
+
+    served = []
+    get_health = SystemService.get_health
+
+    async def spy(self: SystemService) -> HealthResponse:
+        served.append(self)
+        return await get_health(self)
+
+    monkeypatch.setattr(SystemService, "get_health", spy)
+    # Nothing depends on app-level overrides, which test fixtures often clear
+    app.dependency_overrides.clear()
+    with TestClient(app) as client:
+        assert client.get("/api/health").json() == {"status": "OK"}
+        assert client.get("/api/health").json() == {"status": "OK"}
+    # Both requests were served by the registered instance
+    assert served == [system, system]
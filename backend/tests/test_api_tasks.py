@@ -1,7 +1,13 @@
 from __future__ import annotations
 
+import json
+import httpx
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, func, select
 from taskmaster.api.resources.tasks.types.task_status import TaskStatus
+from taskmaster.config import get_settings
+from taskmaster.services.task_management import repo
 
 
 def test_api_create_and_list_tasks(client: TestClient) -> None:
@@ -52,3 +58,408 @@ def test_api_update_and_delete_task(client: TestClient) -> None:
     # delete
     resp_del = client.post("/api/delete-task", json={"title": "api-task-b"})
     assert resp_del.status_code in (200, 404)
+
+
+def test_api_get_tasks_filters(client: TestClient) -> None:
+    for title, status, priority in (
+        ("api-filter-a", TaskStatus.TODO, 1),
+        ("api-filter-b", TaskStatus.IN_PROGRESS, 5),
+        ("api-filter-c", TaskStatus.TODO, 9),
+    ):
+        client.post(
+            "/api/create-task",
+            json={
+                "title": title,
+                "description": "d",
+                "status": status.value,
+                "priority": priority,
+                "duration_seconds": 60,
+            },
+        )
+
+    resp = client.get(
+        "/api/get-tasks",
+        params={"status": [TaskStatus.TODO.value], "priority_max": 5},
+    )
+    assert resp.status_code == 200, resp.text
+    assert [t["title"] for t in resp.json()] == ["api-filter-a"]
+
+    page = client.get("/api/get-tasks", params={"limit": 2})
+    assert len(page.json()) == 2
+    nxt = client.get(
+        "/api/get-tasks", params={"limit": 2, "cursor": page.json()[-1]["id"]}
+    )
+    assert len(nxt.json()) == 1
+
+    assert client.get("/api/get-tasks", params={"limit": 0}).status_code == 400
+
+
+def test_api_get_tasks_ndjson_stream(client: TestClient) -> None:
+    for title in ("api-ndjson-a", "api-ndjson-b"):
+        client.post(
+            "/api/create-task",
+            json={
+                "title": title,
+                "description": "d",
+                "status": TaskStatus.TODO.value,
+                "priority": 1,
+                "duration_seconds": 60,
+            },
+        )
+
+    resp = client.get("/api/get-tasks", headers={"Accept": "application/x-ndjson"})
+    assert resp.status_code == 200, resp.text
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert {t["title"] for t in lines} == {"api-ndjson-a", "api-ndjson-b"}
+
+
+def test_api_get_tasks_topological_order(client: TestClient) -> None:
+    first = client.post(
+        "/api/create-task",
+        json={
+            "title": "api-topo-a",
+            "description": "d",
+            "status": TaskStatus.TODO.value,
+            "priority": 1,
+            "duration_seconds": 60,
+        },
+    ).json()
+    client.post(
+        "/api/create-task",
+        json={
+            "title": "api-topo-b",
+            "description": "d",
+            "status": TaskStatus.TODO.value,
+            "priority": 1,
+            "duration_seconds": 60,
+            "prerequisite_tasks": [first["id"]],
+        },
+    )
+
+    resp = client.get("/api/get-tasks", params={"order": "TOPOLOGICAL"})
+    assert resp.status_code == 200, resp.text
+    assert [(t["title"], t["depth"]) for t in resp.json()] == [
+        ("api-topo-a", 0),
+        ("api-topo-b", 1),
+    ]
+
+    resp = client.post(
+        "/api/update-task",
+        json={"title": "api-topo-a", "prerequisite_tasks": [resp.json()[1]["id"]]},
+    )
+    assert resp.status_code == 400
+
+
+def test_api_import_tasks_csv(client: TestClient) -> None:
+    csv_body = (
+        "title,description,status,priority,duration_seconds,deadline,prerequisites\n"
+        "api-import-a,first,TODO,1,60,,\n"
+        "api-import-b,second,TODO,2,60,2030-01-01T00:00:00+00:00,api-import-a\n"
+    )
+    resp = client.post(
+        "/api/import-tasks",
+        files={"file": ("tasks.csv", csv_body.encode(), "text/csv")},
+    )
+    assert resp.status_code == 200, resp.text
+    assert resp.json() == {"imported": 2, "prerequisite_links": 1}
+
+    jsonl_body = json.dumps({"title": "api-import-c", "status": "TODO"}) + "\n"
+    bad = client.post(
+        "/api/import-tasks",
+        files={"file": ("tasks.jsonl", jsonl_body.encode(), "application/jsonl")},
+    )
+    assert bad.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [("priority", [1]), ("prerequisites", 5), ("deadline", 123)],
+)
+def test_api_import_tasks_rejects_mistyped_jsonl(
+    client: TestClient, field: str, value: object
+) -> None:
+    record = {
+        "title": "api-import-typed",
+        "description": "d",
+        "status": "TODO",
+        "priority": 1,
+        "duration_seconds": 60,
+        field: value,
+    }
+    resp = client.post(
+        "/api/import-tasks",
+        files={
+            "file": ("t.jsonl", json.dumps(record).encode(), "application/jsonl")
+        },
+    )
+    assert resp.status_code == 400, resp.text
+    assert "Record 1" in resp.text
+
+
+def test_api_batch_tasks(client: TestClient) -> None:
+    resp = client.post(
+        "/api/batch-tasks",
+        json={
+            "operations": [
+                {
+                    "type": "CREATE",
+                    "title": "api-batch-a",
+                    "description": "d",
+                    "status": TaskStatus.TODO.value,
+                    "priority": 1,
+                    "duration_seconds": 60,
+                },
+                {"type": "CREATE", "title": "api-batch-b"},
+                {"type": "UPDATE", "title": "api-batch-a", "priority": 3},
+            ]
+        },
+    )
+    assert resp.status_code == 200, resp.text
+    results = resp.json()["results"]
+    assert results[0]["task"]["title"] == "api-batch-a"
+    assert "error" in results[1]
+    assert results[2]["task"]["priority"] == 3
+
+
+def test_api_get_task_ancestors_and_descendants(client: TestClient) -> None:
+    base = client.post(
+        "/api/create-task",
+        json={
+            "title": "api-closure-a",
+            "description": "d",
+            "status": TaskStatus.TODO.value,
+            "priority": 1,
+            "duration_seconds": 60,
+        },
+    ).json()
+    client.post(
+        "/api/create-task",
+        json={
+            "title": "api-closure-b",
+            "description": "d",
+            "status": TaskStatus.TODO.value,
+            "priority": 1,
+            "duration_seconds": 60,
+            "prerequisite_tasks": [base["id"]],
+        },
+    )
+
+    resp = client.get("/api/get-task-ancestors", params={"title": "api-closure-b"})
+    assert resp.status_code == 200, resp.text
+    assert [(t["title"], t["depth"]) for t in resp.json()] == [("api-closure-a", 1)]
+    resp = client.get(
+        "/api/get-task-descendants", params={"title": "api-closure-a", "max_depth": 1}
+    )
+    assert [t["title"] for t in resp.json()] == ["api-closure-b"]
+    missing = client.get("/api/get-task-descendants", params={"title": "nope"})
+    assert missing.status_code == 404
+
+
+def test_api_rank_tasks(client: TestClient) -> None:
+    for title, priority in (("api-rank-low", 1), ("api-rank-high", 9)):
+        client.post(
+            "/api/create-task",
+            json={
+                "title": title,
+                "description": "d",
+                "status": TaskStatus.TODO.value,
+                "priority": priority,
+                "duration_seconds": 60,
+            },
+        )
+
+    resp = client.get("/api/rank-tasks", params={"limit": 1})
+    assert resp.status_code == 200, resp.text
+    assert [r["task"]["title"] for r in resp.json()] == ["api-rank-high"]
+
+
+def test_api_search_tasks(client: TestClient) -> None:
+    for title, description, status in (
+        ("Renew passport", "Book an appointment at the consulate", "TODO"),
+        ("Book flights", "Compare airline prices for the passport trip", "TODO"),
+        ("Clean garage", "Nothing to see here", "TODO"),
+        ("Old passport photos", "Scan them", "COMPLETED"),
+    ):
+        client.post(
+            "/api/create-task",
+            json={
+                "title": title,
+                "description": description,
+                "status": status,
+                "priority": 1,
+                "duration_seconds": 60,
+            },
+        )
+
+    resp = client.get(
+        "/api/search-tasks", params={"query": "passports", "status": "TODO"}
+    )
+    assert resp.status_code == 200, resp.text
+    results = resp.json()
+    # Title matches outrank description matches; stemming matches "passports"
+    assert [r["task"]["title"] for r in results] == ["Renew passport", "Book flights"]
+    assert results[0]["title_highlight"] == "Renew <mark>passport</mark>"
+    assert "<mark>passport</mark>" in results[1]["snippet"]
+    assert results[0]["rank"] > results[1]["rank"]
+
+    # The index follows updates
+    client.post(
+        "/api/update-task",
+        json={"title": "Clean garage", "description": "Find the passport first"},
+    )
+    # Past the two title matches only the equally ranked description matches
+    page = client.get(
+        "/api/search-tasks", params={"query": "passport", "limit": 5, "offset": 2}
+    ).json()
+    assert sorted(r["task"]["title"] for r in page) == ["Book flights", "Clean garage"]
+    assert client.get("/api/search-tasks", params={"query": "-passport"}).json() == []
+
+    bad = client.get("/api/search-tasks", params={"query": "x", "limit": 1000})
+    assert bad.status_code == 400
+
+
+def test_api_find_similar_tasks_and_duplicate_check(client: TestClient) -> None:
+    def create(title: str, **extra: object) -> httpx.Response:
+        return client.post(
+            "/api/create-task",
+            json={
+                "title": title,
+                "description": "d",
+                "status": TaskStatus.TODO.value,
+                "priority": 1,
+                "duration_seconds": 60,
+                **extra,
+            },
+        )
+
+    create("Ship Q3 report")
+    create("Ship Q4 report")
+    create("Clean garage")
+
+    resp = client.get("/api/find-similar-tasks", params={"title": "ship the Q3 report"})
+    assert resp.status_code == 200, resp.text
+    matches = resp.json()
+    # Case and filler words are ignored, so the first match is exact
+    assert [m["task"]["title"] for m in matches] == ["Ship Q3 report", "Ship Q4 report"]
+    assert matches[0]["similarity"] == 1.0
+    assert 0.5 <= matches[1]["similarity"] < 1.0
+
+    strict = client.get(
+        "/api/find-similar-tasks",
+        params={"title": "ship the Q3 report", "threshold": 0.9},
+    ).json()
+    assert [m["task"]["title"] for m in strict] == ["Ship Q3 report"]
+
+    dup = create("Ship the Q3 report", duplicate_threshold=0.9)
+    assert dup.status_code == 409, dup.text
+    assert [m["task"]["title"] for m in dup.json()["similar_tasks"]] == [
+        "Ship Q3 report"
+    ]
+    assert create("Water plants", duplicate_threshold=0.9).status_code == 200
+    titles = {t["title"] for t in client.get("/api/get-tasks").json()}
+    assert "Ship the Q3 report" not in titles and "Water plants" in titles
+
+    bad = client.get("/api/find-similar-tasks", params={"title": "x", "threshold": 0})
+    assert bad.status_code == 400
+
+
+def test_api_get_task_changes(client: TestClient) -> None:
+    client.post(
+        "/api/create-task",
+        json={
+            "title": "api-feed",
+            "description": "d",
+            "status": TaskStatus.TODO.value,
+            "priority": 1,
+            "duration_seconds": 60,
+        },
+    )
+    snapshot = client.get("/api/get-task-changes").json()
+    assert [t["title"] for t in snapshot["tasks"]] == ["api-feed"]
+
+    client.post("/api/delete-task", json={"title": "api-feed"})
+    resp = client.get("/api/get-task-changes", params={"since": snapshot["version"]})
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["tasks"] == []
+    assert [t["title"] for t in resp.json()["deleted"]] == ["api-feed"]
+
+
+def test_api_task_changes_answer_410_once_deletes_were_pruned(
+    client: TestClient,
+) -> None:
+    def create(title: str) -> None:
+        resp = client.post(
+            "/api/create-task",
+            json={
+                "title": title,
+                "description": "d",
+                "status": TaskStatus.TODO.value,
+                "priority": 1,
+                "duration_seconds": 60,
+            },
+        )
+        assert resp.status_code == 200, resp.text
+
+    create("api-pruned")
+    create("api-kept")
+    since = client.get("/api/get-task-changes").json()["version"]
+    client.post("/api/delete-task", json={"title": "api-pruned"})
+    engine = create_engine(get_settings().get_alembic_database_url())
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            "UPDATE task_tombstones SET deleted_at = now() - interval '31 days'"
+        )
+    engine.dispose()
+    client.post("/api/delete-task", json={"title": "api-kept"})
+
+    resp = client.get("/api/get-task-changes", params={"since": since})
+    assert resp.status_code == 410
+    assert "resync" in resp.text
+    stream = client.get("/api/stream-task-changes", params={"since": since})
+    assert stream.status_code == 410
+    snapshot = client.get("/api/get-task-changes")
+    assert snapshot.status_code == 200
+    assert [t["title"] for t in snapshot.json()["deleted"]] == ["api-kept"]
+
+
+def test_api_get_tasks_etag(client: TestClient) -> None:
+    create = {
+        "title": "api-etag",
+        "description": "d",
+        "status": TaskStatus.TODO.value,
+        "priority": 1,
+        "duration_seconds": 60,
+    }
+    client.post("/api/create-task", json=create)
+
+    first = client.get("/api/get-tasks")
+    etag = first.headers["ETag"]
+    assert [t["title"] for t in first.json()] == ["api-etag"]
+
+    cached = client.get("/api/get-tasks", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    # Other filters are a different representation
+    filtered = client.get(
+        "/api/get-tasks", params={"priority_min": 2}, headers={"If-None-Match": etag}
+    )
+    assert filtered.status_code == 200 and filtered.json() == []
+
+    client.post("/api/update-task", json={"title": "api-etag", "priority": 3})
+    changed = client.get("/api/get-tasks", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert changed.json()[0]["priority"] == 3
+
+    # While a write is in flight the list is served without an ETag
+    engine = create_engine(get_settings().get_alembic_database_url())
+    with engine.connect() as writer, writer.begin():
+        writer.execute(
+            select(func.pg_advisory_xact_lock_shared(repo._CHANGE_FEED_LOCK_KEY))
+        )
+        busy = client.get("/api/get-tasks", headers={"If-None-Match": etag})
+        assert busy.status_code == 200
+        assert "ETag" not in busy.headers
+        assert busy.json()[0]["priority"] == 3
+    engine.dispose()
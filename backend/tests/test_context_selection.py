@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import uuid
+from typing import List, Optional
+
+from taskmaster.api.resources.tasks.types.generate_tasks_request import (
+    GenerateTasksRequest,
+)
+from taskmaster.api.resources.tasks.types.task import Task
+from taskmaster.api.resources.tasks.types.task_status import TaskStatus
+from taskmaster.config import get_settings
+from taskmaster.services.task_management.generation import agent
+from taskmaster.services.task_management.generation.context import (
+    BM25Index,
+    estimate_tokens,
+    select_context_tasks,
+    tokenize,
+)
+
+
+def _task(
+    title: str,
+    description: str = "",
+    *,
+    prerequisites: Optional[List[Task]] = None,
+    status: TaskStatus = TaskStatus.TODO,
+) -> Task:
+    return Task(
+        id=uuid.uuid4(),
+        title=title,
+        description=description,
+        status=status,
+        priority=1,
+        duration_seconds=60,
+        prerequisite_tasks=[t.id for t in prerequisites or []],
+    )
+
+
+def _backlog() -> List[Task]:
+    gather = _task("Gather receipts", "Collect all receipts for the quarter")
+    invoice = _task(
+        "Send invoices", "Email the client invoices", prerequisites=[gather]
+    )
+    chase = _task("Chase late payers", "Follow up", prerequisites=[invoice])
+    filler = [
+        _task(f"Garden chore {i}", "Water the plants and mow the lawn")
+        for i in range(20)
+    ]
+    return [*filler[:10], gather, invoice, chase, *filler[10:]]
+
+
+def test_tokenize_and_bm25_ranking() -> None:
+    assert tokenize("The Invoices, and a_b class!") == ["invoice", "b", "class"]
+
+    index = BM25Index([["invoice", "invoice"], ["invoice", "lawn"], ["lawn"]])
+    scores = index.scores(["invoice", "invoice"])
+    assert scores[0] > scores[1] > scores[2] == 0.0
+    assert index.scores(["unknown"]) == [0.0, 0.0, 0.0]
+
+
+def test_small_backlogs_are_sent_whole() -> None:
+    tasks = _backlog()
+    selection = select_context_tasks("send invoices", tasks, token_budget=100_000)
+    assert (selection.tasks, selection.dropped) == (tasks, 0)
+
+    # A budget of 0 disables selection
+    selection = select_context_tasks("send invoices", tasks, token_budget=0)
+    assert (selection.tasks, selection.dropped) == (tasks, 0)
+
+
+def test_relevant_tasks_and_their_dependency_neighbors_fit_the_budget() -> None:
+    tasks = _backlog()
+    per_task = max(estimate_tokens(t.model_dump_json()) for t in tasks)
+
+    selection = select_context_tasks(
+        "We still need to send the invoices this week",
+        tasks,
+        token_budget=per_task * 3,
+    )
+
+    # The match plus its prerequisite and dependent, in backlog order
+    assert [t.title for t in selection.tasks] == [
+        "Gather receipts",
+        "Send invoices",
+        "Chase late payers",
+    ]
+    assert selection.dropped == len(tasks) - 3
+
+
+def test_left_over_budget_prefers_open_tasks() -> None:
+    done = [_task(f"Old chore {i}", status=TaskStatus.COMPLETED) for i in range(5)]
+    open_tasks = [_task(f"Open chore {i}") for i in range(5)]
+    tasks = [*done, *open_tasks]
+    per_task = max(estimate_tokens(t.model_dump_json()) for t in tasks)
+
+    selection = select_context_tasks(
+        "unrelated words", tasks, token_budget=per_task * 5
+    )
+
+    assert selection.tasks == open_tasks
+    assert selection.dropped == 5
+
+
+def test_agent_prompt_notes_omitted_tasks() -> None:
+    tasks = _backlog()
+    per_task = max(estimate_tokens(t.model_dump_json()) for t in tasks)
+    settings = get_settings().model_copy(
+        update={"agent_context_token_budget": per_task * 3, "workspace_root": "/repo"}
+    )
+    body = GenerateTasksRequest(transcript="send the invoices", existing_tasks=tasks)
+
+    request = agent._agent_request(body, settings)
+
+    user_prompt = request["input"][-1]["content"]
+    assert "Send invoices" in user_prompt
+    assert "Garden chore" not in user_prompt
+    assert f"{len(tasks) - 3} existing tasks that look unrelated" in user_prompt
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import json
+import uuid
+from typing import Any, Dict, Iterator, List, Tuple
+
+import pytest
+from fastapi.testclient import TestClient
+
+from taskmaster.api.resources.tasks.types.generate_tasks_event import (
+    GenerateTasksEvent,
+)
+from taskmaster.api.resources.tasks.types.generate_tasks_event_type import (
+    GenerateTasksEventType,
+)
+from taskmaster.api.resources.tasks.types.generate_tasks_request import (
+    GenerateTasksRequest,
+)
+from taskmaster.api.resources.tasks.types.task import Task
+from taskmaster.services.task_management import core
+from taskmaster.services.task_management.generation import agent
+from taskmaster.services.task_management.generation.task_stream import (
+    TaskArrayParser,
+    parse_task_array,
+)
+
+
+def _task_json(title: str) -> Dict[str, Any]:
+    return {
+        "id": str(uuid.uuid4()),
+        "title": title,
+        "description": 'Say "hi" [later] {maybe}\\',
+        "status": "TODO",
+        "priority": 1,
+        "duration_seconds": 60,
+        "prerequisite_tasks": [],
+    }
+
+
+def _feed_in_chunks(text: str, size: int) -> List[Tuple[int, Dict[str, Any]]]:
+    """Feed ``text`` ``size`` characters at a time; (chunks fed, object) pairs."""
+    parser = TaskArrayParser()
+    found = []
+    for fed, start in enumerate(range(0, len(text), size), start=1):
+        found.extend((fed, obj) for obj in parser.feed(text[start : start + size]))
+    return found
+
+
+@pytest.mark.parametrize("size", [1, 3, 1000])
+def test_parser_yields_each_object_as_it_completes(size: int) -> None:
+    first, second = _task_json("first"), _task_json("second")
+    head = f"Done [2 changes]. Final list:\n```json\n[{json.dumps(first)},"
+    text = f"{head}\n  {json.dumps(second)}\n]\n```\nThe [end]."
+
+    found = _feed_in_chunks(text, size)
+
+    assert [obj for _, obj in found] == [first, second]
+    if size == 1:
+        # The first task is out as soon as its closing brace arrived
+        assert found[0][0] == len(head) - 1
+
+
+def test_parser_skips_invalid_entries_and_ignores_later_arrays() -> None:
+    text = '[{"title": "a"}, 1, "]", {"broken": }, [{"x": 1}], {"title": "b"}] [{"title": "c"}]'
+
+    assert parse_task_array(text) == [{"title": "a"}, {"title": "b"}]
+    assert parse_task_array("no tasks [here]") == []
+    assert parse_task_array("[]") == []
+
+
+class _FakeStream:
+    def __init__(self, events: List[Dict[str, Any]], consumed: List[int]) -> None:
+        self._events = events
+        self._consumed = consumed
+        self.closed = False
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for event in self._events:
+            self._consumed.append(1)
+            yield event
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _FakeClient:
+    def __init__(self, events: List[Dict[str, Any]]) -> None:
+        self.consumed: List[int] = []
+        self.stream = _FakeStream(events, self.consumed)
+        self.responses = self
+
+    def create(self, **kwargs: Any) -> _FakeStream:
+        assert kwargs["stream"] is True
+        return self.stream
+
+
+def _agent_events(tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    text = "Tasks:\n" + json.dumps(tasks)
+    deltas = [text[i : i + 7] for i in range(0, len(text), 7)]
+    call = {"type": "mcp_call", "name": "tasks.create_task_api_create_task_post"}
+    return [
+        {"type": "response.output_item.added", "item": call},
+        {"type": "response.output_item.done", "item": {**call, "error": None}},
+        *({"type": "response.output_text.delta", "delta": d} for d in deltas),
+        {"type": "response.completed", "response": {}},
+    ]
+
+
+def test_stream_tasks_with_agent_yields_tasks_before_the_output_ends(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    tasks = [_task_json(title) for title in ("first", "second", "third", "fourth")]
+    client = _FakeClient(_agent_events(tasks))
+    monkeypatch.setattr(agent, "_client", lambda settings: client)
+    monkeypatch.setattr(agent, "_agent_request", lambda body, settings: {})
+
+    events = agent.stream_tasks_with_agent(GenerateTasksRequest(transcript="x"))
+    seen = []
+    for event in events:
+        seen.append(event)
+        if event.type is GenerateTasksEventType.TASK and len(seen) == 5:
+            # Most of the model's output is still to come
+            assert len(client.consumed) < len(client.stream._events) / 3
+
+    assert [(e.type.value, e.stage) for e in seen] == [
+        ("PROGRESS", "rendering prompts"),
+        ("PROGRESS", "running agent"),
+        ("TOOL_CALL", "started"),
+        ("TOOL_CALL", "completed"),
+        *[("TASK", None)] * 4,
+        ("DONE", None),
+    ]
+    assert seen[2].tool == "tasks.create_task_api_create_task_post"
+    titles = ["first", "second", "third", "fourth"]
+    assert [e.task.title for e in seen[4:8]] == titles
+    assert [t.title for t in seen[-1].tasks] == titles
+    assert client.stream.closed
+
+
+def test_stream_tasks_with_agent_raises_failed_responses(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    failed = {"type": "response.failed", "response": {"error": {"message": "boom"}}}
+    client = _FakeClient([failed])
+    monkeypatch.setattr(agent, "_client", lambda settings: client)
+    monkeypatch.setattr(agent, "_agent_request", lambda body, settings: {})
+
+    with pytest.raises(RuntimeError, match="boom"):
+        list(agent.stream_tasks_with_agent(GenerateTasksRequest(transcript="x")))
+    assert client.stream.closed
+
+
+def _sse_events(body: str) -> List[Tuple[str, Dict[str, Any]]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_api_stream_generate_tasks(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    created = client.post(
+        "/api/create-task",
+        json={
+            "title": "existing",
+            "description": "",
+            "status": "TODO",
+            "priority": 1,
+            "duration_seconds": 60,
+        },
+    )
+    assert created.status_code == 200, created.text
+    seen_bodies: List[GenerateTasksRequest] = []
+
+    def fake_agent(body: GenerateTasksRequest) -> Iterator[GenerateTasksEvent]:
+        seen_bodies.append(body)
+        task = Task.model_validate(_task_json("streamed"))
+        yield GenerateTasksEvent(type=GenerateTasksEventType.PROGRESS, stage="s")
+        yield GenerateTasksEvent(type=GenerateTasksEventType.TASK, task=task)
+        # The model wrote no final list: the current tasks are sent instead
+        yield GenerateTasksEvent(type=GenerateTasksEventType.DONE, tasks=[])
+
+    monkeypatch.setattr(core, "stream_tasks_with_agent", fake_agent)
+    resp = client.post("/api/stream-generate-tasks", json={"transcript": "go"})
+
+    assert resp.status_code == 200, resp.text
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    events = _sse_events(resp.text)
+    assert [name for name, _ in events] == ["progress", "task", "done"]
+    assert events[1][1]["task"]["title"] == "streamed"
+    assert [t["title"] for t in events[2][1]["tasks"]] == ["existing"]
+    assert [t.title for t in seen_bodies[0].existing_tasks or []] == ["existing"]
+
+
+def test_api_stream_generate_tasks_reports_agent_errors(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def failing_agent(body: GenerateTasksRequest) -> Iterator[GenerateTasksEvent]:
+        yield GenerateTasksEvent(type=GenerateTasksEventType.PROGRESS, stage="s")
+        raise RuntimeError("model unavailable")
+
+    monkeypatch.setattr(core, "stream_tasks_with_agent", failing_agent)
+    resp = client.post(
+        "/api/stream-generate-tasks", json={"transcript": "go", "existing_tasks": []}
+    )
+
+    events = _sse_events(resp.text)
+    assert [name for name, _ in events] == ["progress", "error"]
+    assert events[1][1]["error"] == "RuntimeError: model unavailable"
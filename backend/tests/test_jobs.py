@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import datetime as dt
+import threading
+import uuid
+from typing import Any, Dict, Iterator, List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, func, select, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from taskmaster.config import get_settings
+from taskmaster.db.models.job import JobKindEnum, JobRow, JobStatusEnum
+from taskmaster.services.jobs import repo
+from taskmaster.services.jobs.handlers import JobContext
+from taskmaster.services.jobs.worker import Worker
+
+
+@pytest.fixture()
+def engine(client: TestClient) -> Iterator[Engine]:
+    # Jobs are committed for real by the API (see the app fixture), so workers
+    # use their own engine against the same database
+    engine = create_engine(get_settings().get_alembic_database_url())
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture()
+def sessions(engine: Engine) -> sessionmaker:
+    return sessionmaker(bind=engine, class_=Session, expire_on_commit=False)
+
+
+def _fake_generate(ctx: JobContext) -> Dict[str, Any]:
+    ctx.report_progress("running agent")
+    with ctx.session() as session:
+        progress = session.scalar(
+            select(JobRow.progress).where(JobRow.id == ctx.job.id)
+        )
+    assert progress == "running agent"
+    assert ctx.job.payload["transcript"] == "ship it"
+    return {"tasks": []}
+
+
+def _fake_transcribe(ctx: JobContext) -> Dict[str, Any]:
+    assert ctx.job.payload["filename"] == "note.wav"
+    return {"text": ctx.job.input.decode()}  # type: ignore[union-attr]
+
+
+HANDLERS = {
+    JobKindEnum.GENERATE_TASKS: _fake_generate,
+    JobKindEnum.TRANSCRIPTION: _fake_transcribe,
+}
+
+
+def test_submit_poll_and_fetch_results(
+    client: TestClient, sessions: sessionmaker
+) -> None:
+    resp = client.post("/api/submit-generate-tasks", json={"transcript": "ship it"})
+    assert resp.status_code == 200, resp.text
+    job = resp.json()
+    assert job["kind"] == "GENERATE_TASKS"
+    assert job["status"] == "QUEUED"
+    assert job["attempts"] == 0
+
+    pending = client.get("/api/get-generate-tasks-result", params={"id": job["id"]})
+    assert pending.status_code == 409
+    assert pending.json()["status"] == "QUEUED"
+
+    resp = client.post(
+        "/api/submit-transcription",
+        files={"file": ("note.wav", b"hello there", "audio/wav")},
+    )
+    assert resp.status_code == 200, resp.text
+    transcription = resp.json()
+
+    worker = Worker(sessions, handlers=HANDLERS)
+    assert worker.run_once()
+    assert worker.run_once()
+    assert not worker.run_once()
+
+    status = client.get("/api/get-job", params={"id": job["id"]}).json()
+    assert status["status"] == "SUCCEEDED"
+    assert status["attempts"] == 1
+    assert status["finished_at"] is not None
+    result = client.get("/api/get-generate-tasks-result", params={"id": job["id"]})
+    assert result.status_code == 200, result.text
+    assert result.json() == {"tasks": []}
+
+    result = client.get(
+        "/api/get-transcription-result", params={"id": transcription["id"]}
+    )
+    assert result.json() == {"text": "hello there"}
+    # Result endpoints only serve their own kind
+    wrong = client.get("/api/get-transcription-result", params={"id": job["id"]})
+    assert wrong.status_code == 404
+    assert (
+        client.get("/api/get-job", params={"id": str(uuid.uuid4())}).status_code == 404
+    )
+    with sessions() as session:
+        assert session.get(JobRow, uuid.UUID(transcription["id"])).input is None
+
+
+def _submit_transcription(client: TestClient) -> str:
+    resp = client.post(
+        "/api/submit-transcription",
+        files={"file": ("note.wav", b"hello there", "audio/wav")},
+    )
+    assert resp.status_code == 200, resp.text
+    return resp.json()["id"]
+
+
+def test_failed_attempts_are_retried_then_fail(
+    client: TestClient, sessions: sessionmaker
+) -> None:
+    calls: List[int] = []
+
+    def flaky(ctx: JobContext) -> Dict[str, Any]:
+        calls.append(ctx.job.attempts)
+        raise RuntimeError("model unavailable")
+
+    job_id = _submit_transcription(client)
+    worker = Worker(
+        sessions,
+        handlers={JobKindEnum.TRANSCRIPTION: flaky},
+        retry_backoff_seconds=0,
+    )
+    for _ in range(get_settings().job_max_attempts):
+        assert worker.run_once()
+        job = client.get("/api/get-job", params={"id": job_id}).json()
+        assert job["error"] == "RuntimeError: model unavailable"
+    assert not worker.run_once()
+
+    assert calls == [1, 2, 3]
+    assert job["status"] == "FAILED"
+    failed = client.get("/api/get-transcription-result", params={"id": job_id})
+    assert failed.status_code == 409
+    assert failed.json()["error"] == "RuntimeError: model unavailable"
+
+
+def test_generate_jobs_run_once(client: TestClient, sessions: sessionmaker) -> None:
+    calls: List[int] = []
+
+    def failing(ctx: JobContext) -> Dict[str, Any]:
+        # The agent may already have created tasks when it fails
+        calls.append(ctx.job.attempts)
+        raise RuntimeError("model unavailable")
+
+    failed_id = client.post(
+        "/api/submit-generate-tasks", json={"transcript": "x"}
+    ).json()["id"]
+    worker = Worker(
+        sessions,
+        handlers={JobKindEnum.GENERATE_TASKS: failing},
+        retry_backoff_seconds=0,
+    )
+    assert worker.run_once()
+    assert not worker.run_once()
+    assert calls == [1]
+    job = client.get("/api/get-job", params={"id": failed_id}).json()
+    assert (job["status"], job["attempts"]) == ("FAILED", 1)
+
+    # Nor does a job whose worker lost its lease run again
+    lost_id = client.post(
+        "/api/submit-generate-tasks", json={"transcript": "y"}
+    ).json()["id"]
+    with sessions() as session:
+        assert repo.claim_job(session, worker_id="dead", lease_seconds=60)
+        session.execute(
+            update(JobRow)
+            .where(JobRow.id == uuid.UUID(lost_id))
+            .values(run_after=func.now() - dt.timedelta(minutes=1))
+        )
+        session.commit()
+    assert worker.run_once()
+    assert calls == [1]
+    job = client.get("/api/get-job", params={"id": lost_id}).json()
+    assert job["status"] == "FAILED"
+    assert job["error"] == "Worker lost the job's lease"
+
+
+def test_invalid_input_is_not_retried(
+    client: TestClient, sessions: sessionmaker
+) -> None:
+    def invalid(ctx: JobContext) -> Dict[str, Any]:
+        raise ValueError("bad transcript")
+
+    job_id = client.post("/api/submit-generate-tasks", json={"transcript": "x"}).json()[
+        "id"
+    ]
+    worker = Worker(sessions, handlers={JobKindEnum.GENERATE_TASKS: invalid})
+    assert worker.run_once()
+    job = client.get("/api/get-job", params={"id": job_id}).json()
+    assert (job["status"], job["attempts"]) == ("FAILED", 1)
+
+
+def test_claim_skips_jobs_locked_by_other_workers(
+    client: TestClient, engine: Engine, sessions: sessionmaker
+) -> None:
+    first = client.post("/api/submit-generate-tasks", json={"transcript": "a"}).json()
+    second = client.post("/api/submit-generate-tasks", json={"transcript": "b"}).json()
+
+    # Another worker is mid-claim on the first job and holds its row lock
+    with engine.connect() as other:
+        other.execute(
+            select(JobRow.id)
+            .where(JobRow.id == uuid.UUID(first["id"]))
+            .with_for_update()
+        )
+        with sessions() as session:
+            claimed = repo.claim_job(session, worker_id="w2", lease_seconds=60)
+        assert claimed is not None and str(claimed.id) == second["id"]
+        other.rollback()
+
+
+def test_concurrent_workers_claim_each_job_once(
+    client: TestClient, sessions: sessionmaker
+) -> None:
+    job_ids = {
+        client.post("/api/submit-generate-tasks", json={"transcript": str(i)}).json()[
+            "id"
+        ]
+        for i in range(12)
+    }
+    ran: List[str] = []
+    lock = threading.Lock()
+
+    def record(ctx: JobContext) -> Dict[str, Any]:
+        with lock:
+            ran.append(str(ctx.job.id))
+        return {"tasks": []}
+
+    def drain() -> None:
+        worker = Worker(sessions, handlers={JobKindEnum.GENERATE_TASKS: record})
+        while worker.run_once():
+            pass
+
+    threads = [threading.Thread(target=drain) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(ran) == sorted(job_ids)
+
+
+def test_expired_lease_is_taken_over(
+    client: TestClient, sessions: sessionmaker
+) -> None:
+    job_id = uuid.UUID(_submit_transcription(client))
+    with sessions() as session:
+        stale = repo.claim_job(session, worker_id="dead", lease_seconds=60)
+        assert stale is not None
+        # The worker stopped heartbeating long ago
+        session.execute(
+            update(JobRow)
+            .where(JobRow.id == job_id)
+            .values(run_after=func.now() - dt.timedelta(minutes=1))
+        )
+        session.commit()
+
+    worker = Worker(sessions, handlers=HANDLERS)
+    assert worker.run_once()
+    with sessions() as session:
+        # The dead worker coming back cannot overwrite the new outcome
+        assert not repo.complete_job(
+            session, job_id=job_id, worker_id="dead", result={"text": "stale"}
+        )
+        row = session.get(JobRow, job_id)
+        assert row.status is JobStatusEnum.SUCCEEDED
+        assert row.attempts == 2
+        assert row.result == {"text": "hello there"}
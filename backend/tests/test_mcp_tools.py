@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from taskmaster.services.task_management.generation.agent import ALLOWED_TOOLS
+
+_TOOLS_JSON = (
+    Path(__file__).resolve().parents[2] / "mcp" / "taskmaster-server" / "tools.json"
+)
+
+
+def test_allowed_agent_tools_exist_in_the_mcp_server() -> None:
+    # tools.json is generated from shared/openapi.json by scripts/build.sh
+    tools = {tool["name"] for tool in json.loads(_TOOLS_JSON.read_text())["tools"]}
+    assert set(ALLOWED_TOOLS) <= tools
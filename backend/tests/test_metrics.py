@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import re
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+from taskmaster import metrics
+from taskmaster.api.register import register as register_fern
+from taskmaster.config import get_settings
+from taskmaster.db.session import _TimedQueuePool
+from taskmaster.services.jobs.core import JobsService
+from taskmaster.services.system.core import SystemService
+from taskmaster.services.task_management.core import TasksService
+from taskmaster.services.transcription.core import TranscriptionService
+
+
+def _sample(text: str, name: str, **labels: str) -> float:
+    for line in text.splitlines():
+        match = re.fullmatch(rf"{name}(?:\{{(.*)\}})? (\S+)", line)
+        if match is None:
+            continue
+        found = dict(re.findall(r'(\w+)="([^"]*)"', match.group(1) or ""))
+        if found == labels:
+            return float(match.group(2))
+    return 0.0
+
+
+def test_histogram_renders_cumulative_buckets() -> None:
+    histogram = metrics.Histogram("test_seconds", "Test.", ("op",), buckets=(0.1, 1))
+    child = histogram.labels("a")
+    for value in (0.05, 0.1, 0.5, 3):
+        child.observe(value)
+
+    text = histogram.render()
+    assert "# TYPE test_seconds histogram" in text
+    assert _sample(text, "test_seconds_bucket", op="a", le="0.1") == 2
+    assert _sample(text, "test_seconds_bucket", op="a", le="1") == 3
+    assert _sample(text, "test_seconds_bucket", op="a", le="+Inf") == 4
+    assert _sample(text, "test_seconds_count", op="a") == 4
+    assert _sample(text, "test_seconds_sum", op="a") == 3.65
+
+
+def test_metrics_endpoint_reports_route_latency() -> None:
+    app = FastAPI()
+    app.add_middleware(metrics.MetricsMiddleware)
+    register_fern(
+        app,
+        jobs=JobsService(),
+        system=SystemService(),
+        tasks=TasksService(),
+        transcription=TranscriptionService(),
+    )
+    before = metrics.render_latest()
+    with TestClient(app) as client:
+        client.get("/api/health")
+        client.get("/api/health")
+        client.get("/api/no-such-route")
+        resp = client.get("/api/metrics")
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = resp.text
+
+    def delta(name: str, **labels: str) -> float:
+        return _sample(text, name, **labels) - _sample(before, name, **labels)
+
+    health = {"method": "GET", "route": "/api/health"}
+    assert delta("taskmaster_http_requests_total", status="200", **health) == 2
+    assert delta("taskmaster_http_request_duration_seconds_count", **health) == 2
+    assert (
+        delta(
+            "taskmaster_http_requests_total",
+            method="GET",
+            route="unmatched",
+            status="404",
+        )
+        == 1
+    )
+    # The metrics request itself is still in flight while rendering
+    assert _sample(text, "taskmaster_http_requests_in_flight", method="GET") >= 1
+
+
+def test_time_openai_call_records_outcome() -> None:
+    def count(outcome: str) -> float:
+        return _sample(
+            metrics.render_latest(),
+            "taskmaster_openai_request_duration_seconds_count",
+            operation="test.call",
+            outcome=outcome,
+        )
+
+    with metrics.time_openai_call("test.call"):
+        pass
+    try:
+        with metrics.time_openai_call("test.call"):
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+
+    assert count("ok") == 1
+    assert count("error") == 1
+
+
+def test_metric_subclasses_must_provide_samples() -> None:
+    class Incomplete(metrics._Metric):
+        pass
+
+    with pytest.raises(TypeError, match="samples"):
+        Incomplete("incomplete", "Test.")  # type: ignore[abstract]
+
+
+def test_pool_checkouts_are_timed() -> None:
+    def count() -> float:
+        return _sample(
+            metrics.render_latest(),
+            "taskmaster_db_pool_checkout_wait_seconds_count",
+            engine="sync",
+        )
+
+    before = count()
+    engine = create_engine(
+        get_settings().get_alembic_database_url(), poolclass=_TimedQueuePool
+    )
+    try:
+        for _ in range(2):
+            with engine.connect() as connection:
+                connection.exec_driver_sql("SELECT 1")
+    finally:
+        engine.dispose()
+
+    # The first checkout connects, the second reuses the pooled connection
+    assert count() - before == 2
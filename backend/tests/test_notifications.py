@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from taskmaster.api.resources.tasks.types.create_task_request import CreateTaskRequest
+from taskmaster.api.resources.tasks.types.task_status import TaskStatus
+from taskmaster.config import get_settings
+from taskmaster.services.task_management import async_repo
+from taskmaster.services.task_management.core import _task_change_events
+from taskmaster.services.task_management.notifications import (
+    RESYNC_PAYLOAD,
+    NotificationHub,
+)
+
+
+def test_hub_fans_out_committed_writes() -> None:
+    async def _run() -> None:
+        url = get_settings().get_alembic_database_url()
+        dsn = make_url(url).set(drivername="postgresql")
+        hub = NotificationHub(dsn.render_as_string(hide_password=False))
+        engine = create_async_engine(url, poolclass=NullPool)
+        try:
+            async with hub.subscribe() as first, hub.subscribe() as second:
+                await hub.wait_listening(timeout=5)
+                assert await asyncio.wait_for(first.get(), 5) == RESYNC_PAYLOAD
+                assert await asyncio.wait_for(second.get(), 5) == RESYNC_PAYLOAD
+
+                async with AsyncSession(engine, expire_on_commit=False) as session:
+                    created = await async_repo.create_task(
+                        session,
+                        body=CreateTaskRequest(
+                            title="notify-a",
+                            description="d",
+                            status=TaskStatus.TODO,
+                            priority=1,
+                            duration_seconds=60,
+                        ),
+                    )
+                    for queue in (first, second):
+                        payload = json.loads(await asyncio.wait_for(queue.get(), 5))
+                        assert payload == {
+                            "op": "create",
+                            "count": 1,
+                            "ids": [str(created.id)],
+                        }
+                    await async_repo.delete_task_by_title(session, title="notify-a")
+        finally:
+            await hub.aclose()
+            await engine.dispose()
+
+    asyncio.run(_run())
+
+
+def test_task_change_events_push_deltas() -> None:
+    async def _run() -> None:
+        url = get_settings().get_alembic_database_url()
+        dsn = make_url(url).set(drivername="postgresql")
+        hub = NotificationHub(dsn.render_as_string(hide_password=False))
+        engine = create_async_engine(url, poolclass=NullPool)
+        try:
+            async with (
+                AsyncSession(engine) as stream_db,
+                AsyncSession(engine, expire_on_commit=False) as write_db,
+            ):
+                events = _task_change_events(stream_db, hub, since=None)
+                initial = _parse_event(await asyncio.wait_for(anext(events), 5))
+                assert initial["tasks"] == [] and initial["deleted"] == []
+
+                await hub.wait_listening(timeout=5)
+                await async_repo.create_task(
+                    write_db,
+                    body=CreateTaskRequest(
+                        title="stream-a",
+                        description="d",
+                        status=TaskStatus.TODO,
+                        priority=1,
+                        duration_seconds=60,
+                    ),
+                )
+                delta = _parse_event(await asyncio.wait_for(anext(events), 5))
+                assert [t["title"] for t in delta["tasks"]] == ["stream-a"]
+                assert delta["version"] > initial["version"]
+                await events.aclose()
+                await async_repo.delete_task_by_title(write_db, title="stream-a")
+        finally:
+            await hub.aclose()
+            await engine.dispose()
+
+    asyncio.run(_run())
+
+
+def _parse_event(event: str) -> dict:
+    fields = dict(line.split(": ", 1) for line in event.strip().splitlines())
+    assert fields["event"] == "changes"
+    data = json.loads(fields["data"])
+    assert int(fields["id"]) == data["version"]
+    return data
+
+
+def test_api_stream_task_changes_rejects_bad_last_event_id(
+    client: TestClient,
+) -> None:
+    resp = client.get("/api/stream-task-changes", headers={"Last-Event-ID": "x"})
+    assert resp.status_code == 400
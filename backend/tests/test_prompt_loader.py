@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import List
+
+import pytest
+from jinja2 import FileSystemBytecodeCache
+
+from taskmaster.services.task_management.generation.agent import PROMPT_LOADER
+from taskmaster.services.task_management.generation.prompt_loader import PromptLoader
+
+
+def _write(path: Path, text: str) -> None:
+    # Bump the mtime explicitly; rewrites within one timestamp tick look unchanged
+    previous = path.stat().st_mtime if path.exists() else 0.0
+    path.write_text(text)
+    os.utime(path, (previous + 10, previous + 10))
+
+
+@pytest.fixture()
+def templates(tmp_path: Path) -> Path:
+    _write(tmp_path / "partial.j2", "rules v1\n")
+    _write(tmp_path / "system.j2", "System.\n{% include 'partial.j2' %}")
+    _write(tmp_path / "user.j2", "{{ greeting }}, {% include 'name.j2' %}!")
+    _write(tmp_path / "name.j2", "{{ name }}")
+    return tmp_path
+
+
+def _count_parses(loader: PromptLoader, monkeypatch: pytest.MonkeyPatch) -> List[str]:
+    parsed: List[str] = []
+    env = loader._env
+    original = env._parse
+
+    def counting_parse(source, name, filename):  # type: ignore[no-untyped-def]
+        parsed.append(name)
+        return original(source, name, filename)
+
+    monkeypatch.setattr(env, "_parse", counting_parse)
+    return parsed
+
+
+def test_render_parses_each_template_once(
+    templates: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    loader = PromptLoader(str(templates))
+    parsed = _count_parses(loader, monkeypatch)
+
+    for _ in range(3):
+        assert loader.render("system.j2") == "System.\nrules v1\n"
+        assert (
+            loader.render("user.j2", variables={"greeting": "Hi", "name": "Ada"})
+            == "Hi, Ada!"
+        )
+
+    # Dependency analysis and compilation, once per file
+    assert parsed.count("system.j2") == 2
+    assert parsed.count("partial.j2") == 2
+    assert loader.variables("user.j2") == {"greeting", "name"}
+
+
+def test_variables_include_dependencies(templates: Path) -> None:
+    loader = PromptLoader(str(templates))
+    with pytest.raises(ValueError, match="greetings"):
+        loader.render("user.j2", variables={"greetings": "Hi", "name": "Ada"})
+
+
+def test_auto_reload_follows_included_templates(templates: Path) -> None:
+    loader = PromptLoader(str(templates))
+    assert loader.render("system.j2") == "System.\nrules v1\n"
+
+    _write(templates / "partial.j2", "rules v2\n")
+    assert loader.render("system.j2") == "System.\nrules v2\n"
+
+    _write(templates / "user.j2", "{{ greeting }}!")
+    assert loader.variables("user.j2") == {"greeting"}
+
+
+def test_without_auto_reload_first_build_is_kept(templates: Path) -> None:
+    loader = PromptLoader(str(templates), auto_reload=False)
+    assert loader.render("system.j2") == "System.\nrules v1\n"
+
+    _write(templates / "partial.j2", "rules v2\n")
+    assert loader.render("system.j2") == "System.\nrules v1\n"
+
+
+def test_bytecode_cache_is_shared_across_loaders(
+    templates: Path, tmp_path_factory: pytest.TempPathFactory
+) -> None:
+    cache_dir = tmp_path_factory.mktemp("bytecode")
+    first = PromptLoader(
+        str(templates), bytecode_cache=FileSystemBytecodeCache(str(cache_dir))
+    )
+    first.render("system.j2")
+    assert list(cache_dir.iterdir())
+
+    second = PromptLoader(
+        str(templates), bytecode_cache=FileSystemBytecodeCache(str(cache_dir))
+    )
+    compiled: List[str] = []
+    original = second._env.compile
+
+    def counting_compile(*args, **kwargs):  # type: ignore[no-untyped-def]
+        compiled.append(args[1] if len(args) > 1 else kwargs.get("name"))
+        return original(*args, **kwargs)
+
+    second._env.compile = counting_compile  # type: ignore[method-assign]
+    assert second.render("system.j2") == "System.\nrules v1\n"
+    assert compiled == []
+
+
+def test_shipped_prompts_render() -> None:
+    assert PROMPT_LOADER.render("system.j2")
+    assert PROMPT_LOADER.render("developer.j2")
+    user = PROMPT_LOADER.render(
+        "user_template.j2",
+        variables={
+            "transcript": "Ship the report",
+            "existing_tasks_json": "[]",
+            "omitted_tasks": 3,
+        },
+    )
+    assert "Ship the report" in user
+    assert "3 existing tasks that look unrelated" in user
+    assert "DeleteTaskRequest: {{ title }}" in user
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import logging
+from typing import Callable, ContextManager, List
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from taskmaster.api.resources.tasks.types.batch_task_operation import (
+    BatchTaskOperation,
+)
+from taskmaster.api.resources.tasks.types.batch_task_operation_type import (
+    BatchTaskOperationType,
+)
+from taskmaster.api.resources.tasks.types.create_task_request import CreateTaskRequest
+from taskmaster.api.resources.tasks.types.task import Task
+from taskmaster.api.resources.tasks.types.task_order import TaskOrder
+from taskmaster.api.resources.tasks.types.task_status import TaskStatus
+from taskmaster.api.resources.tasks.types.update_task_request import UpdateTaskRequest
+from taskmaster.db.models.job import JobKindEnum
+from taskmaster.db.query_stats import (
+    QUERY_COUNT_HEADER,
+    QUERY_TIME_HEADER,
+    QueryStats,
+    QueryStatsMiddleware,
+)
+from taskmaster.services.jobs import repo as jobs_repo
+from taskmaster.services.task_management import repo, scoring
+
+QueryBudget = Callable[[int], ContextManager[QueryStats]]
+
+# Large enough that a per-row query would blow every budget below
+SEED_TASKS = 20
+
+
+def _seed(db_session: Session) -> List[Task]:
+    tasks: List[Task] = []
+    for i in range(SEED_TASKS):
+        tasks.append(
+            repo.create_task(
+                db_session,
+                body=CreateTaskRequest(
+                    title=f"budget-{i}",
+                    description="d",
+                    status=TaskStatus.TODO,
+                    priority=i % 5,
+                    duration_seconds=60,
+                    prerequisite_tasks=[t.id for t in tasks[-2:]] or None,
+                ),
+            )
+        )
+    return tasks
+
+
+def test_read_query_budgets(db_session: Session, query_budget: QueryBudget) -> None:
+    _seed(db_session)
+
+    with query_budget(2):
+        repo.get_task_by_title(db_session, title="budget-3")
+    with query_budget(2):
+        repo.list_tasks(db_session)
+    with query_budget(3):
+        repo.list_tasks(db_session, order=TaskOrder.TOPOLOGICAL)
+    with query_budget(3):
+        repo.get_task_ancestors(db_session, title=f"budget-{SEED_TASKS - 1}")
+    with query_budget(3):
+        repo.get_task_descendants(db_session, title="budget-0")
+    with query_budget(3):
+        scoring.rank_tasks(db_session)
+    with query_budget(6):
+        repo.get_task_changes(db_session)
+    with query_budget(2):
+        repo.search_tasks(db_session, query="budget")
+    # pg_trgm probe (cached afterwards), then one of: threshold + query, or
+    # normalize + scan + load, plus prerequisites
+    with query_budget(5):
+        repo.find_similar_tasks(db_session, title="budget-1")
+
+
+def test_write_query_budgets(db_session: Session, query_budget: QueryBudget) -> None:
+    tasks = _seed(db_session)
+
+    with query_budget(9):
+        repo.create_task(
+            db_session,
+            body=CreateTaskRequest(
+                title="budget-new",
+                description="d",
+                status=TaskStatus.TODO,
+                priority=1,
+                duration_seconds=60,
+                prerequisite_tasks=[t.id for t in tasks[:5]],
+            ),
+        )
+    with query_budget(13):
+        repo.update_task_by_title(
+            db_session,
+            title="budget-3",
+            body=UpdateTaskRequest(
+                title="budget-3", priority=4, prerequisite_tasks=[tasks[0].id]
+            ),
+        )
+    # Deletes also prune expired tombstones in one statement
+    with query_budget(12):
+        repo.delete_task_by_title(db_session, title="budget-0")
+    # COPY goes through the raw cursor and is not counted
+    with query_budget(5):
+        repo.bulk_import_tasks(
+            db_session,
+            records=[
+                {
+                    "title": f"budget-import-{i}",
+                    "description": "d",
+                    "status": "TODO",
+                    "priority": 1,
+                    "duration_seconds": 60,
+                    "prerequisites": ["budget-1"]
+                    + ([f"budget-import-{i - 1}"] if i else []),
+                }
+                for i in range(SEED_TASKS)
+            ],
+        )
+
+    # Each operation runs in its own savepoint, so batches are linear by design
+    ops = [
+        BatchTaskOperation(
+            type=BatchTaskOperationType.UPDATE,
+            title=f"budget-{i}",
+            status=TaskStatus.COMPLETED,
+        )
+        for i in range(1, SEED_TASKS)
+    ]
+    with query_budget(5 * len(ops) + 4):
+        repo.apply_batch(db_session, operations=ops)
+
+
+def test_query_stats_flag_repeated_selects() -> None:
+    stats = QueryStats()
+    for _ in range(3):
+        stats.record("SELECT * FROM tasks WHERE id = %(id)s", 0.001)
+    stats.record("INSERT INTO tasks VALUES (%(id)s)", 0.001)
+    stats.record("INSERT INTO tasks VALUES (%(id)s)", 0.001)
+
+    assert stats.count == 5
+    assert stats.repeated_selects(3) == [("SELECT * FROM tasks WHERE id = %(id)s", 3)]
+    assert stats.repeated_selects(4) == []
+
+
+def test_middleware_reports_queries(
+    app: FastAPI, caplog: pytest.LogCaptureFixture
+) -> None:
+    app.add_middleware(
+        QueryStatsMiddleware, expose_headers=True, n_plus_one_threshold=1
+    )
+    with TestClient(app) as client, caplog.at_level(logging.WARNING):
+        resp = client.get("/api/get-tasks")
+
+    assert resp.status_code == 200
+    assert int(resp.headers[QUERY_COUNT_HEADER]) >= 1
+    assert float(resp.headers[QUERY_TIME_HEADER]) >= 0
+    assert any("Possible N+1 query" in r.getMessage() for r in caplog.records)
+
+
+def test_job_queue_query_budgets(
+    db_session: Session, query_budget: QueryBudget
+) -> None:
+    with query_budget(4):
+        job = jobs_repo.enqueue_job(
+            db_session,
+            kind=JobKindEnum.GENERATE_TASKS,
+            payload={"transcript": "t"},
+            max_attempts=3,
+        )
+    db_session.expunge_all()
+    # Status polls read one row, without the (deferred) input bytes
+    with query_budget(2) as stats:
+        jobs_repo.get_job(db_session, job_id=job.id)
+    assert not any("jobs.input" in statement for statement in stats.statements)
+    with query_budget(3):
+        jobs_repo.claim_job(db_session, worker_id="w", lease_seconds=60)
+    with query_budget(3):
+        jobs_repo.renew_lease(
+            db_session, job_id=job.id, worker_id="w", lease_seconds=60, progress="p"
+        )
+    with query_budget(3):
+        jobs_repo.complete_job(
+            db_session, job_id=job.id, worker_id="w", result={"tasks": []}
+        )
@@ -1,12 +1,27 @@
 from __future__ import annotations
 
+import asyncio
+import threading
 import uuid
+from typing import Any, Optional
+
 import pytest
+from sqlalchemy import create_engine, event, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
 
-from taskmaster.services.task_management import repo
+from taskmaster.config import get_settings
+from taskmaster.services.task_management import async_repo, repo
+from taskmaster.api.resources.tasks.types.batch_task_operation import (
+    BatchTaskOperation,
+)
+from taskmaster.api.resources.tasks.types.batch_task_operation_type import (
+    BatchTaskOperationType,
+)
 from taskmaster.api.resources.tasks.types.create_task_request import CreateTaskRequest
 from taskmaster.api.resources.tasks.types.update_task_request import UpdateTaskRequest
+from taskmaster.api.resources.tasks.types.task_order import TaskOrder
 from taskmaster.api.resources.tasks.types.task_status import TaskStatus
 
 
@@ -85,3 +100,663 @@ def test_delete_task_by_title(db_session: Session) -> None:
     deleted = repo.delete_task_by_title(db_session, title="task-d")
     assert deleted is not None
     assert repo.get_task_by_title(db_session, title="task-d") is None
+
+
+@pytest.mark.usefixtures("db_session")
+def test_list_tasks_keyset_pagination_and_filters(db_session: Session) -> None:
+    for i in range(5):
+        repo.create_task(
+            db_session,
+            body=CreateTaskRequest(
+                title=f"page-{i}",
+                description="d",
+                status=TaskStatus.TODO if i % 2 == 0 else TaskStatus.COMPLETED,
+                priority=i,
+                duration_seconds=60,
+            ),
+        )
+
+    first = repo.list_tasks(db_session, limit=2)
+    second = repo.list_tasks(db_session, limit=2, cursor=first[-1].id)
+    rest = repo.list_tasks(db_session, limit=2, cursor=second[-1].id)
+    paged = [t.id for t in first + second + rest]
+    assert paged == sorted(paged)
+    assert len(set(paged)) == 5
+
+    todo = repo.list_tasks(db_session, statuses=[TaskStatus.TODO], priority_min=1)
+    assert {t.title for t in todo} == {"page-2", "page-4"}
+
+    with pytest.raises(ValueError):
+        repo.list_tasks(db_session, limit=0)
+
+
+@pytest.mark.usefixtures("db_session")
+def test_iter_tasks_streams_in_batches(db_session: Session) -> None:
+    for i in range(7):
+        repo.create_task(
+            db_session,
+            body=CreateTaskRequest(
+                title=f"stream-{i}",
+                description="d",
+                status=TaskStatus.TODO,
+                priority=i,
+                duration_seconds=60,
+            ),
+        )
+
+    streamed = list(repo.iter_tasks(db_session, batch_size=3))
+    assert [t.id for t in streamed] == [t.id for t in repo.list_tasks(db_session)]
+    assert len(list(repo.iter_tasks(db_session, priority_min=5))) == 2
+
+
+def _chain(db_session: Session, prefix: str, length: int) -> list:
+    tasks = []
+    for i in range(length):
+        tasks.append(
+            repo.create_task(
+                db_session,
+                body=CreateTaskRequest(
+                    title=f"{prefix}-{i}",
+                    description="d",
+                    status=TaskStatus.TODO,
+                    priority=1,
+                    duration_seconds=60,
+                    prerequisite_tasks=[tasks[-1].id] if tasks else None,
+                ),
+            )
+        )
+    return tasks
+
+
+@pytest.mark.usefixtures("db_session")
+def test_prerequisite_cycles_are_rejected(db_session: Session) -> None:
+    chain = _chain(db_session, "cycle", 4)
+
+    with pytest.raises(ValueError, match="cycle"):
+        repo.update_task_by_title(
+            db_session,
+            title="cycle-0",
+            body=UpdateTaskRequest(title="cycle-0", prerequisite_tasks=[chain[3].id]),
+        )
+    # A link that does not close a loop is still accepted
+    updated = repo.update_task_by_title(
+        db_session,
+        title="cycle-3",
+        body=UpdateTaskRequest(title="cycle-3", prerequisite_tasks=[chain[0].id]),
+    )
+    assert updated is not None and updated.prerequisite_tasks == [chain[0].id]
+
+    result = repo.apply_batch(
+        db_session,
+        operations=[
+            BatchTaskOperation(
+                type=BatchTaskOperationType.UPDATE,
+                title="cycle-1",
+                prerequisite_titles=["cycle-2"],
+            )
+        ],
+    )
+    assert "cycle" in (result.results[0].error or "")
+
+    with pytest.raises(ValueError, match="cycle"):
+        repo.bulk_import_tasks(
+            db_session,
+            records=[
+                {
+                    "title": f"import-cycle-{i}",
+                    "description": "d",
+                    "status": "TODO",
+                    "priority": 1,
+                    "duration_seconds": 60,
+                    "prerequisites": [f"import-cycle-{(i + 1) % 3}"],
+                }
+                for i in range(3)
+            ],
+        )
+
+
+@pytest.mark.usefixtures("db_session")
+def test_concurrent_updates_cannot_close_a_cycle() -> None:
+    engine = create_engine(get_settings().get_alembic_database_url())
+    outcome: list = []
+
+    def link(session: Session, title: str, prerequisite: uuid.UUID) -> None:
+        repo.update_task_by_title(
+            session,
+            title=title,
+            body=UpdateTaskRequest(title=title, prerequisite_tasks=[prerequisite]),
+        )
+
+    def second_update() -> None:
+        with Session(engine) as session:
+            try:
+                outcome.append(link(session, "loop-x", y.id))
+            except ValueError as exc:
+                outcome.append(exc)
+
+    try:
+        with Session(engine) as session:
+            x, y = (
+                repo.create_task(
+                    session,
+                    body=CreateTaskRequest(
+                        title=title,
+                        description="d",
+                        status=TaskStatus.TODO,
+                        priority=1,
+                        duration_seconds=60,
+                    ),
+                )
+                for title in ("loop-x", "loop-y")
+            )
+
+        with Session(engine) as first:
+            # Stands in for another update between its cycle check and commit
+            first.execute(
+                select(func.pg_advisory_xact_lock(repo._PREREQUISITE_GRAPH_LOCK_KEY))
+            )
+            thread = threading.Thread(target=second_update)
+            thread.start()
+            thread.join(0.3)
+            assert thread.is_alive()
+            link(first, "loop-y", x.id)
+        thread.join(5)
+
+        (result,) = outcome
+        assert isinstance(result, ValueError) and "cycle" in str(result)
+        with Session(engine) as session:
+            ordered = repo.list_tasks(session, order=TaskOrder.TOPOLOGICAL)
+            assert [t.title for t in ordered] == ["loop-x", "loop-y"]
+    finally:
+        with Session(engine) as session:
+            for title in ("loop-x", "loop-y"):
+                repo.delete_task_by_title(session, title=title)
+        engine.dispose()
+
+
+@pytest.mark.usefixtures("db_session")
+def test_list_tasks_topological_order(db_session: Session) -> None:
+    chain = _chain(db_session, "topo", 3)
+    repo.create_task(
+        db_session,
+        body=CreateTaskRequest(
+            title="topo-join",
+            description="d",
+            status=TaskStatus.COMPLETED,
+            priority=1,
+            duration_seconds=60,
+            prerequisite_tasks=[chain[0].id, chain[2].id],
+        ),
+    )
+
+    ordered = repo.list_tasks(db_session, order=TaskOrder.TOPOLOGICAL)
+    assert [(t.title, t.depth) for t in ordered] == [
+        ("topo-0", 0),
+        ("topo-1", 1),
+        ("topo-2", 2),
+        ("topo-join", 3),
+    ]
+    # Depth comes from the whole graph even when the listing is filtered
+    completed = repo.list_tasks(
+        db_session, order=TaskOrder.TOPOLOGICAL, statuses=[TaskStatus.COMPLETED]
+    )
+    assert [(t.title, t.depth) for t in completed] == [("topo-join", 3)]
+    assert repo.list_tasks(db_session)[0].depth is None
+
+    with pytest.raises(ValueError):
+        repo.list_tasks(db_session, order=TaskOrder.TOPOLOGICAL, cursor=chain[0].id)
+
+
+@pytest.mark.usefixtures("db_session")
+def test_ancestors_and_descendants_follow_edge_changes(db_session: Session) -> None:
+    # closure-0 <- closure-1 <- closure-2 <- closure-3, plus a shortcut 0 <- 3
+    chain = _chain(db_session, "closure", 4)
+    repo.update_task_by_title(
+        db_session,
+        title="closure-3",
+        body=UpdateTaskRequest(
+            title="closure-3", prerequisite_tasks=[chain[2].id, chain[0].id]
+        ),
+    )
+
+    ancestors = repo.get_task_ancestors(db_session, title="closure-3")
+    assert ancestors is not None
+    assert [t.depth for t in ancestors] == [1, 1, 2]
+    assert sorted((t.depth, t.title) for t in ancestors) == [
+        (1, "closure-0"),
+        (1, "closure-2"),
+        (2, "closure-1"),
+    ]
+    near = repo.get_task_descendants(db_session, title="closure-0", max_depth=1)
+    assert near is not None
+    assert {t.title for t in near} == {"closure-1", "closure-3"}
+
+    # Dropping 1 <- 2 leaves only the shortcut between 0 and 3
+    repo.update_task_by_title(
+        db_session,
+        title="closure-2",
+        body=UpdateTaskRequest(title="closure-2", prerequisite_tasks=[]),
+    )
+    descendants = repo.get_task_descendants(db_session, title="closure-0")
+    assert descendants is not None
+    assert sorted((t.depth, t.title) for t in descendants) == [
+        (1, "closure-1"),
+        (1, "closure-3"),
+    ]
+
+    repo.delete_task_by_title(db_session, title="closure-3")
+    assert [
+        t.title for t in repo.get_task_ancestors(db_session, title="closure-1") or []
+    ] == ["closure-0"]
+    assert repo.get_task_descendants(db_session, title="closure-2") == []
+    assert repo.get_task_ancestors(db_session, title="missing") is None
+    with pytest.raises(ValueError):
+        repo.get_task_ancestors(db_session, title="closure-1", max_depth=0)
+
+
+@pytest.mark.usefixtures("db_session")
+def test_closure_counts_paths_of_wide_diamond_chains(db_session: Session) -> None:
+    # hub-0 <- 10 parallel tasks <- hub-1 <- ... <- hub-20: 10**20 paths from
+    # hub-0 to hub-20, more than a bigint holds
+    width, length = 10, 20
+    records = [{"title": "hub-0"}]
+    for level in range(length):
+        middles = [f"mid-{level}-{i}" for i in range(width)]
+        records += [{"title": m, "prerequisites": [f"hub-{level}"]} for m in middles]
+        records.append({"title": f"hub-{level + 1}", "prerequisites": middles})
+    for record in records:
+        record.update(description="d", status="TODO", priority=1, duration_seconds=1)
+    repo.bulk_import_tasks(db_session, records=records)
+
+    descendants = repo.get_task_descendants(db_session, title="hub-0")
+    assert descendants is not None
+    assert ("hub-20", 2 * length) in {(t.title, t.depth) for t in descendants}
+
+    # Cutting every path through one level disconnects the ends again
+    for i in range(width):
+        repo.update_task_by_title(
+            db_session,
+            title=f"mid-10-{i}",
+            body=UpdateTaskRequest(title=f"mid-10-{i}", prerequisite_tasks=[]),
+        )
+    descendants = repo.get_task_descendants(db_session, title="hub-0")
+    assert descendants is not None
+    assert "hub-20" not in {t.title for t in descendants}
+    assert "hub-10" in {t.title for t in descendants}
+
+
+@pytest.mark.usefixtures("db_session")
+def test_concurrent_edge_writes_keep_the_closure_complete() -> None:
+    engine = create_engine(get_settings().get_alembic_database_url())
+    titles = ["race-x", "race-y", "race-z"]
+    add_edge = text(
+        "INSERT INTO task_prerequisites (task_id, prerequisite_task_id) "
+        "VALUES (:task_id, :prerequisite_id)"
+    )
+    try:
+        with Session(engine) as session:
+            x, y, z = (
+                repo.create_task(
+                    session,
+                    body=CreateTaskRequest(
+                        title=title,
+                        description="d",
+                        status=TaskStatus.TODO,
+                        priority=1,
+                        duration_seconds=60,
+                    ),
+                )
+                for title in titles
+            )
+
+        def second_writer() -> None:
+            with engine.begin() as connection:
+                connection.execute(add_edge, {"task_id": z.id, "prerequisite_id": y.id})
+
+        with engine.connect() as first, first.begin():
+            first.execute(add_edge, {"task_id": y.id, "prerequisite_id": x.id})
+            thread = threading.Thread(target=second_writer)
+            thread.start()
+            thread.join(0.3)
+            # Y -> Z waits for X -> Y instead of missing its closure rows
+            assert thread.is_alive()
+        thread.join(5)
+        assert not thread.is_alive()
+
+        with Session(engine) as session:
+            ancestors = repo.get_task_ancestors(session, title="race-z")
+            assert ancestors is not None
+            assert sorted((t.depth, t.title) for t in ancestors) == [
+                (1, "race-y"),
+                (2, "race-x"),
+            ]
+    finally:
+        with Session(engine) as session:
+            for title in titles:
+                repo.delete_task_by_title(session, title=title)
+        engine.dispose()
+
+
+@pytest.mark.usefixtures("db_session")
+def test_task_changes_since_version(db_session: Session) -> None:
+    base, dependent = _chain(db_session, "feed", 2)
+    snapshot = repo.get_task_changes(db_session)
+    assert [t.title for t in snapshot.tasks] == ["feed-0", "feed-1"]
+    assert snapshot.deleted == []
+    assert repo.get_task_changes(db_session, since=snapshot.version).tasks == []
+
+    # A prerequisite-only update still counts as a change
+    repo.update_task_by_title(
+        db_session,
+        title="feed-1",
+        body=UpdateTaskRequest(title="feed-1", prerequisite_tasks=[]),
+    )
+    changes = repo.get_task_changes(db_session, since=snapshot.version)
+    assert [t.title for t in changes.tasks] == ["feed-1"]
+    assert changes.version > snapshot.version
+
+    repo.update_task_by_title(
+        db_session,
+        title="feed-1",
+        body=UpdateTaskRequest(title="feed-1", prerequisite_tasks=[base.id]),
+    )
+    since = repo.get_task_changes(db_session).version
+    # Deleting the prerequisite leaves a tombstone and changes its dependent
+    repo.delete_task_by_title(db_session, title="feed-0")
+    changes = repo.get_task_changes(db_session, since=since)
+    assert [(t.id, t.title) for t in changes.deleted] == [(base.id, "feed-0")]
+    assert [(t.title, t.prerequisite_tasks) for t in changes.tasks] == [("feed-1", [])]
+    with pytest.raises(ValueError):
+        repo.get_task_changes(db_session, since=-1)
+
+
+@pytest.mark.usefixtures("db_session")
+def test_duplicate_checked_creates_do_not_race() -> None:
+    def body(title: str, threshold: Optional[float] = None) -> CreateTaskRequest:
+        return CreateTaskRequest(
+            title=title,
+            description="d",
+            status=TaskStatus.TODO,
+            priority=1,
+            duration_seconds=60,
+            duplicate_threshold=threshold,
+        )
+
+    engine = create_engine(get_settings().get_alembic_database_url())
+    outcome: list = []
+
+    def checked_create() -> None:
+        with Session(engine) as session:
+            try:
+                outcome.append(
+                    repo.create_task(session, body=body("Ship the Q3 report", 0.5))
+                )
+            except repo.SimilarTasksExist as exc:
+                outcome.append(exc)
+
+    try:
+        with Session(engine) as first:
+            # Stands in for another checked create between its check and commit
+            first.execute(
+                select(func.pg_advisory_xact_lock(repo._DUPLICATE_CHECK_LOCK_KEY))
+            )
+            thread = threading.Thread(target=checked_create)
+            thread.start()
+            thread.join(0.3)
+            assert thread.is_alive()
+            repo.create_task(first, body=body("Ship Q3 report"))
+        thread.join(5)
+
+        (result,) = outcome
+        assert isinstance(result, repo.SimilarTasksExist)
+        assert [m.task.title for m in result.matches] == ["Ship Q3 report"]
+    finally:
+        with Session(engine) as session:
+            repo.delete_task_by_title(session, title="Ship Q3 report")
+        engine.dispose()
+
+
+@pytest.mark.usefixtures("db_session")
+def test_duplicate_check_scans_titles_before_taking_the_lock(
+    db_session: Session, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(repo, "_has_pg_trgm", lambda session: False)
+    _chain(db_session, "Ship Q3 report", 1)
+    statements: list = []
+
+    def record(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        statements.append(statement)
+
+    engine = db_session.get_bind().engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        with pytest.raises(repo.SimilarTasksExist) as exc_info:
+            repo.create_task(
+                db_session,
+                body=CreateTaskRequest(
+                    title="Ship the Q3 report-0",
+                    description="d",
+                    status=TaskStatus.TODO,
+                    priority=1,
+                    duration_seconds=60,
+                    duplicate_threshold=0.5,
+                ),
+            )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert [m.task.title for m in exc_info.value.matches] == ["Ship Q3 report-0"]
+    locked = next(
+        i
+        for i, statement in enumerate(statements)
+        if "pg_advisory_xact_lock(" in statement
+    )
+    scans = [
+        (i > locked, "tasks.version >" in statement)
+        for i, statement in enumerate(statements)
+        if "tasks.title_normalized" in statement
+    ]
+    # The full scan runs before the lock; under it, only newer tasks are read
+    assert scans == [(False, False), (True, True)]
+
+
+@pytest.mark.usefixtures("db_session")
+def test_change_feed_does_not_wait_for_writers_in_flight(db_session: Session) -> None:
+    _chain(db_session, "inflight", 2)
+    # The test's own uncommitted writes hold the lock too, without conflict
+    since = repo.get_change_version(db_session)
+    assert since is not None
+
+    def advisory_locks() -> int:
+        return db_session.scalar(
+            text(
+                "SELECT count(*) FROM pg_locks "
+                "WHERE locktype = 'advisory' AND pid = pg_backend_pid()"
+            )
+        )
+
+    locks = advisory_locks()
+    engine = create_engine(get_settings().get_alembic_database_url())
+    with engine.connect() as writer, writer.begin():
+        writer.execute(
+            select(func.pg_advisory_xact_lock_shared(repo._CHANGE_FEED_LOCK_KEY))
+        )
+        assert repo.get_change_version(db_session) is None
+        repo.update_task_by_title(
+            db_session,
+            title="inflight-1",
+            body=UpdateTaskRequest(title="inflight-1", priority=2),
+        )
+        # No settled version: everything visible is sent and since stays put
+        changes = repo.get_task_changes(db_session, since=since)
+        assert changes.version == since
+        assert [t.title for t in changes.tasks] == ["inflight-1"]
+        # Nothing is left locked on the connection
+        assert advisory_locks() == locks
+    engine.dispose()
+
+    changes = repo.get_task_changes(db_session, since=since)
+    assert changes.version > since
+    assert [t.title for t in changes.tasks] == ["inflight-1"]
+
+
+@pytest.mark.usefixtures("db_session")
+def test_old_tombstones_are_pruned_and_stale_since_is_refused(
+    db_session: Session,
+) -> None:
+    _chain(db_session, "prune", 3)
+    since = repo.get_task_changes(db_session).version
+    repo.delete_task_by_title(db_session, title="prune-0")
+    db_session.execute(
+        text("UPDATE task_tombstones SET deleted_at = now() - interval '31 days'")
+    )
+
+    # The next delete prunes tombstones past the retention
+    repo.delete_task_by_title(db_session, title="prune-1")
+    tombstones = db_session.scalars(text("SELECT title FROM task_tombstones")).all()
+    assert tombstones == ["prune-1"]
+
+    with pytest.raises(repo.ChangesPruned):
+        repo.get_task_changes(db_session, since=since)
+    assert [t.title for t in repo.get_task_changes(db_session).tasks] == ["prune-2"]
+    latest = repo.get_task_changes(db_session).version
+    assert repo.get_task_changes(db_session, since=latest).deleted == []
+
+
+@pytest.mark.usefixtures("db_session")
+def test_bulk_import_resolves_prerequisites_by_title(db_session: Session) -> None:
+    existing = repo.create_task(
+        db_session,
+        body=CreateTaskRequest(
+            title="import-existing",
+            description="d",
+            status=TaskStatus.TODO,
+            priority=1,
+            duration_seconds=60,
+        ),
+    )
+    result = repo.bulk_import_tasks(
+        db_session,
+        records=[
+            {
+                "title": "import-b",
+                "description": "d",
+                "status": "TODO",
+                "priority": 2,
+                "duration_seconds": 30,
+                "prerequisites": ["import-a", "import-existing"],
+            },
+            {
+                "title": "import-a",
+                "description": "d",
+                "status": "IN_PROGRESS",
+                "priority": "1",
+                "duration_seconds": "10",
+                "deadline": "2030-01-01T00:00:00+00:00",
+            },
+        ],
+    )
+    assert result.imported == 2
+    assert result.prerequisite_links == 2
+
+    a = repo.get_task_by_title(db_session, title="import-a")
+    b = repo.get_task_by_title(db_session, title="import-b")
+    assert a is not None and b is not None
+    assert {p.id for p in b.prerequisites} == {a.id, existing.id}
+    # COPY goes through the closure triggers too
+    descendants = repo.get_task_descendants(db_session, title="import-existing")
+    assert [t.title for t in descendants or []] == ["import-b"]
+
+
+@pytest.mark.usefixtures("db_session")
+def test_bulk_import_is_all_or_nothing(db_session: Session) -> None:
+    record = {
+        "title": "import-dup",
+        "description": "d",
+        "status": "TODO",
+        "priority": 1,
+        "duration_seconds": 1,
+    }
+    with pytest.raises(ValueError):
+        repo.bulk_import_tasks(db_session, records=[record, dict(record)])
+    with pytest.raises(ValueError):
+        repo.bulk_import_tasks(
+            db_session, records=[{**record, "prerequisites": ["missing"]}]
+        )
+    assert repo.list_tasks(db_session) == []
+
+
+@pytest.mark.usefixtures("db_session")
+def test_apply_batch_reports_per_operation_results(db_session: Session) -> None:
+    ops = [
+        BatchTaskOperation(
+            type=BatchTaskOperationType.CREATE,
+            title="batch-a",
+            description="d",
+            status=TaskStatus.TODO,
+            priority=1,
+            duration_seconds=60,
+        ),
+        BatchTaskOperation(
+            type=BatchTaskOperationType.CREATE,
+            title="batch-b",
+            description="d",
+            status=TaskStatus.TODO,
+            priority=2,
+            duration_seconds=60,
+            prerequisite_titles=["batch-a"],
+        ),
+        BatchTaskOperation(type=BatchTaskOperationType.DELETE, title="missing"),
+        BatchTaskOperation(
+            type=BatchTaskOperationType.UPDATE,
+            title="batch-a",
+            status=TaskStatus.COMPLETED,
+        ),
+    ]
+    results = repo.apply_batch(db_session, operations=ops).results
+
+    assert [r.error is None for r in results] == [True, True, False, True]
+    assert results[1].task is not None and results[0].task is not None
+    assert results[1].task.prerequisite_tasks == [results[0].task.id]
+    assert results[3].task is not None
+    assert results[3].task.status == TaskStatus.COMPLETED
+
+    with pytest.raises(ValueError):
+        repo.apply_batch(
+            db_session,
+            operations=[
+                BatchTaskOperation(type=BatchTaskOperationType.DELETE, title="batch-b"),
+                BatchTaskOperation(type=BatchTaskOperationType.DELETE, title="missing"),
+            ],
+            atomic=True,
+        )
+    assert repo.get_task_by_title(db_session, title="batch-b") is not None
+
+
+@pytest.mark.usefixtures("db_session")
+def test_async_repo_round_trip() -> None:
+    async def _run() -> None:
+        url = get_settings().get_alembic_database_url()
+        engine = create_async_engine(url, poolclass=NullPool)
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                created = await async_repo.create_task(
+                    session,
+                    body=CreateTaskRequest(
+                        title="async-a",
+                        description="d",
+                        status=TaskStatus.TODO,
+                        priority=1,
+                        duration_seconds=60,
+                    ),
+                )
+                streamed = [t async for t in async_repo.iter_tasks(session)]
+                assert [t.id for t in streamed] == [created.id]
+                deleted = await async_repo.delete_task_by_title(
+                    session, title="async-a"
+                )
+                assert deleted is not None and deleted.id == created.id
+        finally:
+            await engine.dispose()
+
+    asyncio.run(_run())
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import datetime as dt
+import json
+import uuid
+
+from fastapi.testclient import TestClient
+
+from taskmaster.api.resources.tasks.types.ranked_task import RankedTask
+from taskmaster.api.resources.tasks.types.task import Task
+from taskmaster.api.resources.tasks.types.task_status import TaskStatus
+from taskmaster.responses import dumps
+
+
+def test_dumps_matches_pydantic_serialization() -> None:
+    fields = dict(
+        id=uuid.uuid4(),
+        title="t",
+        description="d",
+        status=TaskStatus.IN_PROGRESS,
+        priority=2,
+        duration_seconds=60,
+        prerequisite_tasks=[uuid.uuid4()],
+    )
+    tasks = [
+        Task.model_construct(
+            **fields, deadline=dt.datetime(2030, 1, 1, tzinfo=dt.timezone.utc)
+        ),
+        Task.model_construct(
+            **fields,
+            deadline=dt.datetime(2030, 1, 1, tzinfo=dt.timezone(dt.timedelta(hours=2))),
+            depth=1,
+        ),
+        Task.model_construct(**fields),
+    ]
+    for task in tasks:
+        expected = Task.model_validate(task.__dict__).model_dump_json()
+        assert dumps(task) == expected.encode()
+
+    ranked = RankedTask(task=tasks[0], score=1.5)
+    assert json.loads(dumps([ranked])) == [json.loads(ranked.model_dump_json())]
+
+
+def test_json_list_and_ndjson_stream_render_tasks_alike(client: TestClient) -> None:
+    # The list goes through pydantic, the stream through dumps
+    for title, deadline in (("render-a", "2030-01-01T00:00:00Z"), ("render-b", None)):
+        resp = client.post(
+            "/api/create-task",
+            json={
+                "title": title,
+                "description": "d",
+                "status": TaskStatus.TODO.value,
+                "priority": 1,
+                "duration_seconds": 60,
+                "deadline": deadline,
+            },
+        )
+        assert resp.status_code == 200, resp.text
+
+    listed = client.get("/api/get-tasks")
+    streamed = client.get("/api/get-tasks", headers={"Accept": "application/x-ndjson"})
+
+    assert listed.status_code == streamed.status_code == 200
+    assert listed.content == b"[" + b",".join(streamed.content.splitlines()) + b"]"
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import datetime as dt
+import uuid
+
+import numpy as np
+import pytest
+from sqlalchemy.orm import Session
+
+from taskmaster.api.resources.tasks.types.create_task_request import CreateTaskRequest
+from taskmaster.api.resources.tasks.types.task_status import TaskStatus
+from taskmaster.services.task_management import repo, scoring
+
+NOW = dt.datetime(2030, 1, 1, tzinfo=dt.timezone.utc)
+
+
+def _columns(**overrides: object) -> scoring.TaskColumns:
+    n = 4
+    values: dict = dict(
+        ids=[uuid.uuid4() for _ in range(n)],
+        priority=np.full(n, 1.0),
+        deadline=np.full(n, np.nan),
+        duration_seconds=np.full(n, 3600.0),
+        status=np.full(n, "TODO"),
+        dependents=np.zeros(n, dtype=np.int64),
+    )
+    values.update(overrides)
+    return scoring.TaskColumns(**values)
+
+
+def test_score_tasks_terms() -> None:
+    soon = NOW.timestamp() + 2 * 3600
+    columns = _columns(
+        # 0: baseline, 1: due soon, 2: blocks others, 3: completed
+        deadline=np.array([np.nan, soon, np.nan, soon]),
+        dependents=np.array([0, 0, 5, 0]),
+        status=np.array(["TODO", "IN_PROGRESS", "TODO", "COMPLETED"]),
+    )
+    scores = scoring.score_tasks(columns, now=NOW)
+
+    assert scores[1] > scores[0] and scores[2] > scores[0]
+    assert scores[3] == -np.inf
+    assert list(scoring.rank_order(scores)) == [1, 2, 0]
+    assert list(scoring.rank_order(scores, limit=1)) == [1]
+
+
+def test_score_tasks_is_vectorized_over_large_sets() -> None:
+    n = 100_000
+    rng = np.random.default_rng(0)
+    columns = _columns(
+        ids=[uuid.UUID(int=i) for i in range(n)],
+        priority=rng.integers(0, 10, n).astype(np.float64),
+        deadline=np.where(
+            rng.random(n) < 0.5, NOW.timestamp() + rng.random(n) * 1e6, np.nan
+        ),
+        duration_seconds=rng.integers(60, 36000, n).astype(np.float64),
+        status=rng.choice(["TODO", "IN_PROGRESS", "COMPLETED"], n),
+        dependents=rng.integers(0, 20, n),
+    )
+    scores = scoring.score_tasks(columns, now=NOW)
+    top = scoring.rank_order(scores, limit=10)
+    assert len(top) == 10
+    assert np.all(np.diff(scores[top]) <= 0)
+    assert scores[top[-1]] >= np.max(np.delete(scores, top))
+
+
+@pytest.mark.usefixtures("db_session")
+def test_rank_tasks(db_session: Session) -> None:
+    blocker = repo.create_task(
+        db_session,
+        body=CreateTaskRequest(
+            title="rank-blocker",
+            description="d",
+            status=TaskStatus.TODO,
+            priority=3,
+            duration_seconds=600,
+        ),
+    )
+    for title, status, deadline in [
+        ("rank-due", TaskStatus.TODO, NOW + dt.timedelta(hours=1)),
+        ("rank-later", TaskStatus.TODO, None),
+        ("rank-done", TaskStatus.COMPLETED, NOW),
+    ]:
+        repo.create_task(
+            db_session,
+            body=CreateTaskRequest(
+                title=title,
+                description="d",
+                status=status,
+                priority=3,
+                duration_seconds=600,
+                deadline=deadline,
+                prerequisite_tasks=[blocker.id] if title == "rank-later" else None,
+            ),
+        )
+
+    ranked = scoring.rank_tasks(db_session, now=NOW)
+    assert [r.task.title for r in ranked] == ["rank-due", "rank-blocker", "rank-later"]
+    assert ranked[0].score > ranked[1].score > ranked[2].score
+    top = scoring.rank_tasks(db_session, now=NOW, limit=1)
+    assert [r.task.title for r in top] == ["rank-due"]
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import pytest
+
+from taskmaster.services.task_management.similarity import similarity, trigrams
+
+
+def test_trigrams_match_pg_trgm() -> None:
+    # show_trgm('Cat!') in Postgres
+    assert trigrams("Cat!") == {"  c", " ca", "cat", "at "}
+    assert trigrams("--") == frozenset()
+
+
+def test_similarity_matches_pg_trgm() -> None:
+    # similarity('word', 'two words') from the pg_trgm documentation
+    assert similarity(trigrams("word"), trigrams("two words")) == pytest.approx(
+        0.363636, abs=1e-6
+    )
+    assert similarity(trigrams("ship q3 report"), trigrams("ship q3 report")) == 1.0
+    assert similarity(trigrams(""), trigrams("anything")) == 0.0
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Iterator, List
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from taskmaster import tracing
+from taskmaster.api.resources.tasks.types.generate_tasks_request import (
+    GenerateTasksRequest,
+)
+from taskmaster.api.resources.tasks.types.task_status import TaskStatus
+from taskmaster.config import get_settings
+from taskmaster.services.task_management.generation import agent
+
+
+@pytest.fixture()
+def exporter() -> Iterator[tracing.InMemorySpanExporter]:
+    memory = tracing.InMemorySpanExporter()
+    tracing.set_tracer(tracing.Tracer([memory]))
+    yield memory
+    tracing.set_tracer(None)
+
+
+def test_spans_nest_and_record_errors(
+    exporter: tracing.InMemorySpanExporter,
+) -> None:
+    with tracing.span("outer", stage="a") as outer:
+        assert tracing.current_traceparent() == outer.traceparent
+        with tracing.span("inner") as inner:
+            pass
+        with pytest.raises(RuntimeError):
+            with tracing.span("failing"):
+                raise RuntimeError("boom")
+    assert tracing.current_span() is None
+
+    spans = {s.name: s for s in exporter.spans(outer.trace_id)}
+    assert set(spans) == {"outer", "inner", "failing"}
+    assert spans["outer"].parent_id is None
+    assert spans["outer"].attributes == {"stage": "a"}
+    assert inner.parent_id == outer.span_id
+    assert spans["failing"].parent_id == outer.span_id
+    assert spans["failing"].error == "RuntimeError: boom"
+    assert all(s.duration_ms is not None for s in spans.values())
+
+
+def test_parse_traceparent() -> None:
+    trace_id, span_id = "4bf92f3577b34da6a3ce929d0e0e4736", "00f067aa0ba902b7"
+    assert tracing.parse_traceparent(f"00-{trace_id}-{span_id}-01") == (
+        trace_id,
+        span_id,
+    )
+    assert tracing.parse_traceparent(f"00-{'0' * 32}-{span_id}-01") is None
+    assert tracing.parse_traceparent("garbage") is None
+    assert tracing.parse_traceparent(None) is None
+
+
+def test_jsonl_exporter_writes_one_span_per_line(tmp_path: Path) -> None:
+    path = tmp_path / "traces.jsonl"
+    tracer = tracing.Tracer([tracing.JsonLinesSpanExporter(path)])
+    with tracer.start_span("outer"):
+        with tracer.start_span("inner", attributes={"n": 1}):
+            pass
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["name"] for line in lines] == ["inner", "outer"]
+    assert lines[0]["parent_id"] == lines[1]["span_id"]
+    assert lines[0]["attributes"] == {"n": 1}
+
+
+def test_request_continues_incoming_trace(
+    app: FastAPI, exporter: tracing.InMemorySpanExporter
+) -> None:
+    app.add_middleware(tracing.TracingMiddleware)
+    trace_id, parent_id = "4bf92f3577b34da6a3ce929d0e0e4736", "00f067aa0ba902b7"
+    with TestClient(app) as client:
+        resp = client.post(
+            "/api/create-task",
+            json={
+                "title": "traced-task",
+                "description": "d",
+                "status": TaskStatus.TODO.value,
+                "priority": 1,
+                "duration_seconds": 60,
+            },
+            headers={"traceparent": f"00-{trace_id}-{parent_id}-01"},
+        )
+    assert resp.status_code == 200, resp.text
+    assert resp.headers[tracing.TRACE_ID_HEADER] == trace_id
+
+    spans = {s.name: s for s in exporter.spans(trace_id)}
+    server = spans["POST /api/create-task"]
+    assert server.parent_id == parent_id
+    assert server.attributes["http.status_code"] == 200
+    assert spans["repo.create_task"].parent_id == server.span_id
+
+
+def test_agent_run_is_traced_and_passes_the_trace_to_mcp(
+    exporter: tracing.InMemorySpanExporter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: List[Dict[str, Any]] = []
+
+    class FakeOpenAI:
+        def __init__(self, **kwargs: Any) -> None:
+            self.responses = self
+
+        def create(self, **kwargs: Any) -> SimpleNamespace:
+            calls.append(kwargs)
+            return SimpleNamespace(output=[])
+
+    prompts = {"system": "s", "developer": "d", "allowed_tools_json": "[]"}
+    monkeypatch.setattr(agent, "OpenAI", FakeOpenAI)
+    monkeypatch.setattr(agent, "_load_prompts", lambda: prompts)
+    monkeypatch.setattr(
+        agent, "PROMPT_LOADER", SimpleNamespace(render=lambda name, variables: "u")
+    )
+    settings = get_settings().model_copy(update={"workspace_root": "/repo"})
+    monkeypatch.setattr(agent, "get_settings", lambda: settings)
+
+    with tracing.span("generation") as outer:
+        resp = agent.generate_tasks_with_agent(GenerateTasksRequest(transcript="x"))
+
+    assert resp.tasks == []
+    spans = {s.name: s for s in exporter.spans(outer.trace_id)}
+    assert spans["agent.render_prompts"].parent_id == outer.span_id
+    assert spans["openai.responses.create"].parent_id == outer.span_id
+    mcp_env = calls[0]["tools"][0]["server"]["env"]
+    assert mcp_env["TASKMASTER_TRACEPARENT"] == outer.traceparent
@@ -161,6 +161,8 @@ const __dirname = path.dirname(__filename);
 
 const BASE_URL = process.env.TASKMASTER_BASE_URL || 'http://127.0.0.1:8000';
 const AUTH_HEADER = process.env.TASKMASTER_API_KEY ? { 'Authorization': \`Bearer \${process.env.TASKMASTER_API_KEY}\` } : {};
+// Set by the backend agent so our API calls join the generation's trace
+const TRACE_HEADER = process.env.TASKMASTER_TRACEPARENT ? { 'traceparent': process.env.TASKMASTER_TRACEPARENT } : {};
 
 const toolsSpec = JSON.parse(fs.readFileSync(path.join(__dirname, 'tools.json'), 'utf-8')).tools;
 
@@ -204,7 +206,7 @@ async function fetchWithRetry(url, init, { attempts = 2, timeoutMs = 15000 } = {
 
 async function callToolHttp(t, args) {
   const method = t.method;
-  const headers = { 'Content-Type': 'application/json', ...AUTH_HEADER };
+  const headers = { 'Content-Type': 'application/json', ...AUTH_HEADER, ...TRACE_HEADER };
   let url;
   const init = { method, headers };
   if (method === 'GET') {
@@ -284,6 +286,7 @@ This MCP server exposes Taskmaster API endpoints as MCP tools. It is generated f
 Env vars:
 - TASKMASTER_BASE_URL: Base URL to your Taskmaster HTTP API (default: http://127.0.0.1:8000)
 - TASKMASTER_API_KEY: Optional bearer token header
+- TASKMASTER_TRACEPARENT: Optional W3C \`traceparent\` sent with every API call (set by the backend agent so tool calls join its trace)
 
 Usage:
 1) npm install
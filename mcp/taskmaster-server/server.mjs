@@ -13,6 +13,8 @@ const __dirname = path.dirname(__filename);
 
 const BASE_URL = process.env.TASKMASTER_BASE_URL || 'http://127.0.0.1:8000';
 const AUTH_HEADER = process.env.TASKMASTER_API_KEY ? { 'Authorization': `Bearer ${process.env.TASKMASTER_API_KEY}` } : {};
+// Set by the backend agent so our API calls join the generation's trace
+const TRACE_HEADER = process.env.TASKMASTER_TRACEPARENT ? { 'traceparent': process.env.TASKMASTER_TRACEPARENT } : {};
 
 const toolsSpec = JSON.parse(fs.readFileSync(path.join(__dirname, 'tools.json'), 'utf-8')).tools;
 
@@ -56,7 +58,7 @@ async function fetchWithRetry(url, init, { attempts = 2, timeoutMs = 15000 } = {
 
 async function callToolHttp(t, args) {
   const method = t.method;
-  const headers = { 'Content-Type': 'application/json', ...AUTH_HEADER };
+  const headers = { 'Content-Type': 'application/json', ...AUTH_HEADER, ...TRACE_HEADER };
   let url;
   const init = { method, headers };
   if (method === 'GET') {
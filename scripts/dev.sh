@@ -45,6 +45,11 @@ cleanup() {
 		kill "$BACKEND_PID" || true
 		wait "$BACKEND_PID" 2>/dev/null || true
 	fi
+	if [[ -n "${WORKER_PID:-}" ]] && kill -0 "$WORKER_PID" >/dev/null 2>&1; then
+		echo "[dev] Stopping job worker ($WORKER_PID)"
+		kill "$WORKER_PID" || true
+		wait "$WORKER_PID" 2>/dev/null || true
+	fi
 	if [[ -n "${MCP_PID:-}" ]] && kill -0 "$MCP_PID" >/dev/null 2>&1; then
 		echo "[dev] Stopping MCP server ($MCP_PID)"
 		kill "$MCP_PID" || true
@@ -105,6 +110,10 @@ else
 	uv run uvicorn server:app --host 127.0.0.1 --port 8000 --reload --log-level debug &
 fi
 BACKEND_PID=$!
+# Runs jobs queued through /api/submit-* (generation, transcription)
+echo "[dev] Starting job worker"
+uv run python -m taskmaster.services.jobs.worker &
+WORKER_PID=$!
 popd >/dev/null
 
 # Small wait for backend to boot